@@ -0,0 +1,172 @@
+"""
+Economy-wide numbers for the Fishing cog, for owners.
+
+``aggregate`` makes one pass over a ``config.all_users()`` snapshot and
+totals what is in circulation: fish held (by species, rarity and biome,
+with their sale value), items held, every stat counter (coins minted by
+``fishsell`` is ``sell_total``; ``*_found`` / ``*_events`` show which
+events are running hot) and how held wealth is spread across players.
+The result exports as JSON or CSV.
+
+NumPy is optional and only used for the wealth quantiles.
+"""
+import csv
+import io
+import json
+import time
+from collections import Counter
+from typing import Any, Dict, List, Mapping, Tuple
+
+from .registry import FishDef
+from .state import counted
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+class EconomySnapshot:
+    __slots__ = (
+        "taken_at", "players", "active_players", "species", "rarity", "biome", "items", "stats", "wealth",
+    )
+
+    def __init__(self):
+        self.taken_at = time.time()
+        self.players = 0
+        # players with at least one cast
+        self.active_players = 0
+        # name -> [count held, sale value]
+        self.species: Dict[str, List[int]] = {}
+        self.rarity: Dict[str, List[int]] = {}
+        self.biome: Dict[str, List[int]] = {}
+        self.items: Counter = Counter()
+        # summed stats counters over every player
+        self.stats: Counter = Counter()
+        # quantile -> sale value of one player's held fish; plus "top1_share"
+        self.wealth: Dict[str, float] = {}
+
+    @property
+    def fish_held(self) -> int:
+        return sum(count for count, _ in self.species.values())
+
+    @property
+    def fish_value(self) -> int:
+        return sum(value for _, value in self.species.values())
+
+    def as_dict(self) -> Dict[str, Any]:
+        def table(rows: Dict[str, List[int]]):
+            return {k: {"count": c, "value": v} for k, (c, v) in sorted(rows.items(), key=lambda kv: -kv[1][1])}
+
+        return {
+            "taken_at": int(self.taken_at),
+            "players": self.players,
+            "active_players": self.active_players,
+            "fish_held": self.fish_held,
+            "fish_value": self.fish_value,
+            "coins_from_sales": self.stats.get("sell_total", 0),
+            "wealth": self.wealth,
+            "rarity": table(self.rarity),
+            "biome": table(self.biome),
+            "species": table(self.species),
+            "items": dict(self.items.most_common()),
+            "stats": dict(sorted(self.stats.items())),
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.as_dict(), indent=2, ensure_ascii=False)
+
+    def to_csv(self) -> str:
+        """One row per number: section, key, count, value."""
+        out = io.StringIO()
+        writer = csv.writer(out)
+        writer.writerow(("section", "key", "count", "value"))
+        data = self.as_dict()
+        for key in ("players", "active_players", "fish_held", "fish_value", "coins_from_sales"):
+            writer.writerow(("total", key, data[key], ""))
+        for key, value in self.wealth.items():
+            writer.writerow(("wealth", key, "", value))
+        for section in ("rarity", "biome", "species"):
+            for key, row in data[section].items():
+                writer.writerow((section, key, row["count"], row["value"]))
+        for key, count in data["items"].items():
+            writer.writerow(("item", key, count, ""))
+        for key, count in data["stats"].items():
+            writer.writerow(("stat", key, count, ""))
+        return out.getvalue()
+
+    def summary(self, currency: str) -> List[Tuple[str, str]]:
+        """(title, text) pairs for an embed."""
+        casts = self.stats.get("casts", 0)
+        events = [(k, v) for k, v in self.stats.items() if k.endswith(("_found", "_events")) and v]
+        events.sort(key=lambda kv: -kv[1])
+        rarity = sorted(self.rarity.items(), key=lambda kv: -kv[1][0])
+        held = self.fish_held
+        return [
+            ("Players", f"{self.players} ({self.active_players} have cast)"),
+            ("Casts", f"{casts:,}"),
+            ("Coins from sales", f"{self.stats.get('sell_total', 0):,} {currency}"),
+            ("Fish held", f"{held:,} worth {self.fish_value:,} {currency}"),
+            ("Held value per player", ", ".join(
+                f"p{int(q * 100)} {self.wealth.get(f'p{int(q * 100)}', 0):,.0f}" for q in QUANTILES
+            ) + f"; top 1% hold {self.wealth.get('top1_share', 0):.0%}"),
+            ("By rarity", "\n".join(
+                f"{r}: {c:,} ({c / held:.1%})" for r, (c, _) in rarity if c
+            ) or "None"),
+            ("Events per 1k casts", "\n".join(
+                f"{k.replace('_', ' ')}: {v * 1000 / casts:.1f}" for k, v in events[:8]
+            ) if casts else "None"),
+        ]
+
+
+def aggregate(users: Mapping[int, Mapping[str, Any]], fish: Mapping[str, FishDef]) -> EconomySnapshot:
+    """Total every user document; fish missing from ``fish`` count with no value or rarity."""
+    snap = EconomySnapshot()
+    held: List[int] = []
+    for doc in users.values():
+        snap.players += 1
+        stats = doc.get("stats") or {}
+        if stats.get("casts"):
+            snap.active_players += 1
+        for key, value in stats.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                snap.stats[key] += value
+        snap.items.update({k: v for k, v in counted(doc.get("items")).items() if v > 0})
+
+        worth = 0
+        for name, count in counted(doc.get("caught")).items():
+            if count <= 0:
+                continue
+            info = fish.get(name)
+            value = count * info.price if info is not None else 0
+            worth += value
+            for table, key in ((snap.species, name),
+                               (snap.rarity, info.rarity if info else "Unknown"),
+                               (snap.biome, info.biome if info else "Unknown")):
+                row = table.setdefault(key, [0, 0])
+                row[0] += count
+                row[1] += value
+        held.append(worth)
+
+    snap.wealth = _wealth(held)
+    return snap
+
+
+def _wealth(held: List[int]) -> Dict[str, float]:
+    if not held:
+        return {}
+    if np is not None:
+        values = np.sort(np.asarray(held, dtype=float))
+        quantiles = np.quantile(values, QUANTILES)
+        total = float(values.sum())
+        top = float(values[-max(1, len(values) // 100):].sum())
+    else:
+        values = sorted(held)
+        quantiles = [values[min(len(values) - 1, int(q * len(values)))] for q in QUANTILES]
+        total = float(sum(values))
+        top = float(sum(values[-max(1, len(values) // 100):]))
+    out = {f"p{int(q * 100)}": round(float(v), 2) for q, v in zip(QUANTILES, quantiles)}
+    out["top1_share"] = round(top / total, 4) if total else 0.0
+    return out
@@ -0,0 +1,321 @@
+"""
+Balance engine for the Fishing cog.
+
+Expected value per cast, the spread of a single cast's payout, the catch
+mix by rarity and casts-to-achievement, all computed from the live cog's
+own event and fish weight tables (``Fishing._event_table`` and
+``_vessel_fish_tables``). The figures are for an angler with no gear
+equipped and no buffs active: rod level and bait are covered, but the
+rarity bias that gear and fish buffs put on a cast's fish table
+(``_biased_fish_tables``) is not.
+
+Event handlers are arbitrary code, so each one is profiled once by running
+it ``samples`` times on throwaway state against a shadow cog with an
+in-memory bank. A profile splits a handler's payout into the part that
+doesn't depend on where you fish (coins, fixed fish) and the number of fish
+it draws from the angler's vessel table; the vessel part is then valued
+exactly for each vessel.
+
+``report`` is CPU-bound and meant for an executor, so it never touches
+the cog's caches: ``plan`` (on the event loop) resolves the modifier keys
+it covers and copies their event tables into the engine first.
+
+NumPy is optional. With it, payout spreads and the species collector are
+sampled in batches of a million; without it the same estimates use
+smaller pure-Python samples.
+"""
+import asyncio
+import copy
+import random
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+from .fishing import Fishing, WeightedTable
+from .simulate import FakeBank, MemoryConfig, SimContext, SimUser
+from .state import UserState
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+# (rod level, bait, modifier key) rows of a report, and the bare rod 0 key
+Plan = Tuple[List[Tuple[int, bool, Tuple[str, ...]]], Tuple[str, ...]]
+
+# stats that aren't running totals, so "threshold / rate" means nothing for them
+_NON_CUMULATIVE = {"unique_fish", "biomes_caught", "consecutive_catches", "highest_value_catch", "rod_level"}
+
+
+class EventProfile:
+    """Sampled outcomes of one event handler."""
+
+    __slots__ = ("base", "draws", "stats")
+
+    def __init__(self):
+        # coins + value of fish that don't come from the vessel table, per run
+        self.base: List[float] = []
+        # fish drawn from the angler's vessel table, per run
+        self.draws: List[int] = []
+        # summed stat deltas over all runs
+        self.stats: Dict[str, float] = defaultdict(float)
+
+    @property
+    def mean_base(self) -> float:
+        return sum(self.base) / len(self.base) if self.base else 0.0
+
+    @property
+    def mean_draws(self) -> float:
+        return sum(self.draws) / len(self.draws) if self.draws else 0.0
+
+    def stat_rate(self, key: str) -> float:
+        return self.stats.get(key, 0.0) / len(self.base) if self.base else 0.0
+
+
+class BalanceEngine:
+    def __init__(self, cog: Fishing, samples: int = 200, seed: int = 0):
+        self.cog = cog
+        self.samples = samples
+        self.seed = seed
+        self.profiles: Dict[str, EventProfile] = {}
+        # modifier key -> event table, copied from the cog by plan()
+        self._tables: Dict[Tuple[str, ...], WeightedTable] = {}
+        self.prices = {name: info["price"] for name, info in cog.fish_definitions.items()}
+
+    # ---------- profiling ----------
+    async def prepare(self):
+        """Profile every event handler once. Yields to the loop while it works."""
+        if self.profiles:
+            return
+        shadow = Fishing(bot=None, config=MemoryConfig())
+        shadow._bank = bank = FakeBank()
+        drawn: List[str] = []
+        draw = shadow._random_fish_for_user
+
+        def counting_draw(state):
+            name = draw(state)
+            drawn.append(name)
+            return name
+
+        shadow._random_fish_for_user = counting_draw
+
+        # a modest starter haul, so events that take fish have something to take
+        baseline = copy.deepcopy(shadow.config.defaults)
+        commons = [n for n, i in shadow.fish_definitions.items() if i["rarity"] == "Common"]
+        baseline["caught"] = {name: 2 for name in commons[:5]}
+        user = SimUser(0)
+        ctx = SimContext(user)
+
+        profiles: Dict[str, EventProfile] = {}
+        for key in self.cog._event_keys:
+            handler = shadow.event_handlers[key][0]
+            profile = EventProfile()
+            for i in range(self.samples):
+                state = UserState(user, None, copy.deepcopy(baseline))
+                drawn.clear()
+                bank.balances.clear()
+                before = self._haul_value(state.caught)
+                stats_before = dict(state.stats)
+                await handler(ctx, state)
+                fixed = self._haul_value(state.caught) - before - sum(self.prices.get(n, 0) for n in drawn)
+                profile.base.append(bank.balances.get(user.id, 0) + fixed)
+                profile.draws.append(len(drawn))
+                for stat, value in state.stats.items():
+                    delta = value - stats_before.get(stat, 0)
+                    if delta:
+                        profile.stats[stat] += delta
+                if i % 50 == 49:
+                    await asyncio.sleep(0)
+            profiles[key] = profile
+        self.profiles = profiles
+
+    def _haul_value(self, caught: Dict[str, int]) -> int:
+        return sum(self.prices.get(name, 0) * count for name, count in caught.items())
+
+    # ---------- analytic ----------
+    def active_modifiers(self, rod_level: int = 0, bait: bool = False, luck: bool = False,
+                         equipment: Optional[Dict[str, str]] = None) -> Tuple[str, ...]:
+        """The live modifier key for a profile, built the same way a cast builds it."""
+        state = UserState(None, None, {
+            "rod_level": rod_level, "bait": int(bait), "equipment": equipment or {},
+            "buffs": {"luck": {"casts": 1}} if luck else {},
+        })
+        return self.cog._active_event_modifiers(state)
+
+    def event_table(self, active: Tuple[str, ...]) -> WeightedTable:
+        table = self._tables.get(active)
+        if table is None:
+            # builds and caches in the cog, so only on the event loop
+            table = self._tables[active] = self.cog._event_table(active)
+        return table
+
+    def plan(self, rod_levels: Optional[List[int]] = None) -> Plan:
+        """
+        The (rod level, bait, modifier key) rows ``report`` covers and the
+        bare rod 0 key its achievement section uses, with every event table
+        they need fetched. Call on the event loop.
+        """
+        if rod_levels is None:
+            rod_levels = sorted(self.cog.rod_level_fish_multiplier)
+        rows = [
+            (level, bait, self.active_modifiers(level, bait=bait))
+            for level in rod_levels for bait in (False, True)
+        ]
+        base = self.active_modifiers(0)
+        for active in [row[2] for row in rows] + [base]:
+            self.event_table(active)
+        return rows, base
+
+    def vessel_table(self, vessel: Optional[str]) -> WeightedTable:
+        """The unbiased fish table, as cast with no gear and no buffs."""
+        tables = self.cog._vessel_fish_tables
+        return tables.get(vessel) or tables[None]
+
+    def vessel_fish_value(self, vessel: Optional[str]) -> float:
+        """Expected sale value of one fish drawn from a vessel's table."""
+        return sum(p * self.prices.get(name, 0) for name, p in self.vessel_table(vessel).probabilities().items())
+
+    def expected_value(self, active: Tuple[str, ...], vessel: Optional[str]) -> float:
+        per_fish = self.vessel_fish_value(vessel)
+        return sum(
+            p * (self.profiles[key].mean_base + self.profiles[key].mean_draws * per_fish)
+            for key, p in self.event_table(active).probabilities().items()
+        )
+
+    def stat_rates(self, active: Tuple[str, ...]) -> Dict[str, float]:
+        """Expected increase of every stat per cast."""
+        rates: Dict[str, float] = defaultdict(float)
+        rates["casts"] = 1.0
+        for key, p in self.event_table(active).probabilities().items():
+            profile = self.profiles[key]
+            for stat in profile.stats:
+                rates[stat] += p * profile.stat_rate(stat)
+        return dict(rates)
+
+    def draws_per_cast(self, active: Tuple[str, ...]) -> float:
+        return sum(p * self.profiles[k].mean_draws for k, p in self.event_table(active).probabilities().items())
+
+    def rarity_mix(self, vessel: Optional[str]) -> Dict[str, float]:
+        mix: Dict[str, float] = defaultdict(float)
+        for name, p in self.vessel_table(vessel).probabilities().items():
+            mix[self.cog.fish_definitions[name]["rarity"]] += p
+        return dict(mix)
+
+    def casts_to_achievements(self, active: Tuple[str, ...], vessel: Optional[str]) -> List[Tuple[str, float]]:
+        """Expected casts to each count-based achievement; species goals are sampled."""
+        rates = self.stat_rates(active)
+        draws = self.draws_per_cast(active)
+        out = []
+        for ach_id, (metric, threshold) in self.cog.achievement_rules.items():
+            if metric == "unique_fish":
+                catches = self.catches_to_species(vessel, threshold)
+                casts = catches / draws if catches is not None and draws else float("inf")
+            elif metric in _NON_CUMULATIVE or metric.startswith("item:"):
+                continue
+            elif metric in rates and rates[metric] > 0:
+                casts = threshold / rates[metric]
+            else:
+                continue
+            out.append((ach_id, casts))
+        return sorted(out, key=lambda kv: kv[1])
+
+    # ---------- sampled ----------
+    def catches_to_species(self, vessel: Optional[str], distinct: int, trials: int = 20) -> Optional[float]:
+        """Mean number of vessel catches until ``distinct`` different species have been seen."""
+        table = self.vessel_table(vessel)
+        if distinct > len(table):
+            return None
+        if np is not None:
+            rng = np.random.default_rng(self.seed)
+            cumulative = np.asarray(table.cumulative, dtype=float)
+            results = []
+            for _ in range(trials):
+                picks = np.searchsorted(cumulative, rng.random(200_000) * table.total, side="right")
+                _, first = np.unique(picks, return_index=True)
+                if len(first) < distinct:
+                    return None
+                results.append(np.sort(first)[distinct - 1] + 1)
+            return float(np.mean(results))
+        rng = random.Random(self.seed)
+        results = []
+        for _ in range(max(1, trials // 4)):
+            seen, catches = set(), 0
+            while len(seen) < distinct and catches < 200_000:
+                seen.add(table.pick(rng))
+                catches += 1
+            if len(seen) < distinct:
+                return None
+            results.append(catches)
+        return sum(results) / len(results)
+
+    def payout_quantiles(self, active: Tuple[str, ...], vessel: Optional[str],
+                         casts: int = 1_000_000, quantiles=(0.5, 0.9, 0.99)) -> Dict[float, float]:
+        """Quantiles of a single cast's payout, by resampling profiled outcomes."""
+        events = self.event_table(active)
+        fish = self.vessel_table(vessel)
+        keys = events.keys
+        if np is None:
+            return self._payout_quantiles_py(events, fish, min(casts, 20_000), quantiles)
+
+        rng = np.random.default_rng(self.seed)
+        base = np.array([self.profiles[k].base for k in keys], dtype=float)
+        draws = np.array([self.profiles[k].draws for k in keys], dtype=np.int64)
+        fish_prices = np.array([self.prices.get(n, 0) for n in fish.keys], dtype=float)
+
+        idx = np.searchsorted(np.asarray(events.cumulative, dtype=float), rng.random(casts) * events.total, side="right")
+        col = rng.integers(0, base.shape[1], casts)
+        payout = base[idx, col]
+        n_draws = draws[idx, col]
+        most = int(n_draws.max()) if casts else 0
+        if most:
+            picks = np.searchsorted(np.asarray(fish.cumulative, dtype=float), rng.random((casts, most)) * fish.total, side="right")
+            mask = np.arange(most) < n_draws[:, None]
+            payout = payout + (fish_prices[picks] * mask).sum(axis=1)
+        return {q: float(v) for q, v in zip(quantiles, np.quantile(payout, quantiles))}
+
+    def _payout_quantiles_py(self, events: WeightedTable, fish: WeightedTable, casts: int, quantiles) -> Dict[float, float]:
+        rng = random.Random(self.seed)
+        payouts = []
+        for _ in range(casts):
+            profile = self.profiles[events.pick(rng)]
+            j = rng.randrange(len(profile.base))
+            payouts.append(profile.base[j] + sum(self.prices.get(fish.pick(rng), 0) for _ in range(profile.draws[j])))
+        payouts.sort()
+        return {q: payouts[min(len(payouts) - 1, int(q * len(payouts)))] for q in quantiles}
+
+    # ---------- report ----------
+    def report(self, vessel: Optional[str] = None, plan: Optional[Plan] = None) -> List[str]:
+        """
+        Plain-text tables, one string per section. Pass a ``plan()`` made on
+        the event loop when running this in an executor.
+        """
+        rows, base = plan if plan is not None else self.plan()
+        where = vessel or "On foot"
+        lines = [
+            f"Balance: {where}  (each event profiled {self.samples}x, "
+            f"{'numpy' if np is not None else 'pure-Python'} sampling)",
+            "No gear equipped, no buffs active.",
+            f"{'rod':>3} {'bait':>4} {'EV/cast':>8} {'fish/cast':>9} {'p50':>6} {'p90':>6} {'p99':>6}",
+        ]
+        for level, bait, active in rows:
+            q = self.payout_quantiles(active, vessel)
+            rate = self.stat_rates(active).get("fish_caught", 0.0)
+            lines.append(
+                f"{level:>3} {'yes' if bait else 'no':>4} {self.expected_value(active, vessel):>8.1f} "
+                f"{rate:>9.2f} {q[0.5]:>6.0f} {q[0.9]:>6.0f} {q[0.99]:>6.0f}"
+            )
+
+        mix = self.rarity_mix(vessel)
+        mix_line = "Catch mix: " + ", ".join(f"{r} {p:.1%}" for r, p in sorted(mix.items(), key=lambda kv: -kv[1]))
+
+        active = base
+        goals = [f"Casts to achievement (rod 0, no bait, {where}):"]
+        unreachable = False
+        for ach_id, casts in self.casts_to_achievements(active, vessel):
+            if casts == float("inf"):
+                unreachable, shown = True, "n/a*"
+            else:
+                shown = f"{casts:,.0f}"
+            goals.append(f"  {ach_id:<22} {shown:>10}")
+        if unreachable:
+            goals.append("* needs more species than this vessel's waters hold")
+        return ["\n".join(lines), mix_line, "\n".join(goals)]
@@ -0,0 +1,172 @@
+"""
+Append-only log of every catch, kept out of the per-user Config document.
+
+Rows are (time, user, guild, species, event) in a SQLite file under the
+cog's data folder, with species and event names stored once in lookup
+tables and referenced by integer id. ``record`` only queues rows; they
+are written in one transaction a few seconds later (or as soon as enough
+have piled up), on a single worker thread so the event loop never waits
+on the disk. Queries flush first, so they always see every catch.
+
+Indexed on (guild, time) and (user, time): "catches in this server in
+the last 24h" and "this user's recent catches" read only the rows they
+return.
+"""
+import asyncio
+import logging
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+log = logging.getLogger("red.fishing.catchlog")
+
+# (unix time, guild id, event key, fish name), as queued by the cog
+CatchRow = Tuple[int, Optional[int], str, str]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS species (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS events (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE IF NOT EXISTS catches (
+    ts INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    guild_id INTEGER,
+    species INTEGER NOT NULL REFERENCES species (id),
+    event INTEGER NOT NULL REFERENCES events (id)
+);
+CREATE INDEX IF NOT EXISTS catches_guild_ts ON catches (guild_id, ts);
+CREATE INDEX IF NOT EXISTS catches_user_ts ON catches (user_id, ts);
+"""
+
+
+class CatchLog:
+    FLUSH_INTERVAL = 5.0
+    # flush straight away once this many rows are queued
+    MAX_PENDING = 500
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._pending: List[Tuple[int, int, Optional[int], str, str]] = []
+        self._flush_task: Optional[asyncio.Task] = None
+        # set once MAX_PENDING rows are queued, to cut the flush delay short
+        self._full = asyncio.Event()
+        # every database call runs on this one thread, in order
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="fishing-catchlog")
+        self._conn: Optional[sqlite3.Connection] = None
+        # lookup table -> {name: id}
+        self._ids: Dict[str, Dict[str, int]] = {"species": {}, "events": {}}
+
+    def __len__(self) -> int:
+        """Rows queued but not yet written."""
+        return len(self._pending)
+
+    # ---------- writing ----------
+    def record(self, user_id: int, rows: Iterable[CatchRow]):
+        """Queue catches made by ``user_id``."""
+        self._pending.extend((ts, user_id, guild_id, fish, event) for ts, guild_id, event, fish in rows)
+        if len(self._pending) >= self.MAX_PENDING:
+            self._full.set()
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self):
+        # keeps going while rows arrive, including during a write
+        while self._pending:
+            try:
+                await asyncio.wait_for(self._full.wait(), self.FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._full.clear()
+            try:
+                await self.flush()
+            except sqlite3.Error:
+                # the rows stay queued; the next catch schedules another try
+                log.exception("Could not write the catch log")
+                return
+
+    async def flush(self):
+        if not self._pending:
+            return
+        rows, self._pending = self._pending, []
+        try:
+            await self._call(self._write, rows)
+        except sqlite3.Error:
+            self._pending[:0] = rows
+            raise
+
+    async def close(self):
+        """Write what is queued and close the file; call from ``cog_unload``."""
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+        await self.flush()
+        await self._call(self._close)
+        self._executor.shutdown(wait=False)
+
+    # ---------- queries ----------
+    async def catches_since(self, since: float, guild_id: Optional[int] = None,
+                            user_id: Optional[int] = None) -> List[Tuple[int, str, int]]:
+        """(user id, fish name, count) for catches at or after ``since`` (unix time)."""
+        await self.flush()
+        return await self._call(self._catches_since, int(since), guild_id, user_id)
+
+    async def last_day(self, guild_id: Optional[int] = None, user_id: Optional[int] = None):
+        return await self.catches_since(time.time() - 86400, guild_id, user_id)
+
+    # ---------- worker thread ----------
+    async def _call(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            self._load_ids()
+        return self._conn
+
+    def _load_ids(self):
+        for table in self._ids:
+            self._ids[table] = {name: i for i, name in self._conn.execute(f"SELECT id, name FROM {table}")}
+
+    def _id(self, conn: sqlite3.Connection, table: str, name: str) -> int:
+        ids = self._ids[table]
+        found = ids.get(name)
+        if found is None:
+            found = ids[name] = conn.execute(f"INSERT INTO {table} (name) VALUES (?)", (name,)).lastrowid
+        return found
+
+    def _write(self, rows: List[Tuple[int, int, Optional[int], str, str]]):
+        conn = self._connect()
+        try:
+            with conn:
+                conn.executemany(
+                    "INSERT INTO catches (ts, user_id, guild_id, species, event) VALUES (?, ?, ?, ?, ?)",
+                    [(ts, user_id, guild_id, self._id(conn, "species", fish), self._id(conn, "events", event))
+                     for ts, user_id, guild_id, fish, event in rows],
+                )
+        except sqlite3.Error:
+            # ids handed out inside the failed transaction were rolled back
+            self._load_ids()
+            raise
+
+    def _catches_since(self, since: int, guild_id: Optional[int], user_id: Optional[int]):
+        where, args = ["c.ts >= ?"], [since]
+        if guild_id is not None:
+            where.append("c.guild_id = ?")
+            args.append(guild_id)
+        if user_id is not None:
+            where.append("c.user_id = ?")
+            args.append(user_id)
+        return self._connect().execute(
+            "SELECT c.user_id, s.name, COUNT(*) FROM catches c JOIN species s ON s.id = c.species "
+            f"WHERE {' AND '.join(where)} GROUP BY c.user_id, c.species",
+            args,
+        ).fetchall()
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
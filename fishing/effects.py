@@ -0,0 +1,123 @@
+"""
+Consumable effects for ``fishuseitem``.
+
+Every usable item has an effect record in ``data/effects.json``. Each field
+of a record is handled by one function in ``OPS``:
+
+    luck, bait    add to the user's luck / bait (luck is the "luck" buff)
+    coins         a fixed amount, or [low, high] rolled per use
+    items         {name: count} added to the user's items
+    reset_stats   stats set back to 0
+    buff          {"id", "casts" and/or "minutes"}: start or extend a buff
+    roll          weighted list of nested records; one is applied per use
+    message       text shown for a single use (str.format fields: coins,
+                  currency, balance, bait, luck)
+
+``use`` applies a record any number of times to a loaded ``UserState`` and
+totals what happened. Coins are only totalled; the caller deposits them
+once, so using fifty of something is one bank call and one commit.
+"""
+import random
+from typing import Any, Callable, Dict, List, Mapping, Optional, Set
+
+from .state import UserState
+
+
+class EffectResult:
+    """Totals over every use of an item in one command."""
+
+    __slots__ = ("uses", "luck", "bait", "coins", "items", "reset", "buffs", "message")
+
+    def __init__(self):
+        self.uses = 0
+        self.luck = 0
+        self.bait = 0
+        self.coins = 0
+        self.items: Dict[str, int] = {}
+        self.reset: Set[str] = set()
+        # buff id -> times granted
+        self.buffs: Dict[str, int] = {}
+        # message of the last record applied, for single-use replies
+        self.message: Optional[str] = None
+
+    def summary(self, currency: str, buff_names: Mapping[str, str] = {}) -> List[str]:
+        """One phrase per kind of change, for multi-use replies."""
+        parts = []
+        if self.luck:
+            parts.append(f"**{self.luck:+}** luck")
+        if self.bait:
+            parts.append(f"**{self.bait:+}** bait")
+        if self.coins:
+            parts.append(f"**{self.coins} {currency}**")
+        if self.items:
+            parts.append(", ".join(f"{n}× **{name}**" for name, n in self.items.items()))
+        if self.reset:
+            parts.append("reset " + ", ".join(sorted(self.reset)).replace("_", " "))
+        for buff_id, n in self.buffs.items():
+            parts.append(f"{n}× **{buff_names.get(buff_id, buff_id)}**")
+        return parts
+
+
+def _luck(state: UserState, value: int, result: EffectResult):
+    state.luck += value
+    result.luck += value
+
+
+def _bait(state: UserState, value: int, result: EffectResult):
+    state.bait += value
+    result.bait += value
+
+
+def _coins(state: UserState, value, result: EffectResult):
+    result.coins += random.randint(*value) if isinstance(value, (list, tuple)) else int(value)
+
+
+def _items(state: UserState, value: Mapping[str, int], result: EffectResult):
+    for name, count in value.items():
+        state.add_item(name, count)
+        result.items[name] = result.items.get(name, 0) + count
+
+
+def _reset_stats(state: UserState, value, result: EffectResult):
+    for key in value:
+        state.set_stat(key, 0)
+    result.reset.update(value)
+
+
+def _buff(state: UserState, value: Mapping[str, Any], result: EffectResult):
+    state.add_buff(value["id"], casts=value.get("casts"), seconds=value.get("minutes", 0) * 60)
+    result.buffs[value["id"]] = result.buffs.get(value["id"], 0) + 1
+
+
+def _roll(state: UserState, value, result: EffectResult):
+    entry = random.choices(value, weights=[e.get("weight", 1) for e in value], k=1)[0]
+    apply(entry, state, result)
+
+
+OPS: Dict[str, Callable[[UserState, Any, EffectResult], None]] = {
+    "luck": _luck,
+    "bait": _bait,
+    "coins": _coins,
+    "items": _items,
+    "reset_stats": _reset_stats,
+    "buff": _buff,
+    "roll": _roll,
+}
+
+
+def apply(effect: Mapping[str, Any], state: UserState, result: EffectResult):
+    """Apply one use of ``effect``. A rolled entry's message replaces the record's own."""
+    if effect.get("message"):
+        result.message = effect["message"]
+    for field, op in OPS.items():
+        value = effect.get(field)
+        if value:
+            op(state, value, result)
+
+
+def use(effect: Mapping[str, Any], state: UserState, times: int = 1) -> EffectResult:
+    result = EffectResult()
+    for _ in range(times):
+        apply(effect, state, result)
+        result.uses += 1
+    return result
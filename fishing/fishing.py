@@ -1,50 +1,97 @@
 import random
 import asyncio
+import io
+import re
+import time
 import discord
 import bisect
-from typing import Dict, Tuple, List, Optional, Any
+from typing import Dict, Tuple, List, Optional, Any, Callable
 from itertools import accumulate
-from functools import wraps
 
 from redbot.core import commands, bank, Config
+from redbot.core.data_manager import cog_data_path
+
+from .state import UserState, StateManager, transfer
+from .catchlog import CatchLog
+from .effects import use as use_effect
+from .leaderboard import Leaderboard, LEADERBOARD_METRICS
+from .menus import MenuService
+from .registry import DataError, FishingData, install_data, load_data, read_data
+from .reveals import RevealScheduler
+from .rods import RodProfile, profile_key
 
 QUEST_BANNER_URL = "https://files.catbox.moe/x5iczt.png"
 ROD_IMAGE_URL = "https://files.catbox.moe/0h4ja9.png"
 
 
+class WeightedTable:
+    """Keys with precomputed cumulative weights, sampled with bisect in O(log n)."""
 
-# ——— ACHIEVEMENT DECORATOR ———
-def award_achievements(func):
-    @wraps(func)
-    async def wrapper(self, ctx, *args, **kwargs):
-        # run the wrapped command
-        result = await func(self, ctx, *args, **kwargs)
+    __slots__ = ("keys", "cumulative", "total")
 
-        # then check & announce any new achievements
-        try:
-            msgs = await self._check_and_award(ctx, ctx.author)
-            if msgs:
-                await ctx.send("\n".join(msgs))
-        except Exception:
-            pass
+    def __init__(self, keys, weights):
+        self.keys = list(keys)
+        self.cumulative = list(accumulate(weights))
+        self.total = self.cumulative[-1] if self.cumulative else 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def pick(self, rng=random):
+        return self.keys[bisect.bisect_right(self.cumulative, rng.random() * self.total)]
+
+    def probabilities(self) -> Dict[Any, float]:
+        """Chance of ``pick`` returning each key."""
+        previous = 0
+        probs = {}
+        for key, cumulative in zip(self.keys, self.cumulative):
+            probs[key] = (cumulative - previous) / self.total
+            previous = cumulative
+        return probs
+
+
+class EmbedPages:
+    """
+    A fixed number of embed pages, each built on first access and kept.
+    Behaves like a read-only list for ``_paginate_embeds``.
+    """
 
-        return result
-    return wrapper
-# ——————————————————————————
+    __slots__ = ("_build", "_pages")
+
+    def __init__(self, count: int, build: Callable[[int], discord.Embed]):
+        self._build = build
+        self._pages: List[Optional[discord.Embed]] = [None] * count
+
+    def __len__(self):
+        return len(self._pages)
+
+    def __getitem__(self, index: int) -> discord.Embed:
+        page = self._pages[index]
+        if page is None:
+            page = self._pages[index] = self._build(index % len(self._pages))
+        return page
 
 
 class Fishing(commands.Cog):
     """Fishing minigame with fish, events, achievements, rod upgrades, crafting, NPC traders and questlines."""
 
-    def __init__(self, bot):
+    # seconds between casts; fishauto charges this once per cast it makes
+    CAST_COOLDOWN = 30
+    MAX_AUTO_CASTS = 10
+    # seconds a fishanalytics snapshot is reused before Config is read again
+    ANALYTICS_TTL = 300
+
+    def __init__(self, bot, config: Optional[Config] = None):
         self.bot = bot
-        # Config
-        self.config = Config.get_conf(self, identifier=1234567890123)
+        # Config (the simulator passes an in-memory stand-in)
+        self.config = config if config is not None else Config.get_conf(self, identifier=1234567890123)
+        # Red's bank module; the simulator and balance engine swap in a fake
+        self._bank = bank
         default_user = {
-            "caught": [],        # list of fish names and items (strings)
+            "caught": {},        # fish name -> count
             "rod_broken": False,
             "bait": 0,
-            "luck": 0,
+            "buffs": {},         # buff id -> {"casts": n, "until": epoch}, see UserState
             "achievements": [],  # achievement ids
             "stats": {           # tracked stats for achievements
                 "casts": 0,
@@ -66,8 +113,9 @@ class Fishing(commands.Cog):
                 "abyssal_catches":     0,
                 "mythic_catches":      0,
                 "legendary_catches":   0,                
+                "biomes_caught":       0,
             },
-            "items": [],         # non-fish items like "Rod Fragment", "Rod Core", "Treasure Map", "Chum"
+            "items": {},         # non-fish item name -> count, e.g. "Rod Fragment", "Rod Core", "Treasure Map", "Chum"
             "rod_level": 0,      # 0 = basic
             "quests": {},        # per-user quest state: {"active": quest_id or None, "step": int, "progress": {...}, "completed": [...]}
             "equipment": {
@@ -75,1464 +123,423 @@ class Fishing(commands.Cog):
                 "rod_line": None,
                 "rod_lure": None,
             },
+            "rod_profile": None, # RodProfile key for rod_level + equipment, see rods.py
             # ─── New: vessel unlocks ───
             "vessel": None,            # name of the boat the user owns            
+            # species/biomes ever caught, kept incrementally for achievements
+            "species_seen": [],
+            "biomes_seen": [],
+            "favourites": [],
+            # held fish per "rarity:<r>" / "biome:<b>", see UserState.tallies
+            "tallies": {},
+            "tally_version": None,
         }
         self.config.register_user(**default_user)
+        # sorted per-metric stats index, built on first use from all_users()
+        self.leaderboard = Leaderboard(self.config)
+        # per-user locked load/commit sessions; every command that writes goes through this
+        self._states = StateManager(self.config, on_load=self._prepare_state, on_commit=self._on_state_commit)
+        # button paginators for every paged embed this cog sends
+        self.menus = MenuService(bot)
+        # delayed edits that reveal each cast's result
+        self.reveals = RevealScheduler()
+        # user id -> monotonic time a fishauto trip's cooldown runs out
+        self._auto_lockout: Dict[int, float] = {}
+        # history of every catch, outside Config; opened in cog_load, so the
+        # simulator's and balance engine's cogs don't keep one
+        self.catch_log: Optional[CatchLog] = None
              
-        
-        # ─── Flavor texts for casting ───
-        self.cast_flavor = [
-            "🎣 You cast your line and wait patiently…",
-            "🌊 You send your hook into the rolling waves…",
-            "🌅 You fling the bait out as the sun dips low…",
-            "🌙 Moonlight shimmers on the water’s surface as you cast…",
-            "☀️ The midday glare bounces off your lure…",
-            "🌧 A soft drizzle falls as you set your line…",
-            "❄️ A cold breeze ripples the surface while you wait…",
-            "🌀 You twirl your rod and let the line drift away…",
-            "🌾 You kneel at the water’s edge and launch your hook…",
-            "💨 A sudden gust carries your lure over calm depths…",
-            "🎼 You whistle a tune as the bobber drifts away…",
-            "🔥 The scent of fish fills the air as you cast…",
-            "🌈 A faint rainbow arches overhead as your line plops in…",
-            "🪨 You settle a pebble to anchor your line in rocky shallows…",
-            "🧜 A distant echo of a siren’s song accompanies your cast…",
-            "📜 Old tales of the river swirl in your mind as you wait…",
-            "🎉 You hum in excitement as your bait settles below…",
-            "🕯 Twilight’s glow guides your hook into the depths…",
-        ]        
-
-        # ---------- Fish definitions ----------
-        self.fish_definitions = {
-            "Tiny Minnow": {"weight": 200, "price": 2, "emoji": "><>", "rarity": "Common", "biome": "Pond"},
-            "Mosquito Fish": {"weight": 180, "price": 3, "emoji": "🐟", "rarity": "Common", "biome": "Marsh"},
-            "Bluegill": {"weight": 160, "price": 5, "emoji": "🐠", "rarity": "Common", "biome": "Pond"},
-            "Sardine": {"weight": 150, "price": 4, "emoji": "🐟", "rarity": "Common", "biome": "Coastal"},
-            "Silverside": {"weight": 150, "price": 6, "emoji": "🐟", "rarity": "Common", "biome": "Coastal"},
-            "Shiner": {"weight": 140, "price": 6, "emoji": "🔆", "rarity": "Common", "biome": "River"},
-            "Perch": {"weight": 120, "price": 8, "emoji": "🐡", "rarity": "Uncommon", "biome": "Lake"},
-            "Mudskipper": {"weight": 115, "price": 7, "emoji": "🐸", "rarity": "Common", "biome": "Mangrove"},
-            "Koi": {"weight": 110, "price": 12, "emoji": "🎏", "rarity": "Uncommon", "biome": "Garden Pond"},
-            "Glass Eel": {"weight": 100, "price": 10, "emoji": "🔮", "rarity": "Uncommon", "biome": "Estuary"},
-            "Gudgeon": {"weight": 95, "price": 9, "emoji": "🐟", "rarity": "Common", "biome": "Stream"},
-            "Carp": {"weight": 90, "price": 11, "emoji": "🐠", "rarity": "Uncommon", "biome": "Lake"},
-            "Herring": {"weight": 85, "price": 7, "emoji": "🐠", "rarity": "Common", "biome": "Coastal"},
-            "Trout": {"weight": 80, "price": 14, "emoji": "🎣", "rarity": "Uncommon", "biome": "Stream"},
-            "Rainbow Trout": {"weight": 75, "price": 18, "emoji": "🌈", "rarity": "Rare", "biome": "River"},
-            "Salmon": {"weight": 70, "price": 20, "emoji": "🐟", "rarity": "Rare", "biome": "River"},
-            "Char": {"weight": 65, "price": 18, "emoji": "❄️", "rarity": "Rare", "biome": "Cold Lake"},
-            "Mackerel": {"weight": 60, "price": 16, "emoji": "🐟", "rarity": "Common", "biome": "Coastal"},
-            "Pike": {"weight": 58, "price": 22, "emoji": "🦈", "rarity": "Rare", "biome": "Freshwater"},
-            "Rockfish": {"weight": 56, "price": 20, "emoji": "🪨", "rarity": "Uncommon", "biome": "Reef"},
-            "Largemouth Bass": {"weight": 50, "price": 26, "emoji": "🎣", "rarity": "Rare", "biome": "Lake"},
-            "Rock Bass": {"weight": 48, "price": 12, "emoji": "🐡", "rarity": "Uncommon", "biome": "River"},
-            "Smallmouth Bass": {"weight": 46, "price": 24, "emoji": "🐟", "rarity": "Rare", "biome": "River"},
-            "Catfish": {"weight": 44, "price": 28, "emoji": "🐱‍🏍", "rarity": "Rare", "biome": "River"},
-            "Sea Urchin": {"weight": 40, "price": 18, "emoji": "🟣", "rarity": "Uncommon", "biome": "Rocky Shore"},
-            "Seahorse": {"weight": 38, "price": 25, "emoji": "🐴", "rarity": "Rare", "biome": "Seagrass"},
-            "Flounder": {"weight": 36, "price": 30, "emoji": "🪸", "rarity": "Rare", "biome": "Coastal"},
-            "Sturgeon": {"weight": 34, "price": 45, "emoji": "🐡", "rarity": "Epic", "biome": "River"},
-            "Cuttlefish": {"weight": 32, "price": 34, "emoji": "🦑", "rarity": "Rare", "biome": "Coastal"},
-            "Yellowtail": {"weight": 30, "price": 38, "emoji": "🟡", "rarity": "Rare", "biome": "Coastal"},
-            "Amberjack": {"weight": 28, "price": 48, "emoji": "🪝", "rarity": "Epic", "biome": "Offshore"},
-            "Harlequin Shrimp": {"weight": 26, "price": 44, "emoji": "🦐", "rarity": "Epic", "biome": "Reef"},
-            "Snapper": {"weight": 24, "price": 32, "emoji": "🐠", "rarity": "Rare", "biome": "Reef"},
-            "Octopus": {"weight": 22, "price": 70, "emoji": "🐙", "rarity": "Epic", "biome": "Reef"},
-            "Pufferfish": {"weight": 20, "price": 48, "emoji": "🎈", "rarity": "Epic", "biome": "Reef"},
-            "Mahi Mahi": {"weight": 18, "price": 60, "emoji": "🐬", "rarity": "Epic", "biome": "Tropical Ocean"},
-            "Lionfish": {"weight": 16, "price": 55, "emoji": "🦁", "rarity": "Epic", "biome": "Reef"},
-            "Electric Ray": {"weight": 14, "price": 80, "emoji": "⚡", "rarity": "Legendary", "biome": "Ocean Floor"},
-            "Ghost Carp": {"weight": 12, "price": 90, "emoji": "👻", "rarity": "Legendary", "biome": "Murky Lake"},
-            "Giant Grouper": {"weight": 12, "price": 95, "emoji": "🐋", "rarity": "Legendary", "biome": "Reef"},
-            "Halibut": {"weight": 10, "price": 36, "emoji": "🐟", "rarity": "Epic", "biome": "Cold Ocean"},
-            "Swordfish": {"weight": 9, "price": 120, "emoji": "🗡️", "rarity": "Legendary", "biome": "Open Ocean"},
-            "Tuna": {"weight": 8, "price": 75, "emoji": "🐋", "rarity": "Legendary", "biome": "Open Ocean"},
-            "Anglerfish": {"weight": 6, "price": 200, "emoji": "🎣", "rarity": "Mythic", "biome": "Abyssal"},
-            "Dragonfish": {"weight": 5, "price": 300, "emoji": "🐉", "rarity": "Mythic", "biome": "Abyssal"},
-            "Blue Marlin": {"weight": 5, "price": 180, "emoji": "🔱", "rarity": "Mythic", "biome": "Deep Ocean"},
-            "Marlin": {"weight": 4, "price": 150, "emoji": "🏹", "rarity": "Legendary", "biome": "Deep Ocean"},
-            "Hammerhead": {"weight": 3, "price": 140, "emoji": "🔨", "rarity": "Mythic", "biome": "Open Ocean"},
-            "Great White": {"weight": 2, "price": 0, "emoji": "🦈", "rarity": "Boss", "biome": "Deep Ocean"},
-            "Butterfish": {"weight": 88, "price": 9, "emoji": "🧈", "rarity": "Common", "biome": "Coastal"},
-            "Sculpin": {"weight": 70, "price": 13, "emoji": "🪱", "rarity": "Uncommon", "biome": "Rocky Shore"},
-            "Scorpionfish": {"weight": 26, "price": 42, "emoji": "☠️", "rarity": "Epic", "biome": "Reef"},
-            "Moray Eel": {"weight": 18, "price": 50, "emoji": "🦎", "rarity": "Epic", "biome": "Reef"},
-            "Moonfin Sprite": {"weight": 95, "price": 25, "emoji": "🌙", "rarity": "Uncommon", "biome": "Moonlit Lake"},
-            "Glow Carp": {"weight": 85, "price": 30, "emoji": "✨", "rarity": "Rare", "biome": "Bioluminal Sea"},
-            "Crystal Trout": {"weight": 70, "price": 60, "emoji": "🔹", "rarity": "Epic", "biome": "Crystal River"},
-            "Phoenix Minnow": {"weight": 30, "price": 120, "emoji": "🔥", "rarity": "Legendary", "biome": "Volcanic Spring"},
-            "Abyssal Wisp": {"weight": 10, "price": 220, "emoji": "🕯️", "rarity": "Mythic", "biome": "Abyssal Rift"},
-            "Merrow Snapper": {"weight": 40, "price": 45, "emoji": "🧜", "rarity": "Epic", "biome": "Seagrass"},
-            "Frostling": {"weight": 55, "price": 35, "emoji": "❄️", "rarity": "Rare", "biome": "Frozen Bay"},
-            "Stormwing Tuna": {"weight": 12, "price": 160, "emoji": "🌩️", "rarity": "Legendary", "biome": "Tempest Ocean"},
-            "Elder Koi": {"weight": 100, "price": 75, "emoji": "🀄", "rarity": "Rare", "biome": "Sacred Pond"},
-            "Void Puffer": {"weight": 14, "price": 210, "emoji": "🕳️", "rarity": "Mythic", "biome": "Void Trench"},
-            "Silver Seraph": {"weight": 8, "price": 275, "emoji": "🕊️", "rarity": "Mythic", "biome": "Celestial Shoal"},
-            "Coral Drake": {"weight": 28, "price": 140, "emoji": "🐉", "rarity": "Legendary", "biome": "Reef"},
-            "Bramble Snapper": {"weight": 48, "price": 50, "emoji": "🌿", "rarity": "Uncommon", "biome": "Enchanted Marsh"},
-            "Glimmer Eel": {"weight": 22, "price": 95, "emoji": "💫", "rarity": "Epic", "biome": "Bioluminal Sea"},
-            "Sunscale": {"weight": 16, "price": 180, "emoji": "☀️", "rarity": "Legendary", "biome": "Tropical Reef"},
-            "Nightmare Haddock": {"weight": 20, "price": 160, "emoji": "🌑", "rarity": "Mythic", "biome": "Dreaming Deep"},
-            "Arcane Sprat": {"weight": 140, "price": 14, "emoji": "🔮", "rarity": "Common", "biome": "Magic Brook"},
-            "Mossback Grouper": {"weight": 48, "price": 46, "emoji": "🍃", "rarity": "Uncommon", "biome": "Swamp"},
-            "Spectral Herring": {"weight": 60, "price": 70, "emoji": "👻", "rarity": "Epic", "biome": "Haunted Shoals"},
-            "Goldcrest Cod": {"weight": 42, "price": 85, "emoji": "🪙", "rarity": "Rare", "biome": "Treasure Banks"},
-            "Sapphire Anchovy": {"weight": 78, "price": 22, "emoji": "🔷", "rarity": "Uncommon", "biome": "Coral Gardens"},
-            "Thunder Carp": {"weight": 36, "price": 130, "emoji": "⚡", "rarity": "Legendary", "biome": "Tempest Ocean"},
-            "Mistling": {"weight": 92, "price": 28, "emoji": "🌫️", "rarity": "Uncommon", "biome": "Foggy Lake"},
-            "Rune Snapper": {"weight": 26, "price": 110, "emoji": "🪄", "rarity": "Epic", "biome": "Ancient Reef"},
-            "Plume Salmon": {"weight": 62, "price": 95, "emoji": "🪶", "rarity": "Rare", "biome": "Riverbanks"},
-            "Star Pike": {"weight": 54, "price": 140, "emoji": "⭐", "rarity": "Epic", "biome": "Deep Ocean"},
-            "Twilight Bass": {"weight": 44, "price": 120, "emoji": "🌒", "rarity": "Legendary", "biome": "Dusk Lakes"},
-            "Eclipse Tuna": {"weight": 6, "price": 260, "emoji": "🌓", "rarity": "Mythic", "biome": "Open Ocean"},
-            "Ivory Seahorse": {"weight": 34, "price": 85, "emoji": "🦩", "rarity": "Rare", "biome": "Seagrass"},
-            "Cinderfish": {"weight": 20, "price": 95, "emoji": "🪵", "rarity": "Epic", "biome": "Volcanic Spring"},
-            "Aurora Trout": {"weight": 72, "price": 150, "emoji": "🌈", "rarity": "Legendary", "biome": "Northern River"},
-            "Mire Leviathan": {"weight": 3, "price": 0, "emoji": "🐲", "rarity": "Boss", "biome": "Bog Depths"},
-            "Wispling": {"weight": 82, "price": 19, "emoji": "🕊️", "rarity": "Common", "biome": "Willow Stream"},
-            "Obsidian Ray": {"weight": 18, "price": 160, "emoji": "🖤", "rarity": "Legendary", "biome": "Lava Reef"},
-            "Pearl Kelp": {"weight": 28, "price": 40, "emoji": "🐚", "rarity": "Uncommon", "biome": "Seagrass"},
-            "Echo Carp": {"weight": 88, "price": 32, "emoji": "🔔", "rarity": "Common", "biome": "Echo Pool"},
-            "Trilobite":         {"weight":120, "price":40,  "emoji":"🐞", "rarity":"Uncommon",   "biome":"Prehistoric"},
-            "Ammonite":          {"weight": 90, "price":45,  "emoji":"🐚", "rarity":"Uncommon",   "biome":"Prehistoric"},
-            "Dunkleosteus":      {"weight": 40, "price":120, "emoji":"🦖", "rarity":"Epic",       "biome":"Prehistoric"},
-            "Coelacanth":        {"weight": 80, "price":60,  "emoji":"🐟", "rarity":"Rare",       "biome":"Prehistoric"},
-            "Titanichthys":      {"weight": 70, "price":70,  "emoji":"🏺", "rarity":"Rare",       "biome":"Prehistoric"},
-            "Leedsichthys":      {"weight":100, "price":50,  "emoji":"🦕", "rarity":"Rare",       "biome":"Prehistoric"},
-            "Megalodon":         {"weight": 20, "price":200, "emoji":"🦈", "rarity":"Legendary", "biome":"Prehistoric"},
-            "Placoderm":         {"weight":110, "price":55,  "emoji":"🦴", "rarity":"Uncommon",   "biome":"Prehistoric"},
-            "Xiphactinus":       {"weight": 60, "price":65,  "emoji":"🐡", "rarity":"Rare",       "biome":"Prehistoric"},
-            "Ichthyosaur":       {"weight": 50, "price":75,  "emoji":"🦑", "rarity":"Rare",       "biome":"Prehistoric"},
-            "Phytosaur":         {"weight": 55, "price":45,  "emoji":"🐊", "rarity":"Uncommon",   "biome":"Prehistoric"},
-            "Stethacanthus":     {"weight": 45, "price":80,  "emoji":"🏹", "rarity":"Rare",       "biome":"Prehistoric"},
-            "Helicoprion":       {"weight": 30, "price":90,  "emoji":"🌀", "rarity":"Epic",       "biome":"Prehistoric"},
-            "Eusthenopteron":    {"weight": 95, "price":40,  "emoji":"🐠", "rarity":"Uncommon",   "biome":"Prehistoric"},
-            "Palaeospondylus":   {"weight": 85, "price":35,  "emoji":"🐟", "rarity":"Common",     "biome":"Prehistoric"},
-            "Unicorn Trout":     {"weight": 75, "price":120, "emoji":"🦄", "rarity":"Legendary",  "biome":"Magical"},
-            "Faerie Guppy":      {"weight":160, "price":45,  "emoji":"🧚", "rarity":"Uncommon",   "biome":"Magical"},
-            "Crystal Carp":      {"weight": 65, "price":60,  "emoji":"🔹", "rarity":"Epic",       "biome":"Magical"},
-            "Mystic Koi":        {"weight":110, "price":80,  "emoji":"🔮", "rarity":"Rare",       "biome":"Magical"},
-            "Phoenix Minnow":    {"weight": 40, "price":150, "emoji":"🔥", "rarity":"Mythic",     "biome":"Magical"},
-            "Hydra Bass":        {"weight": 50, "price":140, "emoji":"🐉", "rarity":"Legendary",  "biome":"Magical"},
-            "Spirit Cod":        {"weight": 70, "price":95,  "emoji":"👻", "rarity":"Rare",       "biome":"Magical"},
-            "Mana Mackerel":     {"weight": 60, "price":85,  "emoji":"🪄", "rarity":"Rare",       "biome":"Magical"},
-            "Goblin Goby":       {"weight":130, "price":40,  "emoji":"👹", "rarity":"Common",     "biome":"Magical"},
-            "Pixie Pike":        {"weight": 54, "price":110, "emoji":"✨", "rarity":"Epic",       "biome":"Magical"},
-            "Elf Eel":           {"weight": 55, "price":100, "emoji":"🧝", "rarity":"Rare",       "biome":"Magical"},
-            "Rune Ray":          {"weight": 14, "price":130, "emoji":"🪄", "rarity":"Legendary",  "biome":"Magical"},
-            "Charm Tuna":        {"weight":  8, "price":125, "emoji":"🪄", "rarity":"Legendary",  "biome":"Magical"},
-            "Illusion Herring":  {"weight": 38, "price":100, "emoji":"🔮", "rarity":"Epic",       "biome":"Magical"},
-            "Enchanted Salmon":  {"weight": 75, "price":110, "emoji":"🪶", "rarity":"Epic",       "biome":"Magical"},
-            "Nebula Eel":        {"weight": 50, "price":100, "emoji":"🌌", "rarity":"Epic",       "biome":"Space"},
-            "Meteor Minnow":     {"weight":150, "price":35,  "emoji":"☄️", "rarity":"Uncommon",   "biome":"Space"},
-            "Galactic Tuna":     {"weight": 18, "price":230, "emoji":"🐋", "rarity":"Mythic",     "biome":"Space"},
-            "Star Whale":        {"weight": 10, "price":300, "emoji":"🌠", "rarity":"Legendary",  "biome":"Space"},
-            "Comet Carp":        {"weight": 88, "price":90,  "emoji":"☄",  "rarity":"Rare",       "biome":"Space"},
-            "Asteroid Salmon":   {"weight": 85, "price":85,  "emoji":"🪨", "rarity":"Rare",       "biome":"Space"},
-            "Pluto Perch":       {"weight":120, "price":45,  "emoji":"🪐", "rarity":"Uncommon",   "biome":"Space"},
-            "Solar Flounder":    {"weight": 36, "price":110, "emoji":"☀️", "rarity":"Epic",       "biome":"Space"},
-            "Lunar Bass":        {"weight": 44, "price":120, "emoji":"🌕", "rarity":"Legendary",  "biome":"Space"},
-            "Cosmic Cod":        {"weight": 42, "price":100, "emoji":"🌠", "rarity":"Rare",       "biome":"Space"},
-            "Orbit Trout":       {"weight": 80, "price":95,  "emoji":"🔄", "rarity":"Uncommon",   "biome":"Space"},
-            "Quasar Pike":       {"weight": 54, "price":140, "emoji":"✨", "rarity":"Epic",       "biome":"Space"},
-            "Gravity Grouper":   {"weight": 48, "price":115, "emoji":"🌍", "rarity":"Rare",       "biome":"Space"},
-            "Supernova Snapper": {"weight": 24, "price":160, "emoji":"💥", "rarity":"Legendary",  "biome":"Space"},
-            "Astro Anglerfish":  {"weight":  6, "price":220, "emoji":"🚀", "rarity":"Mythic",     "biome":"Space"},
-            "Ember Carp":        {"weight": 20,  "price": 100, "emoji": "🔥",  "rarity": "Epic",     "biome": "Volcanic Spring"},
-            "Lava Snapper":      {"weight": 10,  "price": 140, "emoji": "🌋",  "rarity": "Legendary","biome": "Volcanic Spring"},
-            "Magma Eel":         {"weight": 5,   "price": 220, "emoji": "🌋",  "rarity": "Mythic",   "biome": "Volcanic Spring"},
-            "Fire Goby":         {"weight": 60,  "price": 35,  "emoji": "🔥",  "rarity": "Uncommon", "biome": "Volcanic Spring"},
-            "Cinder Minnow":     {"weight": 120, "price": 25,  "emoji": "🪵",  "rarity": "Common",   "biome": "Volcanic Spring"},
-            "Wraith Herring":    {"weight": 60,  "price": 80,  "emoji": "👻",  "rarity": "Rare",     "biome": "Haunted Shoals"},
-            "Bonefish":          {"weight": 80,  "price": 30,  "emoji": "💀",  "rarity": "Uncommon", "biome": "Haunted Shoals"},
-            "Ghost Catfish":     {"weight": 30,  "price": 110, "emoji": "👻",  "rarity": "Epic",     "biome": "Haunted Shoals"},
-            "Phantom Carp":      {"weight": 12,  "price": 160, "emoji": "🌑",  "rarity": "Legendary","biome": "Haunted Shoals"},
-            "Specter Eel":       {"weight": 6,   "price": 200, "emoji": "👻",  "rarity": "Mythic",   "biome": "Haunted Shoals"},
-            "Dream Pike":        {"weight": 50,  "price": 85,  "emoji": "💭",  "rarity": "Rare",     "biome": "Dreaming Deep"},
-            "Nightmare Grouper": {"weight": 25,  "price": 130, "emoji": "🌑",  "rarity": "Epic",     "biome": "Dreaming Deep"},
-            "Sleepfin":          {"weight": 75,  "price": 28,  "emoji": "😴",  "rarity": "Uncommon", "biome": "Dreaming Deep"},
-            "Somnus Shrimp":     {"weight": 55,  "price": 90,  "emoji": "🦐",  "rarity": "Rare",     "biome": "Dreaming Deep"},
-            "Hypnos Bass":       {"weight": 15,  "price": 150, "emoji": "💤",  "rarity": "Legendary","biome": "Dreaming Deep"},
-            "Leviathan Cod":     {"weight": 4,   "price": 300, "emoji": "🐋",  "rarity": "Mythic",   "biome": "Titan's Trench"},
-            "Titan Crab":        {"weight": 40,  "price": 140, "emoji": "🦀",  "rarity": "Epic",     "biome": "Titan's Trench"},
-            "Abyssal Angler":    {"weight": 10,  "price": 180, "emoji": "🎣",  "rarity": "Legendary","biome": "Titan's Trench"},
-            "Deepwyrm":          {"weight": 3,   "price": 350, "emoji": "🐉",  "rarity": "Mythic",   "biome": "Titan's Trench"},
-            "Pressure Pike":     {"weight": 70,  "price": 45,  "emoji": "🐟",  "rarity": "Uncommon", "biome": "Titan's Trench"},
-            "Neon Sprat":        {"weight": 140, "price": 18,  "emoji": "🌟",  "rarity": "Common",   "biome": "Bioluminal Cavern"},
-            "Glowfin Trout":     {"weight": 50,  "price": 95,  "emoji": "✨",  "rarity": "Rare",     "biome": "Bioluminal Cavern"},
-            "Radiant Ray":       {"weight": 14,  "price": 220, "emoji": "⚡",  "rarity": "Legendary","biome": "Bioluminal Cavern"},
-            "Luminous Carp":     {"weight": 32,  "price": 120, "emoji": "💡",  "rarity": "Epic",     "biome": "Bioluminal Cavern"},
-            "Lucent Gudgeon":    {"weight": 80,  "price": 35,  "emoji": "🔆",  "rarity": "Uncommon", "biome": "Bioluminal Cavern"},
-            "Moonshadow Koi":    {"weight": 30,  "price": 125, "emoji": "🌙",  "rarity": "Epic",     "biome": "Ethereal Lagoon"},
-            "Starling Minnow":   {"weight": 130, "price": 20,  "emoji": "⭐",  "rarity": "Common",   "biome": "Ethereal Lagoon"},
-            "Celestial Salmon":  {"weight": 8,   "price": 180, "emoji": "🌌",  "rarity": "Legendary","biome": "Ethereal Lagoon"},
-            "Nebula Nibbler":    {"weight": 5,   "price": 240, "emoji": "☄️",  "rarity": "Mythic",   "biome": "Ethereal Lagoon"},
-            "Skyfin":            {"weight": 65,  "price": 40,  "emoji": "🌤️", "rarity": "Uncommon", "biome": "Ethereal Lagoon"},            
-        }
-        # Derived prices
-        self.fish_prices = {name: info["price"] for name, info in self.fish_definitions.items()}
-        
-        # ---------- Gear definitions ----------
-        self.gear_definitions = {
-            "reels": {
-                "Precision Reel": {
-                    "hook_speed": 0.20,
-                    "description": "Reel in fish 20% quicker."
-                },
-                "Tangle-Free Reel": {
-                    "durability_boost": 0.30,
-                    "description": "30% reduced rod-break chance."
-                },
-            },
-            "lines": {
-                "Kevlar Line": {
-                    "durability_boost": 0.50,
-                    "description": "Halves rod break events."
-                },
-                "Elastic Line": {
-                    "double_catch_boost": 0.10,
-                    "description": "+10% chance for double catch."
-                },
-            },
-            "lures": {
-                "Glow Lure": {
-                    "rare_fish_boost": 0.15,
-                    "description": "+15% chance of Rare+ fish."
-                },
-                "Storm Lure": {
-                    "mythic_boost": 0.05,
-                    "description": "+5% chance of Mythic catches."
-                },
-            },
-        }    
-        # ─── Vessel definitions ───
-        self.vessel_definitions = {
-            # Inland waters
-            "Rowboat": {
-                "price": 100,
-                "unlock_biomes": ["Sacred Pond", "Lake", "Cold Lake", "Foggy Lake"],
-                "description": "Glide over quiet ponds, gardens and chilly lakes."
-            },
-            "Canoe": {
-                "price": 150,
-                "unlock_biomes": ["River", "Stream", "Estuary", "Enchanted Marsh"],
-                "description": "Paddle through rivers, streams, estuaries and misty marshes."
-            },
-            "Icebreaker": {
-                "price": 300,
-                "unlock_biomes": ["Frozen Bay", "Cold Ocean", "Crystal River"],
-                "description": "Break through ice to fish in frozen bays and cold seas."
-            },
-
-            # Coastal & reefs
-            "Wooden Dinghy": {
-                "price": 200,
-                "unlock_biomes": ["Mangrove", "Coastal", "Reef", "Swamp" ],
-                "description": "Access mangroves, coasts, reefs and steamy volcanic springs."
-            },
-            "Glass-Bottom Skiff": {
-                "price": 350,
-                "unlock_biomes": ["Rocky Shore", "Bioluminal Sea", "Bioluminal Cavern", "Tropical Reef", "Reef"],
-                "description": "Survey rocky shores and glowing bioluminal waters."
-            },
-
-            # Offshore & open seas
-            "Steel Trawler": {
-                "price": 500,
-                "unlock_biomes": ["Tropical Ocean", "Open Ocean", "Deep Ocean"],
-                "description": "Venture far offshore to tropical and open seas."
-            },
-            "Sailboat": {
-                "price": 800,
-                "unlock_biomes": ["Tropical Ocean", "Open Ocean", "Offshore", "Tempest Ocean"],
-                "description": "Harness the wind across warm and open waters."
-            },
-
-            # Themed special vessels
-            "Magma Dinghy": {
-                "price": 750,
-                "unlock_biomes": ["Volcanic Spring", "Lava Reef"],
-                "description": "Brave lava reefs and boiling springs in a heatproof craft."
-            },
-            "Ghost Drifter": {
-                "price": 900,
-                "unlock_biomes": ["Haunted Shoals", "Phantom Tide"],
-                "description": "Drift under moonlit halls where specters swim."
-            },
-            "Dreamboat": {
-                "price": 1000,
-                "unlock_biomes": ["Dreaming Deep", "Nightmare Bloom", "Dusk Lakes", "Celestial Shoal"],
-                "description": "Sail the currents of dreams and nightmares."
-            },
-            "Enchanted Barque": {
-                "price": 1200,
-                "unlock_biomes": ["Magical", "Space", "Ethereal Lagoon", "Magic Brook"],
-                "description": "Traverse magical waters and even star-lit shoals."
-            },
 
-            # Deep & abyssal exploration
-            "Submersible Pod": {
-                "price": 2000,
-                "unlock_biomes": ["Ocean Floor", "Abyssal Rift", "Titan's Trench",
-                               "Seagrass", "Coral Gardens", "Treasure Banks"],
-                "description": "Dive into the deepest trenches and ocean floors."
-            },
-            "Fossil Frigate": {
-                "price": 1500,
-                "unlock_biomes": ["Prehistoric", "Ancient Reef", "Void Trench"],
-                "description": "Explore ancient currents and prehistoric biomes."
-            },
-
-            # Ultimate all-access craft
-            "Fishing Yacht": {
-                "price": 10000,
-                "unlock_biomes": [
-                    "Pond", "Garden Pond", "Lake", "Cold Lake", "Foggy Lake",
-                    "River", "Stream", "Estuary", "Enchanted Marsh",
-                    "Mangrove", "Coastal", "Reef", "Volcanic Spring", "Lava Reef",
-                    "Tropical Ocean", "Open Ocean", "Offshore",
-                    "Rocky Shore", "Bioluminal Sea", "Bioluminal Cavern",
-                    "Haunted Shoals", "Phantom Tide", "Sacred Pond",
-                    "Dreaming Deep", "Nightmare Bloom", "Crystal River",
-                    "Magical", "Space", "Swamp", "Tropical Reef", "Reef", 
-                    "Ocean Floor", "Abyssal Rift", "Titan's Trench",
-                    "Prehistoric", "Magic Brook", "Ethereal Lagoon", "Seagrass",
-                    "Coral Gardens","Treasure Banks", "Dusk Lakes", "Celestial Shoal",
-                    "Deep Ocean", "Ancient Reef", "Void Trench", "Tempest Ocean"
-                    
-                ],
-                "description": "Ultimate vessel: access every single water biome in the world."
-            },
-        }
-        
-        # ─── Dynamically compute base_biomes (accessible without any vessel) ───
-        # 1) collect every biome from fish_definitions
-        all_biomes = {info["biome"] for info in self.fish_definitions.values()}
-        # 2) collect all biomes unlocked by vessels
-        locked_biomes = set().union(*(v["unlock_biomes"] for v in self.vessel_definitions.values()))
-        # 3) everything else is “base” terrain
-        self.base_biomes = sorted(all_biomes - locked_biomes)        
-
-        # ─── Consumable definitions ───
-        # Used by fishshop & fishbuy
-        self.consumable_definitions = {
-            "Bait":          {"price": 150,  "emoji": "🪱", "description": "Adds 5 bait to your tackle box."},
-            "Chum":          {"price": 100,  "emoji": "🦐", "description": "Increases rare catch chance by 5% for next 3 casts."},
-            "Stew Bowl":     {"price": 300,  "emoji": "🍲", "description": "Restores rod durability; grants +1 luck."},
-            "Rod Fragment":  {"price":1500,  "emoji": "🧩", "description": "Salvage to repair rods or unlock upgrades."},
-            "Biome Explorer’s Journal":       {"price": 500,  "emoji": "📔", "description": "Logs biomes; +10% catch bonus in unexplored areas."},
-            "Nutrient Pack": {"price": 300,  "emoji": "🥫", "description": "Boosts bait effectiveness by 15% for 5 casts."},
-            "Mystery Box":   {"price":1000,  "emoji": "🎁", "description": "Contains random consumables or gear."}
-        }        
-
-        # Achievements                
-        self.achievements: Dict[str, Tuple[str, str, str]] = {
-            "first_cast": ("First Cast", "Cast your line for the first time.", "general"),
-            "first_fish": ("First Fish", "Catch your first fish.", "catch"),
-            "fish_10": ("Getting Warm", "Catch 10 fish total.", "catch"),
-            "fish_100": ("Dedicated Angler", "Catch 100 fish total.", "catch"),
-            "unique_5": ("Variety Pack", "Catch 5 different fish species.", "collection"),
-            "unique_25": ("Menagerie", "Catch 25 different fish species.", "collection"),
-            "mythic_catch": ("Mythic Hook", "Catch any Mythic rarity fish.", "rarity"),
-            "epic_streak_3": ("Epic Streak", "Catch 3 epic-or-better fish consecutively.", "streak"),
-            "sell_1000": ("Merchant", "Sell fish totaling 1000 currency.", "economy"),
-            "treasure_hunter": ("Treasure Hunter", "Find a treasure chest event.", "event"),
-            "pearl_finder": ("Pearl Finder", "Find a pearl.", "event"),
-            "map_collector": ("Map Collector", "Find a Treasure Map.", "collection"),
-            "sea_monster_survivor": ("Sea Monster Survivor", "Survive a sea monster event and get a reward.", "event"),
-            "double_catch": ("Lucky Pair", "Get a double catch.", "event"),
-            "bait_collector": ("Bait Hoarder", "Collect 20 bait in total.", "resource"),
-            "rod_repaired": ("Back in Action", "Repair your rod for the first time.", "general"),
-            "first_chum": ("First Chum", "Craft your first Chum.", "craft"),
-            "trophy_maker": ("Trophy Maker", "Craft your first Trophy.", "craft"),
-            "fragment_collector": ("Fragment Collector", "Collect 10 Rod Fragments.", "resource"),
-            "core_seeker": ("Core Seeker", "Obtain your first Rod Core.", "resource"),
-            "rod_master_1": ("Rod Novice", "Upgrade your rod to level 1.", "rod"),
-            "rod_master_2": ("Rod Expert", "Upgrade your rod to level 2.", "rod"),
-            "rod_master_3": ("Rod Legend", "Upgrade your rod to level 3.", "rod"),
-            "double_trouble": ("Double Trouble", "Trigger 5 double catches.", "event"),
-            "net_haul": ("Net Hauler", "Get an event that yields 5+ fish total.", "event"),
-            "treasure_collect": ("Treasure Collector", "Find 5 treasure chests.", "event"),
-            "pearl_hoarder": ("Pearl Hoarder", "Find 3 pearls.", "event"),
-            "map_explorer": ("Map Explorer", "Collect 3 Treasure Maps.", "event"),
-            "sea_legend": ("Sea Legend", "Catch any Boss fish.", "boss"),
-            "abyssal_finder": ("Abyssal Finder", "Catch an Abyssal or Mythic fish.", "rarity"),
-            "mythic_hunter": ("Mythic Hunter", "Catch 3 Mythic fish total.", "rarity"),
-            "legend_chaser": ("Legend Chaser", "Catch 5 Legendary fish total.", "rarity"),
-            "spectral_hunter": ("Ghost Bounty", "Catch a Spectral Herring or similar spectral fish.", "special"),
-            "festival_fan": ("Festival Fan", "Benefit from the Festival event 3 times.", "event"),
-            "npc_friend": ("Friend of the Town", "Complete 5 quests from any NPC.", "quest"),
-            "quest_master": ("Quest Master", "Complete 25 quests total.", "quest"),
-            "merchant_of_mean": ("Merchant of Mean", "Sell 500 total value of fish.", "economy"),
-            "crafting_ace": ("Crafting Ace", "Craft every recipe at least once.", "craft"),
-            "oceanographer": ("Oceanographer", "Catch at least one fish from every biome.", "collection"),
-            "collector_100": ("Collector", "Have 100 fish in your collection (duplicates count).", "collection"),
-            "seasoned_angler": ("Seasoned Angler", "Cast 1000 times.", "general"),
-            "bait_hoarder_plus": ("Bait Baron", "Collect 100 bait total.", "resource"),
-            "salvage_expert": ("Salvage Expert", "Find 20 salvage events.", "event"),
-            "hotspot_hunter": ("Hotspot Hunter", "Use a hotspot or map and catch a rare fish.", "special"),
-            "cosmic_watcher": ("Cosmic Watcher", "Trigger a meteor_shower or moon_phase event.", "event"),
-        }
+        # handler profiles for fishbalance, built on first use
+        self._balance = None
+        # (monotonic time taken, EconomySnapshot) for fishanalytics
+        self._analytics = None
 
+        # Listing pages (fishlist/fishcraftlist/fishshop) keyed by
+        # (command, filter or prefix, currency); see _cached_pages
+        self._page_cache: Dict[Tuple, EmbedPages] = {}
 
-        # Rarity ranks
-        self.rarity_rank = {
-            "Common": 0,
-            "Uncommon": 1,
-            "Rare": 2,
-            "Epic": 3,
-            "Legendary": 4,
-            "Mythic": 5,
-            "Boss": 6,
-        }
+        # Event-weight modifiers: name -> {event key: multiplier}. Each
+        # combination of active modifiers maps to one cached WeightedTable.
+        self._event_modifiers: Dict[str, Dict[str, float]] = {}
+        self._event_tables: Dict[Tuple[str, ...], WeightedTable] = {}
 
-        # Rod upgrade system
-        self.rod_upgrade_requirements = {
-            1: {"fragments": 3, "coins": 0},
-            2: {"fragments": 6, "coins": 50},
-            3: {"fragments": 10, "coins": 150},
-        }
-        self.rod_level_fish_multiplier = {0: 1.0, 1: 1.2, 2: 1.4, 3: 1.6}
-        self.rod_level_break_reduction = {0: 1.0, 1: 0.8, 2: 0.6, 3: 0.4}
-
-        # Crafting recipes
-        self.crafting_recipes = {
-            "chum": {
-                "name": "Chum",
-                "requirements": {"any_fish": 3},
-                "result": {"item": "Chum"},
-                "description": "Combine any 3 fish to craft Chum (consumable). Using Chum gives +3 luck.",
-            },
-            "trophy": {
-                "name": "Trophy",
-                "requirements": {"any_fish": 5},
-                "result": {
-                    "coins": 100,       # still gives 100 coins
-                    "item": "Trophy"    # now also grants a Trophy item
-                },
-                "description": "Combine any 5 fish to craft a Trophy, receive 100 coins and a Trophy item.",
-            },
-            "fragments_from_epic": {
-                "name": "Epic Refinement",
-                "requirements": {"rarity:Epic": 2},
-                "result": {"items": {"Rod Fragment": 2}},
-                "description": "Refine two Epic fish into 2 Rod Fragments (removes the fish).",
-            },
-            "fish_stew": {
-                "name": "Hearty Fish Stew",
-                "requirements": {"any_fish": 2, "rarity:Uncommon": 1},
-                "result": {"item": "Stew Bowl"},
-                "description": "Cook 2 fish (1 Uncommon) into a Stew Bowl. Eating it gives +2 luck on your next 5 casts.",
-            },
-            "elemental_lure": {
-                "name": "Stormcaller Lure",
-                "requirements": {"rarity:Rare": 1, "item:Storm Scale": 1},
-                "result": {"item": "Stormcaller Lure"},
-                "description": "Use this lure to double your chance of Rare+ fish on the next cast.",
-            },
-            "trophy_plaque": {
-                "name": "Angler’s Plaque",
-                "requirements": {"item:Trophy": 1, "rarity:Legendary": 1},
-                "result": {"item": "Plaque"},
-                "description": "Combine Trophy + Legendary fish into a decorative Plaque you can display or sell.",
-            },
-            "fish_oil": {
-                "name": "Fish Oil Flask",
-                "requirements": {"fish:Mackerel": 1, "fish:Tuna": 1},
-                "result": {"coins": 50},
-                "description": "Extract oil from Mackerel + Tuna for 50 coins. A key alchemy ingredient!",
-            },
-            "nutrient_pack": {
-                "name": "Nutrient Pack",
-                "requirements": {"rarity:Common": 1, "rarity:Uncommon": 1, "rarity:Rare": 1},
-                "result": {"item": "Nutrient Pack"},
-                "description": "Use to gain +1 bait each hour for the next 6 hours.",
-            },
-            "coil_upgrade": {
-                "name": "Durability Coil",
-                "requirements": {"item:Rod Core": 2, "rarity:Mythic": 1},
-                "result": {"item": "Rod Coil"},
-                "description": "Attach to your rod to halve break chance for 100 casts.",
-            },
-            "mystic_tonic": {
-                "name": "Mystic Angler’s Tonic",
-                "requirements": {"rarity:Mythic": 1, "rarity:Boss": 1},
-                "result": {"coins": 200, "item": "Tonic Bottle"},
-                "description": "Resets your streak and grants a 200-coin bonus when drunk.",
-            },
-            "festival_pack": {
-                "name": "Festival Pack",
-                "requirements": {"item:Treasure Map": 1, "item:Coral Trinket": 1, "item:Pearl": 1},
-                "result": {"item": "Festival Pack"},
-                "description": "Use to guarantee a Festival event on your next cast.",
-            },
-            "biome_journal": {
-                "name": "Biome Explorer’s Journal",
-                "requirements": {
-                    "fish:Pond": 1,
-                    "fish:River": 1,
-                    "fish:Open Ocean": 1
-                },
-            "result": {
-                "coins": 100,
-                "item": "Biome Explorer’s Journal"
-            },
-                "description": "Grants +10% chance of biome-specific rares for 10 casts.",
-            },
-            "mystery_box": {
-                "name": "Mystery Box",
-                "requirements": {"any_fish": 5},
-                "result": {"item": "Mystery Box"},
-                "description": "Open for a random reward: Rod Core / 100–300 coins / Treasure Map.",
-            },
-        }
+        # fish, gear, vessels, quests, ... from data/*.json (see registry.py)
+        self._apply_data(load_data())
 
-        # NPCs and questlines
-        self.npcs = {
-            "maris": {
-                "display": "Maris the Merchant",
-                "greeting": "Maris smiles and polishes a brass scale. 'Looking for work or wares?'",
-                "quests": ["maris_fragment_hunt", "merchant_supply", "reef_expedition", "legend_hunt", "artifact_recovery"],
-                "image": "https://files.catbox.moe/muc0lg.png",
-            },
-            "oldfinn": {
-                "display": "Old Finn",
-                "greeting": "'Hm, a keen eye for fish? I remember the river in my day…'",
-                "quests": ["finn_first_catch", "boss_sightings", "river_cleanse", "river_runner", "high_stakes_sale"],
-                "image": "https://files.catbox.moe/pxc6vz.png",
-            },
-            "lira": {
-                "display": "Lira the Tidewatcher",
-                "greeting": "'The tides speak to those who listen.'",
-                "quests": ["tide_pool_mini", "midnight_hunt", "tide_change_event", "coastal_call", "treasure_finder"],
-                "image": "https://files.catbox.moe/mv7rsg.png",
-            },
-            "garron": {
-                "display": "Garron the Salvor",
-                "greeting": "'I barter salvage and stories. Bring me trinkets.'",
-                "quests": ["drifter_hunt", "drifting_crate_run", "reef_expedition", "salvage_strike"],
-                "image": "https://files.catbox.moe/0rfed5.png",
-            },
-            "selene": {
-                "display": "Selene the Moonseer",
-                "greeting": "'The moon favors careful anglers.'",
-                "quests": ["moon_phase_patrol", "midnight_hunt", "aurora_call", "abyssal_ambush", "boss_battle"],
-                "image": "https://files.catbox.moe/3ehdme.png",
-            },
-            "berta": {
-                "display": "Berta the Baitsmith",
-                "greeting": "'Need bait? Or a quick job to earn some?'",
-                "quests": ["easy_bait_run", "angler_apprentice", "seasonal_bounty", "beginners_luck", "pond_patrol"],
-                "image": "https://files.catbox.moe/j6jlvc.png",
-            },
-            "thorin": {
-                "display": "Thorin the Tactician",
-                "greeting": "'I can set up a challenge if you're brave.'",
-                "quests": ["epic_refinement", "legend_hunt", "mythic_probe", "epic_extraction"],
-                "image": "https://files.catbox.moe/gey7m6.png",
-            },
-            "nym": {
-                "display": "Nym of the Marsh",
-                "greeting": "'The marsh keeps its secrets; trade me what you find.'",
-                "quests": ["mire_tasks", "mossback_call", "river_cleanse", "legendary_capture"],
-                "image": "https://files.catbox.moe/a78qlb.png",
-            },
-            "vulko": {
-                "display": "Vulko the Lava Shaman",
-                "greeting": "'The magma sings to those who dare. Will you listen to its rhythm?'",
-                "quests": ["volcanic_venture","ember_hunt","inferno_artifact","lava_challenge"],
-                "image": "https://files.catbox.moe/kd6fvu.png",
-            },
-            "paleon": {
-                "display": "Paleon the Fossil Chaser",
-                "greeting": "'These ancient currents whisper of long-lost beasts. Help me unearth their bones.'",
-                "quests": ["fossil_hunt","dunkle_search","leviathan_probe","placoderm_delve"],
-                "image": "https://files.catbox.moe/irhj3p.png",
-            },
-            "grimma": {
-                "display": "Grimma the Ghost Whisperer",
-                "greeting": "'Shadows stir beneath haunted shoals. Are you bold enough to answer their call?'",
-                "quests": ["haunted_whispers","spectral_tide","phantom_treasure","wraith_bounty"],
-                "image": "https://files.catbox.moe/bphqno.png",
-            }, 
-            "stellara": {
-                "display": "Stellara the Starfarer",
-                "greeting": "'The void beyond the waves is alive with cosmic wonders. Cast into the stars.'",
-                "quests": ["asteroid_hunt","nebula_expedition","cosmic_probe","starwhale_sighting"],
-                "image": "https://files.catbox.moe/ysmx5h.png",
-            },            
-        }
-        self.quests = {
-            "finn_first_catch": {
-                "title": "A Young Angler's Proving",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Common", "count": 3, "desc": "Catch 3 Common fish."},
-                    {"type": "visit_npc", "npc": "oldfinn", "desc": "Return to Old Finn."},
-                ],
-                "rewards": {"coins": 25, "items": {"Rod Fragment": 1}},
-                "repeatable": False,
-            },
-            "maris_fragment_hunt": {
-                "title": "Fragments for a Discount",
-                "steps": [
-                    {"type": "deliver_item", "item": "Rod Fragment", "count": 3, "desc": "Bring 3 Rod Fragments."},
-                ],
-                "rewards": {"coins": 75, "items": {"Rod Core": 1}},
-                "repeatable": True,
-            },
-            "easy_bait_run": {
-                "title": "Bait Run",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Common", "count": 2, "desc": "Catch 2 Common fish."},
-                ],
-                "rewards": {"coins": 10, "items": {"Chum": 1}},
-                "repeatable": True,
-            },
-            "river_cleanse": {
-                "title": "River Cleanse",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Common", "count": 4, "desc": "Collect 4 Common fish from the river."},
-                    {"type": "deliver_item", "item": "Treasure Map", "count": 1, "desc": "Deliver any Treasure Map."},
-                ],
-                "rewards": {"coins": 30, "items": {"Rod Fragment": 1}},
-                "repeatable": False,
-            },
-            "angler_apprentice": {
-                "title": "Angler Apprentice",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Uncommon", "count": 3, "desc": "Catch 3 Uncommon fish."},
-                    {"type": "sell_value", "amount": 50, "desc": "Sell fish totalling 50 coins."},
-                ],
-                "rewards": {"coins": 50, "items": {"Chum": 2}},
-                "repeatable": True,
-            },
-            "reef_expedition": {
-                "title": "Reef Expedition",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Rare", "count": 2, "desc": "Catch 2 Rare fish from reef biomes."},
-                    {"type": "deliver_item", "item": "Coral Trinket", "count": 1, "desc": "Deliver a Coral Trinket if you have one."},
-                ],
-                "rewards": {"coins": 100, "items": {"Rod Fragment": 2}},
-                "repeatable": False,
-            },
-            "midnight_hunt": {
-                "title": "Midnight Hunt",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Rare", "count": 3, "desc": "Catch 3 Rare fish at night."},
-                    {"type": "visit_npc", "npc": "maris", "desc": "Report back to Maris."},
-                ],
-                "rewards": {"coins": 150, "items": {"Chum": 3}},
-                "repeatable": True,
-            },
-            "epic_refinement": {
-                "title": "Epic Refinement",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Epic", "count": 2, "desc": "Gather 2 Epic fish."},
-                    {"type": "deliver_item", "item": "Rod Fragment", "count": 1, "desc": "Deliver 1 Rod Fragment."},
-                ],
-                "rewards": {"coins": 250, "items": {"Rod Core": 1}},
-                "repeatable": False,
-            },
-            "boss_sightings": {
-                "title": "Boss Sightings",
-                "steps": [
-                    {"type": "visit_npc", "npc": "oldfinn", "desc": "Hear the old tales from Old Finn."},
-                    {"type": "collect_fish", "rarity": "Boss", "count": 1, "desc": "Survive and secure evidence of a Boss encounter."},
-                ],
-                "rewards": {"coins": 0, "items": {"Map": 1}},
-                "repeatable": False,
-            },
-            "mythic_probe": {
-                "title": "Mythic Probe",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Mythic", "count": 1, "desc": "Catch one Mythic rarity fish."},
-                ],
-                "rewards": {"coins": 500, "items": {"Rod Core": 1}},
-                "repeatable": False,
-            },
-            "seasonal_bounty": {
-                "title": "Seasonal Bounty",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Uncommon", "count": 5, "desc": "Catch 5 Uncommon fish during this season."},
-                    {"type": "sell_value", "amount": 200, "desc": "Sell fish totalling 200 coins this season."},
-                ],
-                "rewards": {"coins": 200, "items": {"Chum": 5}},
-                "repeatable": True,
-            },
-            "merchant_supply": {
-                "title": "Merchant Supply",
-                "steps": [
-                    {"type": "deliver_item", "item": "Rod Fragment", "count": 5, "desc": "Bring 5 Rod Fragments to the merchant."},
-                ],
-                "rewards": {"coins": 300, "items": {"Rod Core": 1}},
-                "repeatable": True,
-            },
-            "legend_hunt": {
-                "title": "Legend Hunt",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Legendary", "count": 2, "desc": "Bring back 2 Legendary fish."},
-                    {"type": "visit_npc", "npc": "maris", "desc": "Claim your reward from Maris."},
-                ],
-                "rewards": {"coins": 400, "items": {"Rod Core": 2}},
-                "repeatable": False,
-            },
-            "tide_pool_mini": {
-                "title": "Tide Pool Mini",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Common", "count": 3, "desc": "Collect 3 small fish from a tide pool."},
-                ],
-                "rewards": {"coins": 20, "items": {}},
-                "repeatable": True,
-            },
-            "drifter_hunt": {
-                "title": "Drifter Hunt",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Common", "count": 2, "desc": "Grab some fish from floating debris."},
-                ],
-                "rewards": {"coins": 30, "items": {}},
-                "repeatable": True,
-            },
-            "drifting_crate_run": {
-                "title": "Crate Run",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Uncommon", "count": 2, "desc": "Collect two Uncommon fish from drifting waters."},
-                ],
-                "rewards": {"coins": 45, "items": {"Rod Fragment": 1}},
-                "repeatable": True,
-            },
-            "moon_phase_patrol": {
-                "title": "Moon Patrol",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Rare", "count": 1, "desc": "Catch a Rare fish under moonlight."},
-                    {"type": "visit_npc", "npc": "selene", "desc": "Report success to Selene."},
-                ],
-                "rewards": {"coins": 120, "items": {"Chum": 2}},
-                "repeatable": False,
-            },
-            "aurora_call": {
-                "title": "Aurora Call",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Legendary", "count": 1, "desc": "Catch a Legendary fish influenced by aurora."},
-                ],
-                "rewards": {"coins": 220, "items": {"Rod Fragment": 2}},
-                "repeatable": False,
-            },
-            "mire_tasks": {
-                "title": "Mire Tasks",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Uncommon", "count": 3, "desc": "Catch 3 Uncommon fish in the marsh."},
-                ],
-                "rewards": {"coins": 40, "items": {"Chum": 1}},
-                "repeatable": True,
-            },
-            "mossback_call": {
-                "title": "Mossback Call",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Uncommon", "count": 4, "desc": "Gather 4 Mossback-style fish."},
-                    {"type": "visit_npc", "npc": "nym", "desc": "Report to Nym of the Marsh."},
-                ],
-                "rewards": {"coins": 90, "items": {"Rod Fragment": 1}},
-                "repeatable": False,
-            },    
-            "beginners_luck": {
-            "title": "Beginner's Luck",
-            "difficulty": "Easy",
-            "steps": [
-                {"type": "collect_fish", "rarity": "Common", "count": 2,
-                 "desc": "Catch 2 Common fish anywhere."}
-            ],
-            "rewards": {"coins": 20},
-            "repeatable": True,
-            },
-            "pond_patrol": {
-                "title": "Pond Patrol",
-                "difficulty": "Easy",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Common", "count": 3,
-                     "desc": "Catch 3 Common fish in a garden pond."}
-                ],
-                "rewards": {"coins": 30, "items": {"Chum": 1}},
-                "repeatable": True,
-            },
-            "river_runner": {
-                "title": "River Runner",
-                "difficulty": "Easy",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Uncommon", "count": 2,
-                     "desc": "Catch 2 Uncommon fish in a river."}
-                ],
-                "rewards": {"coins": 40},
-                "repeatable": True,
-            },
-            "high_stakes_sale": {
-                "title": "High-Stakes Sale",
-                "difficulty": "Medium",
-                "steps": [
-                    {"type": "sell_value", "amount": 200,
-                     "desc": "Sell fish totalling 200 coins."}
-                ],
-                "rewards": {"coins": 80},
-                "repeatable": True,
-            },
-            "coastal_call": {
-                "title": "Coastal Call",
-                "difficulty": "Medium",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Rare", "count": 1,
-                     "desc": "Land 1 Rare fish along the coast."}
-                ],
-                "rewards": {"coins": 100, "items": {"Treasure Map": 1}},
-                "repeatable": True,
-            },
-            "salvage_strike": {
-                "title": "Salvage Strike",
-                "difficulty": "Medium",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Common", "count": 1,
-                     "desc": "Find any salvage event reward (e.g. a Rod Fragment)."}
-                ],
-                "rewards": {"coins": 60, "items": {"Rod Fragment": 1}},
-                "repeatable": True,
-            },
-            "treasure_finder": {
-                "title": "Treasure Finder",
-                "difficulty": "Medium",
-                "steps": [
-                    {"type": "deliver_item", "item": "Treasure Map", "count": 1,
-                     "desc": "Turn in a Treasure Map."}
-                ],
-                "rewards": {"coins": 120, "items": {"Rod Core": 1}},
-                "repeatable": False,
-            },
-            "artifact_recovery": {
-                "title": "Artifact Recovery",
-                "difficulty": "Hard",
-                "steps": [
-                    {"type": "deliver_item", "item": "Coral Trinket", "count": 2,
-                     "desc": "Deliver 2 Coral Trinkets."}
-                ],
-                "rewards": {"coins": 250, "items": {"Rod Core": 2}},
-                "repeatable": False,
-            },
-            "epic_extraction": {
-                "title": "Epic Extraction",
-                "difficulty": "Hard",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Epic", "count": 2,
-                     "desc": "Catch 2 Epic fish."}
-                ],
-                "rewards": {"coins": 300, "items": {"Rod Fragment": 3}},
-                "repeatable": False,
-            },
-            "legendary_capture": {
-                "title": "Legendary Capture",
-                "difficulty": "Hard",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Legendary", "count": 1,
-                     "desc": "Bring in 1 Legendary fish."}
-                ],
-                "rewards": {"coins": 400, "items": {"Rod Core": 1}},
-                "repeatable": False,
-            },
-            "abyssal_ambush": {
-                "title": "Abyssal Ambush",
-                "difficulty": "Very Hard",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Mythic", "count": 1,
-                     "desc": "Hook a Mythic fish in the abyss."}
-                ],
-                "rewards": {"coins": 500, "items": {"Rod Core": 2}},
-                "repeatable": False,
-            },
-            "boss_battle": {
-                "title": "Boss Battle",
-                "difficulty": "Elite",
-                "steps": [
-                    {"type": "collect_fish", "rarity": "Boss", "count": 1,
-                     "desc": "Defeat and catch a Boss fish."}
-                ],
-                "rewards": {"coins": 800, "items": {"Map": 2}},
-                "repeatable": False,    
-            },
-            "volcanic_venture": {
-                "title": "Volcanic Venture",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "rarity": "Epic",
-                        "count": 2,
-                        "desc": "Catch 2 Epic fish in a Volcanic Spring."
-                    }
-                ],
-                "rewards": {"coins": 150, "items": {"Rod Fragment": 1}},
-                "repeatable": False,
-            },
-            "ember_hunt": {
-                "title": "Ember Hunt",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Fire Goby",
-                        "count": 3,
-                        "desc": "Catch 3 Fire Goby from the smoldering pools."
-                    }
-                ],
-                "rewards": {"coins": 50, "items": {"Chum": 1}},
-                "repeatable": True,
-            },
-            "inferno_artifact": {
-                "title": "Inferno Artifact",
-                "steps": [
-                    {
-                        "type": "deliver_item",
-                        "item": "Lava Pearl",
-                        "count": 1,
-                        "desc": "Deliver a Lava Pearl to Vulko."
-                    }
-                ],
-                "rewards": {"coins": 200, "items": {"Rod Core": 1}},
-                "repeatable": False,
-            },
-            "lava_challenge": {
-                "title": "Lava Challenge",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Magma Eel",
-                        "count": 1,
-                        "desc": "Hook a Magma Eel from a sudden lava spout."
-                    }
-                ],
-                "rewards": {"coins": 300, "items": {"Storm Scale": 1}},
-                "repeatable": False,
-            },    
-            "fossil_hunt": {
-                "title": "Fossil Hunt",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "rarity": "Uncommon",
-                        "count": 3,
-                        "desc": "Catch 3 Uncommon fish in the Prehistoric biome."
-                    }
-                ],
-                "rewards": {"coins": 60, "items": {"Chum": 1}},
-                "repeatable": True,
-            },
-            "dunkle_search": {
-                "title": "Dunkle Search",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Dunkleosteus",
-                        "count": 1,
-                        "desc": "Catch one Dunkleosteus."
-                    }
-                ],
-                "rewards": {"coins": 150, "items": {"Rod Fragment": 1}},
-                "repeatable": False,
-            },
-            "leviathan_probe": {
-                "title": "Leviathan Probe",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Mire Leviathan",
-                        "count": 1,
-                        "desc": "Secure proof of a Mire Leviathan catch."
-                    }
-                ],
-                "rewards": {"coins": 400, "items": {"Map": 1}},
-                "repeatable": False,
-            },
-            "placoderm_delve": {
-                "title": "Placoderm Delve",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Placoderm",
-                        "count": 1,
-                        "desc": "Catch one Placoderm."
-                    }
-                ],
-                "rewards": {"coins": 120},
-                "repeatable": True,
-            },   
-            "haunted_whispers": {
-                "title": "Haunted Whispers",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Spectral Herring",
-                        "count": 1,
-                        "desc": "Catch one Spectral Herring."
-                    }
-                ],
-                "rewards": {"coins": 80, "items": {"Pearl": 1}},
-                "repeatable": True,
-            },
-            "spectral_tide": {
-                "title": "Spectral Tide",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Wraith Herring",
-                        "count": 2,
-                        "desc": "Net two Wraith Herring from the Haunted Shoals."
-                    }
-                ],
-                "rewards": {"coins": 100, "items": {"Rod Fragment": 1}},
-                "repeatable": False,
-            },
-            "phantom_treasure": {
-                "title": "Phantom Treasure",
-                "steps": [
-                    {
-                        "type": "deliver_item",
-                        "item": "Phantom Pearl",
-                        "count": 1,
-                        "desc": "Turn in a Phantom Pearl."
-                    }
-                ],
-                "rewards": {"coins": 200, "items": {"Storm Scale": 1}},
-                "repeatable": False,
-            },
-            "wraith_bounty": {
-                "title": "Wraith Bounty",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Ghost Carp",
-                        "count": 1,
-                        "desc": "Bring in one Ghost Carp."
-                    }
-                ],
-                "rewards": {"coins": 120, "items": {"Chum": 1}},
-                "repeatable": True,
-            },
-            "asteroid_hunt": {
-                "title": "Asteroid Hunt",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Asteroid Salmon",
-                        "count": 2,
-                        "desc": "Catch two Asteroid Salmon."
-                    }
-                ],
-                "rewards": {"coins": 100, "items": {"Map": 1}},
-                "repeatable": True,
-            },
-            "nebula_expedition": {
-                "title": "Nebula Expedition",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Nebula Eel",
-                        "count": 1,
-                        "desc": "Land one Nebula Eel."
-                    }
-                ],
-                "rewards": {"coins": 180, "items": {"Rod Fragment": 1}},
-                "repeatable": False,
-            },
-            "cosmic_probe": {
-                "title": "Cosmic Probe",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "rarity": "Mythic",
-                        "count": 1,
-                        "desc": "Catch a Mythic fish under cosmic skies."
-                    }
-                ],
-                "rewards": {"coins": 200, "items": {"Coral Trinket": 1}},
-                "repeatable": False,
-            },
-            "starwhale_sighting": {
-                "title": "Starwhale Sighting",
-                "steps": [
-                    {
-                        "type": "collect_fish",
-                        "name": "Star Whale",
-                        "count": 1,
-                        "desc": "Net a Star Whale."
-                    }
-                ],
-                "rewards": {"coins": 300, "items": {"Tonic Bottle": 1}},
-                "repeatable": False,
-            }, 
+    # ---------- Static data ----------
+    def _apply_data(self, data: FishingData):
+        """
+        Point the cog at a loaded data set and rebuild every table derived
+        from it. Raises DataError before changing anything if an event in the
+        data has no handler.
+        """
+        # Event registry: key -> (handler, weight); handlers are the _event_<key> methods
+        handlers = {}
+        for key, weight in data.event_weights.items():
+            handler = getattr(self, f"_event_{key}", None)
+            if handler is None:
+                raise DataError(f"events.json: no handler for event {key!r}")
+            handlers[key] = (handler, weight)
+
+        self._data = data
+        self.names = data.names
+        self.cast_flavor = data.cast_flavor
+        self.fish_definitions = data.fish
+        self.fish_prices = {name: info.price for name, info in data.fish.items()}
+        # fish name -> the held-fish tally keys it counts towards
+        self._tally_keys: Dict[str, Tuple[str, ...]] = {
+            name: ("rarity:" + info.rarity, "biome:" + info.biome) for name, info in data.fish.items()
         }
+        self.gear_definitions = data.gear
+        self.vessel_definitions = data.vessels
+        self.base_biomes = list(data.base_biomes)
+        self.consumable_definitions = data.consumables
+        self.achievements = data.achievements
+        self.rarity_rank = data.rarity_rank
+        self.rod_upgrade_requirements = data.rod_upgrade_requirements
+        self.rod_level_fish_multiplier = data.rod_fish_multiplier
+        self.rod_level_break_reduction = data.rod_break_reduction
+        self.crafting_recipes = data.recipes
+        self.npcs = data.npcs
+        self.quests = data.quests
+        self.buff_definitions = data.buffs
+
+        # Achievement rules: id -> (metric, threshold). A metric is a stats key,
+        # "rod_level" or "item:<name>". Achievements without a rule are
+        # granted directly by the event or command that earns them.
+        self.achievement_rules = data.achievement_rules
+        # Achievement rewards: id -> {"coins": int, "items": {name: count}}
+        self.achievement_rewards = data.achievement_rewards
+
+        # metric -> (sorted thresholds, matching achievement ids), so a
+        # changed metric only has to look at the thresholds it just crossed
+        self._achievement_index: Dict[str, Tuple[List[int], List[str]]] = {}
+        for ach_id, (metric, threshold) in sorted(self.achievement_rules.items(), key=lambda kv: kv[1][1]):
+            thresholds, ids = self._achievement_index.setdefault(metric, ([], []))
+            thresholds.append(threshold)
+            ids.append(ach_id)
+
+        self.event_handlers = handlers
 
-        # Event registry
-        self.event_handlers = {
-            "nothing": (self._event_nothing, 35),
-            "junk": (self._event_junk, 6),
-            "fish": (self._event_fish, 28),
-            "double": (self._event_double, 5),
-            "shark": (self._event_shark, 3),
-            "break": (self._event_break, 4),
-            "treasure": (self._event_treasure, 4),
-            "bottle": (self._event_bottle, 4),
-            "storm": (self._event_storm, 2),
-            "net": (self._event_net, 3),
-            "bait_find": (self._event_bait_find, 5),
-            "lucky_streak": (self._event_lucky_streak, 1),
-            "curse": (self._event_curse, 1),
-            "merchant": (self._event_merchant, 2),
-            "pearl": (self._event_pearl, 2),
-            "map": (self._event_map, 1),
-            "sea_monster": (self._event_sea_monster, 1),
-            "hook_snag": (self._event_hook_snag, 3),
-            "festival": (self._event_festival, 1),
-            "charity": (self._event_charity, 1),
-            "salvage": (self._event_salvage, 2),
-            "message": (self._event_message, 2),
-            "bubble_burst": (self._event_bubble_burst, 4),
-            "kelp_tangle": (self._event_kelp_tangle, 3),
-            "whale_song": (self._event_whale_song, 1),
-            "siren_call": (self._event_siren_call, 1),
-            "tide_pool": (self._event_tide_pool, 3),
-            "meteor_shower": (self._event_meteor_shower, 1),
-            "coral_gift": (self._event_coral_gift, 2),
-            "water_sprite": (self._event_water_sprite, 3),
-            "whirlpool": (self._event_whirlpool, 2),
-            "fisherman_friend": (self._event_fisherman_friend, 2),
-            "barnacle_pearl": (self._event_barnacle_pearl, 2),
-            "crystal_wash": (self._event_crystal_wash, 1),
-            "echo_call": (self._event_echo_call, 1),
-            "drifting_crate": (self._event_drifting_crate, 2),
-            "phantom_net": (self._event_phantom_net, 2),
-            "lazy_sun": (self._event_lazy_sun, 2),
-            "thunder_clap": (self._event_thunder_clap, 1),
-            "sponge_cache": (self._event_sponge_cache, 3),
-            "tide_change": (self._event_tide_change, 1),
-            "moon_phase": (self._event_moon_phase, 1),
-            "rift_glimpse": (self._event_rift_glimpse, 1),
-            "luminous_cavern": (self._event_luminous_cavern, 2),
-            "prehistoric_trench": (self._event_prehistoric_trench, 2),
-            "smoldering_pool":   (self._event_smoldering_pool,  2),
-            "lava_spout":        (self._event_lava_spout,       2),
-            "phantom_tide":      (self._event_phantom_tide,     2),
-            "haunted_whispers":  (self._event_haunted_whispers, 2),
-            "dream_reverie":     (self._event_dream_reverie,    2),
-            "nightmare_bloom":   (self._event_nightmare_bloom,  2),
-            "titan_quake":       (self._event_titan_quake,      2),
-            "deepwyrm_raise":    (self._event_deepwyrm_raise,   2),
-            "cavern_glow":       (self._event_cavern_glow,      2),
-            "ethereal_gust":     (self._event_ethereal_gust,    2),
-            "volcanic_spring": (self._event_volcanic_spring,    2),
-            "haunted_shoal":   (self._event_haunted_shoal,      2),
-            "find_reel": (self._event_find_reel, 1),
-            "find_line": (self._event_find_line, 1),
-            "find_lure": (self._event_find_lure, 1),            
-        }
-        
         # ——— Pre-cache keys & base weights for faster picks ———
         self._event_keys          = list(self.event_handlers)
         self._event_base_weights  = [self.event_handlers[k][1] for k in self._event_keys]
 
-        # Pre-cache fish name/weight arrays
-        self._fish_names    = list(self.fish_definitions)
-        self._fish_weights  = [info["weight"] for info in self.fish_definitions.values()]
-        # ————————————————————————————————————————————————
+        self._event_modifiers.clear()
+        self._event_tables.clear()
+        self.register_event_modifier("bait", {"fish": 1.6, "double": 1.6})
+        # buffs apply under their own id while they run
+        for buff_id, buff in data.buffs.items():
+            if buff.events:
+                self.register_event_modifier(buff_id, buff.events)
+        # rod level + equipped gear, one profile (and event modifier) per
+        # combination in use, registered under the profile key
+        self._rod_profiles: Dict[str, RodProfile] = {}
+        # warm the cache with every bait x luck x bare rod level combination
+        for level in self.rod_level_fish_multiplier:
+            rod = (self._rod_profile_for(level, {}).key,)
+            for bait in ((), ("bait",)):
+                for luck in ((), ("luck",)):
+                    self._event_table(bait + luck + rod)
+
+        # Pre-cache fish sampling tables: one for the whole pool, one on foot
+        # (key None) and one per vessel covering the biomes it unlocks
+        self._fish_table = WeightedTable(
+            self.fish_definitions, (info["weight"] for info in self.fish_definitions.values())
+        )
+        self._vessel_fish_tables: Dict[Optional[str], WeightedTable] = {
+            None: self._build_fish_table(self.base_biomes)
+        }
+        for vessel, vdef in self.vessel_definitions.items():
+            self._vessel_fish_tables[vessel] = self._build_fish_table(
+                set(self.base_biomes) | set(vdef["unlock_biomes"])
+            )
+        # buff id -> rarity multipliers, and (vessel, rod profile key, buff
+        # ids) -> the vessel table with the rod's and buffs' rarity bias
+        # applied, built the first time that mix is fished
+        self._fish_buffs: Dict[str, Dict[str, float]] = {
+            buff_id: buff.rarity for buff_id, buff in data.buffs.items() if buff.rarity
+        }
+        self._biased_fish_tables: Dict[Tuple[Optional[str], str, Tuple[str, ...]], WeightedTable] = {}
+
+        # Crafting pools: fish names cheapest first, overall and per rarity and
+        # biome, so the crafting resolver never sorts or filters the haul
+        by_price = lambda names: sorted(names, key=lambda n: self.fish_prices[n])
+        self._craft_pools: Dict[str, List[str]] = {"any_fish": by_price(data.fish)}
+        for rarity, names in data.fish_by_rarity.items():
+            self._craft_pools["rarity:" + rarity] = by_price(names)
+        for biome, names in data.fish_by_biome.items():
+            self._craft_pools["biome:" + biome] = by_price(names)
+
+        # anything rendered from the old definitions is stale
+        self.invalidate_pages()
+        self._balance = None
+        self._analytics = None
+
+    # ---------- Event weights ----------
+    def register_event_modifier(self, name: str, multipliers: Dict[str, float]):
+        """
+        Register (or replace) a named set of event-weight multipliers.
+        Gear is registered under its item name and applies while equipped.
+        """
+        self._event_modifiers[name] = dict(multipliers)
+        # drop every cached table that was built with the old definition
+        self._event_tables = {k: t for k, t in self._event_tables.items() if name not in k}
+
+    def _rod_profile_for(self, rod_level: int, equipment: Dict[str, Optional[str]]) -> RodProfile:
+        key = profile_key(rod_level, equipment)
+        profile = self._rod_profiles.get(key)
+        if profile is None:
+            profile = self._rod_profiles[key] = RodProfile.build(self._data, rod_level, equipment)
+            self.register_event_modifier(key, profile.events)
+        return profile
+
+    def _rod_profile(self, state: UserState) -> RodProfile:
+        """
+        The caster's rod profile. The key stored on the user is enough on
+        the usual path; it is rebuilt (and stored) after the rod or gear
+        changed, or when this process hasn't seen that setup yet.
+        """
+        profile = self._rod_profiles.get(state.rod_profile)
+        if profile is None:
+            profile = self._rod_profile_for(state.rod_level, state.equipment)
+            state.rod_profile = profile.key
+        return profile
+
+    def _active_event_modifiers(self, state: UserState) -> Tuple[str, ...]:
+        """Modifier names for this cast, in the order they are applied."""
+        active: List[str] = []
+        if state.bait > 0:
+            active.append("bait")
+        active.extend(b for b in state.active_buffs() if b in self._event_modifiers)
+        active.append(self._rod_profile(state).key)
+        return tuple(active)
+
+    def _event_table(self, active: Tuple[str, ...]) -> WeightedTable:
+        table = self._event_tables.get(active)
+        if table is None:
+            keys = self._event_keys
+            weights = list(self._event_base_weights)
+            for name in active:
+                mults = self._event_modifiers.get(name)
+                if not mults:
+                    continue
+                for i, k in enumerate(keys):
+                    if k in mults:
+                        weights[i] = int(weights[i] * mults[k])
+            table = WeightedTable(keys, [max(1, w) for w in weights])
+            self._event_tables[active] = table
+        return table
 
     # ---------- Helpers ----------
     def _random_fish(self) -> str:
-        # O(1) access to cached arrays
-        return random.choices(self._fish_names, weights=self._fish_weights, k=1)[0]
+        return self._fish_table.pick()
+
+    def _build_fish_table(self, biomes) -> WeightedTable:
+        allowed = set(biomes)
+        names, weights = [], []
+        for name, info in self.fish_definitions.items():
+            if info.get("biome") in allowed:
+                names.append(name)
+                weights.append(info.get("weight", 1))
+        # fallback if somehow empty
+        if not names:
+            return self._fish_table
+        return WeightedTable(names, weights)
+
+    def _buff_lines(self, state: UserState) -> List[str]:
+        """One line per running buff with what is left of it."""
+        lines = []
+        now = time.time()
+        for buff_id in state.active_buffs():
+            buff = state.buffs[buff_id]
+            info = self.buff_definitions.get(buff_id)
+            label = f"{info.emoji or ''} {info.name}".strip() if info else buff_id
+            left = []
+            if "casts" in buff:
+                left.append(f"{buff['casts']} cast{'s' if buff['casts'] != 1 else ''}")
+            if "until" in buff:
+                left.append(f"{max(1, int(buff['until'] - now) // 60)}m")
+            lines.append(f"{label} ({', '.join(left)})")
+        return lines
 
     async def _deposit(self, member, amount: int, ctx):
-        new_bal = await bank.deposit_credits(member, amount)
-        currency = await bank.get_currency_name(ctx.guild) if ctx and ctx.guild else "credits"
+        new_bal = await self._bank.deposit_credits(member, amount)
+        currency = await self._bank.get_currency_name(ctx.guild) if ctx and ctx.guild else "credits"
         return new_bal, currency
 
-    async def _has_achievement(self, user, ach_id: str) -> bool:
-        earned = await self.config.user(user).achievements()
-        return ach_id in earned
+    async def _load_state(self, user) -> UserState:
+        """
+        Unlocked snapshot of a user's whole document, for read-only commands.
+        Anything that writes uses ``self._states.session(user)`` instead.
+        """
+        return await self._states.load(user)
+
+    def _prepare_state(self, state: UserState):
+        state.use_tallies(self._fish_tally_keys, self._data.tally_version)
+        if not state.species_seen and state.caught:
+            self._seed_collection(state)
+
+    def _fish_tally_keys(self, name: str) -> Tuple[str, ...]:
+        return self._tally_keys.get(name, ())
 
-    async def _award_achievement(self, ctx, user, ach_id: str) -> Optional[str]:
+    def _on_state_commit(self, state: UserState):
+        self.leaderboard.update(state.user.id, state.stats)
+        if state.landed:
+            if self.catch_log is not None:
+                self.catch_log.record(state.user.id, state.landed)
+            state.landed = []
+
+    def _seed_collection(self, state: UserState):
+        """
+        One-off migration for documents written before species/biome
+        tracking: seed both from the current haul and re-check every rule.
+        """
+        mythics = 0
+        for name in dict.fromkeys(state.caught):
+            if state.see_species(name):
+                info = self.fish_definitions.get(name, {})
+                state.see_biome(info.get("biome"))
+                if info.get("rarity") == "Mythic":
+                    mythics += 1
+        state.new_species.clear()
+        if state.stats.get("mythic_catches", 0) < mythics:
+            state.set_stat("mythic_catches", mythics)
+        state.changed.update(self._achievement_index)
+
+    async def _award_achievement(self, ctx, state: UserState, ach_id: str) -> Optional[str]:
         if ach_id not in self.achievements:
             return None
-        
+
         # 1) Mark it earned
-        user_conf = self.config.user(user)
-        earned = await user_conf.achievements()
-        if ach_id in earned:
+        if not state.add_achievement(ach_id):
             return None
-        earned.append(ach_id)
-        await user_conf.achievements.set(earned)
-        
-        # 2) Figure out name/description
-        name, desc, _ = self.achievements[ach_id]
-        
-        # 3) Compute rewards
-        reward = 0
-        add_items: Dict[str, int] = {}
-        
-        # legacy small rewards
-        if ach_id in ("first_cast", "first_fish"):
-            reward = 5
-        
-        # existing larger rewards
-        if ach_id == "mythic_catch":
-            reward = 100
-        if ach_id == "treasure_hunter":
-            reward = 25
-        
-        # new achievement rewards
-        if ach_id == "first_chum":
-            reward = 10
-        if ach_id == "trophy_maker":
-            reward = 25
-        if ach_id == "fragment_collector":
-            reward = 50
-        if ach_id == "core_seeker":
-            reward = 150
-        if ach_id == "rod_master_1":
-            reward = 20
-        if ach_id == "rod_master_2":
-            reward = 60
-        if ach_id == "rod_master_3":
-            reward = 180
-        if ach_id == "npc_friend":
-            add_items = {"Chum": 1}
-        if ach_id == "quest_master":
-            reward = 300
-        if ach_id == "oceanographer":
-            reward = 200
-        if ach_id == "collector_100":
-            reward = 150
-        if ach_id == "seasoned_angler":
-            reward = 100
-        
-        # 4) Build announcement text
-        currency = await bank.get_currency_name(ctx.guild) if ctx and ctx.guild else "credits"
+        user = state.user
+
+        # 2) Figure out name/description and rewards
+        ach = self.achievements[ach_id]
+        name, desc = ach.name, ach.description
+        reward_def = self.achievement_rewards.get(ach_id, {})
+        reward = reward_def.get("coins", 0)
+        add_items: Dict[str, int] = reward_def.get("items", {})
+
+        # 3) Build announcement text
+        currency = await self._bank.get_currency_name(ctx.guild) if ctx and ctx.guild else "credits"
         parts: List[str] = [f"🏆 Achievement unlocked: **{name}** — {desc}"]
-        
-        # 5) Deposit coins if any
+
+        # 4) Deposit coins if any
         if reward > 0:
-            new_bal = await bank.deposit_credits(user, reward)
+            new_bal = await self._bank.deposit_credits(user, reward)
             parts.append(f"You received **{reward} {currency}**! New balance: **{new_bal} {currency}**.")
-        
-        # 6) Grant any item-only rewards
+
+        # 5) Grant any item-only rewards
         if add_items:
-            items_cfg = await user_conf.items()
             for iname, cnt in add_items.items():
-                for _ in range(cnt):
-                    items_cfg.append(iname)
-            await user_conf.items.set(items_cfg)
+                state.add_item(iname, cnt)
             added = ", ".join(f"{c}× {n}" for n, c in add_items.items())
             parts.append(f"You also received {added}.")
-        
-        text = "\n".join(parts)
 
-        return text
+        return "\n".join(parts)
 
+    def _achievement_metric(self, state: UserState, metric: str) -> int:
+        if metric == "rod_level":
+            return state.rod_level
+        if metric.startswith("item:"):
+            return state.item_count(metric[5:])
+        return state.stats.get(metric, 0)
 
+    async def _check_and_award(self, ctx, state: UserState) -> List[str]:
+        """
+        Evaluate achievements once for a command: everything queued with
+        ``state.grant`` plus the rules whose metric changed and whose
+        threshold has now been reached.
+        Returns the announcement lines for anything newly earned.
+        """
+        # fold newly seen species into biome coverage
+        for name in state.new_species:
+            state.see_biome(self.fish_definitions.get(name, {}).get("biome"))
+        state.new_species.clear()
+
+        earned = set(state.achievements)
+        due = list(state.granted)
+        state.granted.clear()
+        for metric in state.changed:
+            entry = self._achievement_index.get(metric)
+            if not entry:
+                continue
+            thresholds, ids = entry
+            reached = bisect.bisect_right(thresholds, self._achievement_metric(state, metric))
+            for ach_id in ids[:reached]:
+                if ach_id not in earned and ach_id not in due:
+                    due.append(ach_id)
+        state.changed.clear()
 
-    async def _check_and_award(self, ctx, user) -> List[str]:
-        user_conf = self.config.user(user)
-        stats = await user_conf.stats()
-        caught = await user_conf.caught()
-        earned = await user_conf.achievements()
         messages: List[str] = []
-
-        if stats.get("casts", 0) >= 1 and "first_cast" not in earned:
-            m = await self._award_achievement(ctx, user, "first_cast")
+        for ach_id in due:
+            m = await self._award_achievement(ctx, state, ach_id)
             if m:
                 messages.append(m)
-
-        # Mythic‐catch: did they ever catch a Mythic?
-        if any(self.fish_definitions.get(f,{}).get("rarity") == "Mythic" for f in caught) \
-           and "mythic_catch" not in earned:
-            m = await self._award_achievement(ctx, user, "mythic_catch")
-            if m:
-                messages.append(m)
-
-        # Oceanographer: caught every biome?
-        try:
-            caught_biomes = {self.fish_definitions[f]["biome"]
-                             for f in set(caught) if f in self.fish_definitions}
-            all_biomes = {info["biome"] for info in self.fish_definitions.values()}
-            if all_biomes and caught_biomes >= all_biomes and "oceanographer" not in earned:
-                m = await self._award_achievement(ctx, user, "oceanographer")
-                if m:
-                    messages.append(m)
-        except Exception:
-            pass                
-
-        if stats.get("fish_caught", 0) >= 1 and "first_fish" not in earned:
-            m = await self._award_achievement(ctx, user, "first_fish")
-            if m:
-                messages.append(m)
-
-        if stats.get("fish_caught", 0) >= 10 and "fish_10" not in earned:
-            m = await self._award_achievement(ctx, user, "fish_10")
-            if m:
-                messages.append(m)
-
-        if stats.get("fish_caught", 0) >= 100 and "fish_100" not in earned:
-            m = await self._award_achievement(ctx, user, "fish_100")
-            if m:
-                messages.append(m)
-
-        unique = len(set(x for x in caught if x and not x.lower().startswith("treasure")))
-        if unique >= 5 and "unique_5" not in earned:
-            m = await self._award_achievement(ctx, user, "unique_5")
-            if m:
-                messages.append(m)
-        if unique >= 25 and "unique_25" not in earned:
-            m = await self._award_achievement(ctx, user, "unique_25")
-            if m:
-                messages.append(m)
-
-        if stats.get("sell_total", 0) >= 1000 and "sell_1000" not in earned:
-            m = await self._award_achievement(ctx, user, "sell_1000")
-            if m:
-                messages.append(m)
-
-        if stats.get("bait_collected_total", 0) >= 20 and "bait_collector" not in earned:
-            m = await self._award_achievement(ctx, user, "bait_collector")
-            if m:
-                messages.append(m)
-
-                # Epic streak: 3 epics in a row
-        if stats.get("consecutive_catches", 0) >= 3 and "epic_streak_3" not in earned:
-            m = await self._award_achievement(ctx, user, "epic_streak_3")
-            if m: messages.append(m)
-
-        # Double Trouble: 5 double‐catch events
-        if stats.get("double_events", 0) >= 5 and "double_trouble" not in earned:
-            m = await self._award_achievement(ctx, user, "double_trouble")
-            if m: messages.append(m)
-
-        # Treasure Collector: 5 chests found
-        if stats.get("treasure_found", 0) >= 5 and "treasure_collect" not in earned:
-            m = await self._award_achievement(ctx, user, "treasure_collect")
-            if m: messages.append(m)
-
-        # Pearl Hoarder: 3 pearls
-        if stats.get("pearl_found", 0) >= 3 and "pearl_hoarder" not in earned:
-            m = await self._award_achievement(ctx, user, "pearl_hoarder")
-            if m: messages.append(m)
-
-        # Map Explorer: 3 maps
-        if stats.get("map_found", 0) >= 3 and "map_explorer" not in earned:
-            m = await self._award_achievement(ctx, user, "map_explorer")
-            if m: messages.append(m)
-
-        # Festival Fan: 3 festival events
-        if stats.get("festival_events", 0) >= 3 and "festival_fan" not in earned:
-            m = await self._award_achievement(ctx, user, "festival_fan")
-            if m: messages.append(m)
-
-        # Salvage Expert: 20 salvage events
-        if stats.get("salvage_events", 0) >= 20 and "salvage_expert" not in earned:
-            m = await self._award_achievement(ctx, user, "salvage_expert")
-            if m: messages.append(m)
-
-        # Sea Legend: caught a boss fish
-        if stats.get("boss_catches", 0) >= 1 and "sea_legend" not in earned:
-            m = await self._award_achievement(ctx, user, "sea_legend")
-            if m: messages.append(m)
-
-        # Abyssal Finder: caught an Abyssal or Mythic
-        if stats.get("abyssal_catches", 0) >= 1 and "abyssal_finder" not in earned:
-            m = await self._award_achievement(ctx, user, "abyssal_finder")
-            if m: messages.append(m)
-
-        # Mythic Hunter: 3 mythic catches
-        if stats.get("mythic_catches", 0) >= 3 and "mythic_hunter" not in earned:
-            m = await self._award_achievement(ctx, user, "mythic_hunter")
-            if m: messages.append(m)
-
-        # Legend Chaser: 5 legendary catches
-        if stats.get("legendary_catches", 0) >= 5 and "legend_chaser" not in earned:
-            m = await self._award_achievement(ctx, user, "legend_chaser")
-            if m: messages.append(m)
-
-        # Collector: 100 unique fish
-        if stats.get("unique_fish", 0) >= 100 and "collector_100" not in earned:
-            m = await self._award_achievement(ctx, user, "collector_100")
-            if m: messages.append(m)
-
-        # Merchant of Mean: sell 500 total
-        if stats.get("sell_total", 0) >= 500 and "merchant_of_mean" not in earned:
-            m = await self._award_achievement(ctx, user, "merchant_of_mean")
-            if m: messages.append(m)
-
-        # Seasoned Angler: cast 1000 times
-        if stats.get("casts", 0) >= 1000 and "seasoned_angler" not in earned:
-            m = await self._award_achievement(ctx, user, "seasoned_angler")
-            if m: messages.append(m)
-
-        # Bait Baron: collect 100 bait
-        if stats.get("bait_collected_total", 0) >= 100 and "bait_hoarder_plus" not in earned:
-            m = await self._award_achievement(ctx, user, "bait_hoarder_plus")
-            if m: messages.append(m)
-
-        # Crafting Ace: craft every recipe (use crafts_done >= len recipes)
-        total_recipes = len(self.crafting_recipes)
-        if stats.get("crafts_done", 0) >= total_recipes and "crafting_ace" not in earned:
-            m = await self._award_achievement(ctx, user, "crafting_ace")
-            if m: messages.append(m)
-              
-
         return messages
 
 
-    async def _inc_stat(self, user, key: str, amount: int = 1):
-        conf = self.config.user(user)
-        stats = await conf.stats()
-        stats[key] = stats.get(key, 0) + amount
-        await conf.stats.set(stats)
-
-    async def _maybe_update_unique_and_highest(self, user, fish_name: str):
-        conf = self.config.user(user)
-        stats = await conf.stats()
-        caught = await conf.caught()
-        stats["fish_caught"] = stats.get("fish_caught", 0) + 1
-        stats["unique_fish"] = len(set(x for x in caught if x and not x.lower().startswith("treasure")))
+    def _maybe_update_unique_and_highest(self, state: UserState, fish_name: str):
+        # unique_fish is kept up to date by state.add_fish
+        state.inc_stat("fish_caught")
         price = self.fish_prices.get(fish_name, 0)
-        stats["highest_value_catch"] = max(stats.get("highest_value_catch", 0), price)
-        stats["consecutive_catches"] = stats.get("consecutive_catches", 0) + 1
-        await conf.stats.set(stats)
-        
-    async def _random_fish_for_user(self, user) -> str:
+        if price > state.stats.get("highest_value_catch", 0):
+            state.set_stat("highest_value_catch", price)
+        state.inc_stat("consecutive_catches")
+
+    def _record_catch(self, state: UserState, fish_name: str):
+        """Add a catch to the user's haul and update catch stats and quest progress."""
+        state.add_fish(fish_name)
+        if state.cast_origin is not None:
+            state.landed.append((int(time.time()), *state.cast_origin, fish_name))
+        rarity = self.fish_definitions.get(fish_name, {}).get("rarity")
+        if rarity == "Boss":
+            state.inc_stat("boss_catches")
+        if rarity in ("Abyssal", "Mythic"):
+            state.inc_stat("abyssal_catches")
+        if rarity == "Mythic":
+            state.inc_stat("mythic_catches")
+        if rarity == "Legendary":
+            state.inc_stat("legendary_catches")
+        self._maybe_update_unique_and_highest(state, fish_name)
+        self._advance_quest_on_catch(state, fish_name)
+
+    def _random_fish_for_user(self, state: UserState) -> str:
         """
         Choose a fish weighted by the biomes the player can access
         (on-foot + any unlocked by their vessel).
         """
-        # base biomes
-        allowed = set(self.base_biomes)
-        vessel = await self.config.user(user).vessel()
-        if vessel and vessel in self.vessel_definitions:
-            allowed |= set(self.vessel_definitions[vessel]["unlock_biomes"])
+        vessel = state.vessel if state.vessel in self._vessel_fish_tables else None
+        rod = self._rod_profile(state)
+        buffs = tuple(b for b in state.cast_buffs if b in self._fish_buffs)
+        if not buffs and not rod.rarity:
+            return self._vessel_fish_tables[vessel].pick()
+        key = (vessel, rod.key if rod.rarity else "", buffs)
+        table = self._biased_fish_tables.get(key)
+        if table is None:
+            base = self._vessel_fish_tables[vessel]
+            weights = [self.fish_definitions[n].weight for n in base.keys]
+            for mults in (rod.rarity, *(self._fish_buffs[b] for b in buffs)):
+                weights = [
+                    w * mults.get(self.fish_definitions[n].rarity, 1) for n, w in zip(base.keys, weights)
+                ]
+            table = self._biased_fish_tables[key] = WeightedTable(base.keys, weights)
+        return table.pick()
 
-        # build lists of fish that match allowed biomes
-        names, weights = [], []
-        for name, info in self.fish_definitions.items():
-            if info.get("biome") in allowed:
-                names.append(name)
-                weights.append(info.get("weight", 1))
-
-        # fallback if somehow empty
-        if not names:
-            return self._random_fish()
-        return random.choices(names, weights=weights, k=1)[0]
 
-           
     # ---------- Event handlers ----------
-    async def _event_nothing(self, ctx, user_conf):
-        stats = await user_conf.stats()
-        stats["consecutive_catches"] = 0
-        await user_conf.stats.set(stats)
-        await self._inc_stat(ctx.author, "casts", 1)
+    # Every handler receives the command context and the caster's loaded
+    # UserState. Handlers only mutate the state; ``fish`` counts the cast
+    # and commits the document once after the handler returns.
+    async def _event_nothing(self, ctx, state):
+        state.set_stat("consecutive_catches", 0)
         return False, "…No bites this time. Better luck next cast!"
 
-    async def _event_junk(self, ctx, user_conf):
+    async def _event_junk(self, ctx, state):
         junk_items = [
             "an old boot",
             "a tin can",
@@ -1543,904 +550,561 @@ class Fishing(commands.Cog):
             "a fish skeleton",
         ]
         item = random.choice(junk_items)
-        await self._inc_stat(ctx.author, "casts", 1)
         return False, f"👎 You pulled up {item}. Better luck next time!"
 
-    async def _event_fish(self, ctx, user_conf):
-        catch = await self._random_fish_for_user(ctx.author)
-        data = await user_conf.caught()
-        data.append(catch)
-        await user_conf.caught.set(data)
+    async def _event_fish(self, ctx, state):
+        catch = self._random_fish_for_user(state)
+        self._record_catch(state, catch)
         info = self.fish_definitions[catch]
-        if info["rarity"] == "Boss":
-            await self._inc_stat(ctx.author, "boss_catches", 1)
-        if info["rarity"] in ("Abyssal", "Mythic"):
-            await self._inc_stat(ctx.author, "abyssal_catches", 1)
-        if info["rarity"] == "Mythic":
-            await self._inc_stat(ctx.author, "mythic_catches", 1)
-        if info["rarity"] == "Legendary":
-            await self._inc_stat(ctx.author, "legendary_catches", 1)        
-        await self._maybe_update_unique_and_highest(ctx.author, catch)
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._advance_quest_on_catch(ctx.author, catch)
-        msgs = await self._check_and_award(ctx, ctx.author)
-        info = self.fish_definitions[catch]
-        base = f"{info['emoji']} You caught a **{catch}** ({info['rarity']})!"
-        if msgs:
-            return False, base + "\n\n" + "\n".join(msgs)
-        return False, base
-
-    async def _event_double(self, ctx, user_conf):
-        catch1 = await self._random_fish_for_user(ctx.author)
-        catch2 = await self._random_fish_for_user(ctx.author)
-        data = await user_conf.caught()
-        data.extend([catch1, catch2])
-        await user_conf.caught.set(data)
-        await self._maybe_update_unique_and_highest(ctx.author, catch1)
-        await self._maybe_update_unique_and_highest(ctx.author, catch2)
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._inc_stat(ctx.author, "double_events", 1)
-        await self._advance_quest_on_catch(ctx.author, catch1)
-        await self._advance_quest_on_catch(ctx.author, catch2)
-        msg_ach = None
-        if not await self._has_achievement(ctx.author, "double_catch"):
-            msg_ach = await self._award_achievement(ctx, ctx.author, "double_catch")
+        return False, f"{info['emoji']} You caught a **{catch}** ({info['rarity']})!"
+
+    async def _event_double(self, ctx, state):
+        catch1 = self._random_fish_for_user(state)
+        catch2 = self._random_fish_for_user(state)
+        self._record_catch(state, catch1)
+        self._record_catch(state, catch2)
+        state.inc_stat("double_events")
+        state.grant("double_catch")
         info1 = self.fish_definitions[catch1]
         info2 = self.fish_definitions[catch2]
-        base = f"{info1['emoji']}{info2['emoji']} Double catch! You got **{catch1}** and **{catch2}**!"
-        other_msgs = await self._check_and_award(ctx, ctx.author)
-        parts = [base]
-        if msg_ach:
-            parts.append(msg_ach)
-        if other_msgs:
-            parts.extend(other_msgs)
-        return False, "\n\n".join(parts)
-
-    async def _event_shark(self, ctx, user_conf):
-        data = await user_conf.caught()
-        if data:
-            lost = data.pop()
-            await user_conf.caught.set(data)
-            await self._inc_stat(ctx.author, "casts", 1)
-            stats = await user_conf.stats()
-            stats["consecutive_catches"] = 0
-            await user_conf.stats.set(stats)
+        return False, f"{info1['emoji']}{info2['emoji']} Double catch! You got **{catch1}** and **{catch2}**!"
+
+    async def _event_shark(self, ctx, state):
+        lost = state.pop_last_fish()
+        if lost:
+            state.set_stat("consecutive_catches", 0)
             return False, f"🦈 A shark snatches your **{lost}**! Ouch."
-        await self._inc_stat(ctx.author, "casts", 1)
         return False, "🦈 A shark swims by, but you had nothing yet to lose."
 
-    async def _event_break(self, ctx, user_conf):
-        await user_conf.rod_broken.set(True)
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_break(self, ctx, state):
+        state.rod_broken = True
         return False, "Snap! Your rod just broke. You’ll need to repair it."
 
-    async def _event_treasure(self, ctx, user_conf):
+    async def _event_treasure(self, ctx, state):
         coins = random.randint(10, 60)
         new_bal, currency = await self._deposit(ctx.author, coins, ctx)
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._inc_stat(ctx.author, "treasure_found", 1)
+        state.inc_stat("treasure_found")
         # small chance for rod fragment
+        fragmsg = ""
         if random.random() < 0.06:
-            items = await user_conf.items()
-            items.append("Rod Fragment")
-            await user_conf.items.set(items)
-        try:
-            if not await self._has_achievement(ctx.author, "fragment_collector"):
-                items_now = await user_conf.items()
-                if items_now.count("Rod Fragment") >= 10:
-                    await self._award_achievement(ctx, ctx.author, "fragment_collector")
-        except Exception:
-            pass
+            state.add_item("Rod Fragment")
             fragmsg = " You also find a **Rod Fragment** among the loot!"
-        else:
-            fragmsg = ""
-        msg_ach = None
-        if not await self._has_achievement(ctx.author, "treasure_hunter"):
-            msg_ach = await self._award_achievement(ctx, ctx.author, "treasure_hunter")
-        base = f"🎁 You hauled up a treasure chest and got **{coins} {currency}**! Your new balance is **{new_bal} {currency}**.{fragmsg}"
-        if msg_ach:
-            return False, base + "\n\n" + msg_ach
-        return False, base
-
-    async def _event_bottle(self, ctx, user_conf):
+        state.grant("treasure_hunter")
+        return False, f"🎁 You hauled up a treasure chest and got **{coins} {currency}**! Your new balance is **{new_bal} {currency}**.{fragmsg}"
+
+    async def _event_bottle(self, ctx, state):
         coins = random.randint(5, 30)
         new_bal, currency = await self._deposit(ctx.author, coins, ctx)
-        await self._inc_stat(ctx.author, "casts", 1)
         return False, f"📜 You found a message in a bottle and earned **{coins} {currency}**! Your new balance is **{new_bal} {currency}**."
 
-    async def _event_storm(self, ctx, user_conf):
+    async def _event_storm(self, ctx, state):
         if random.random() < 0.2:
-            await user_conf.rod_broken.set(True)
-            await self._inc_stat(ctx.author, "casts", 1)
+            state.rod_broken = True
             return False, "⛈️ A sudden storm! Your line snaps back and your rod breaks."
-        await self._inc_stat(ctx.author, "casts", 1)
         # 10% chance to salvage a Storm Scale from the storm
         scale_msg = ""
         if random.random() < 0.10:
-            items = await user_conf.items()
-            items.append("Storm Scale")
-            await user_conf.items.set(items)
+            state.add_item("Storm Scale")
             scale_msg = " Amid the thunder you retrieve a **Storm Scale**!"
 
         return False, f"⛈️ A sudden storm! Your line snaps back with nothing to show.{scale_msg}"
 
-    async def _event_net(self, ctx, user_conf):
+    async def _event_net(self, ctx, state):
         net_fish_count = random.randint(1, 5)
         caught = [self._random_fish() for _ in range(net_fish_count)]
-        data = await user_conf.caught()
-        data.extend(caught)
-        await user_conf.caught.set(data)
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._inc_stat(ctx.author, "net_events", 1)
-        if net_fish_count >= 5 and not await self._has_achievement(ctx.author, "net_haul"):
-            net_msg = await self._award_achievement(ctx, ctx.author, "net_haul")
-            if net_msg:
-                base = f"🕸️ You snagged an old net with {net_fish_count} things tangled inside: {', '.join(caught)}."
-                return False, f"{base}\n\n{net_msg}"
+        for name in caught:
+            self._record_catch(state, name)
+        state.inc_stat("net_events")
+        names = ", ".join(caught)
+        base = f"🕸️ You snagged an old net with {net_fish_count} things tangled inside: {names}."
+        if net_fish_count >= 5:
+            state.grant("net_haul")
+        found = ""
         if random.random() < 0.08:
-            items = await user_conf.items()
-            items.append("Rod Fragment")
-            await user_conf.items.set(items)
-        try:
-            if not await self._has_achievement(ctx.author, "fragment_collector"):
-                items_now = await user_conf.items()
-                if items_now.count("Rod Fragment") >= 10:
-                    await self._award_achievement(ctx, ctx.author, "fragment_collector")
-        except Exception:
-            pass            
+            state.add_item("Rod Fragment")
             found = " You also find a **Rod Fragment** tangled in the net."
-        else:
-            found = ""
-        names = ", ".join(caught)
-        for f in caught:
-            await self._advance_quest_on_catch(ctx.author, f)
-        return False, f"🕸️ You snagged an old net with {net_fish_count} things tangled inside: {names}.{found}"
+        return False, f"{base}{found}"
 
-    async def _event_bait_find(self, ctx, user_conf):
+    async def _event_bait_find(self, ctx, state):
         bait_found = random.randint(1, 5)
-        current_bait = await user_conf.bait()
-        await user_conf.bait.set(current_bait + bait_found)
-        await self._inc_stat(ctx.author, "casts", 1)
-        stats = await user_conf.stats()
-        stats["bait_collected_total"] = stats.get("bait_collected_total", 0) + bait_found
-        await user_conf.stats.set(stats)
-        msgs = []
-        if stats["bait_collected_total"] >= 20 and not await self._has_achievement(ctx.author, "bait_collector"):
-            m = await self._award_achievement(ctx, ctx.author, "bait_collector")
-            if m:
-                msgs.append(m)
-        base = f"🪱 You found **{bait_found}** bait in the mud. You now have **{current_bait + bait_found}** bait."
-        if msgs:
-            return False, base + "\n\n" + "\n".join(msgs)
-        return False, base
-
-    async def _event_lucky_streak(self, ctx, user_conf):
-        await user_conf.luck.set(5)
-        await self._inc_stat(ctx.author, "casts", 1)
+        state.bait += bait_found
+        state.inc_stat("bait_collected_total", bait_found)
+        return False, f"🪱 You found **{bait_found}** bait in the mud. You now have **{state.bait}** bait."
+
+    async def _event_lucky_streak(self, ctx, state):
+        state.luck = 5
         return False, "✨ Lucky streak! Your next few casts are more likely to find rare fish."
 
-    async def _event_curse(self, ctx, user_conf):
+    async def _event_curse(self, ctx, state):
         if random.random() < 0.5:
             loss = random.randint(5, 25)
-            bal = await bank.get_balance(ctx.author)
+            bal = await self._bank.get_balance(ctx.author)
             if bal >= loss:
-                await bank.withdraw_credits(ctx.author, loss)
-                currency = await bank.get_currency_name(ctx.guild)
-                await self._inc_stat(ctx.author, "casts", 1)
+                await self._bank.withdraw_credits(ctx.author, loss)
+                currency = await self._bank.get_currency_name(ctx.guild)
                 return False, f"🔮 An old charm curses you — you lost **{loss} {currency}**."
-        await user_conf.rod_broken.set(True)
-        await self._inc_stat(ctx.author, "casts", 1)
+        state.rod_broken = True
         return False, "🔮 A cursed tug! Your rod is damaged by some dark force."
 
-    async def _event_merchant(self, ctx, user_conf):
-        inventory = await user_conf.caught()
-        await self._inc_stat(ctx.author, "casts", 1)
-        if not inventory:
+    async def _event_merchant(self, ctx, state):
+        fish = state.random_fish()
+        if not fish:
             tips = random.randint(1, 10)
             new_bal, currency = await self._deposit(ctx.author, tips, ctx)
             return False, f"🧑‍🚀 A traveling merchant stops by and leaves **{tips} {currency}** as thanks."
-        fish = random.choice(inventory)
         premium = int(self.fish_prices.get(fish, 10) * random.uniform(1.2, 2.0))
-        inventory.remove(fish)
-        await user_conf.caught.set(inventory)
+        state.remove_fish(fish)
         new_bal, currency = await self._deposit(ctx.author, premium, ctx)
         return False, f"🧑‍🚀 A merchant offers **{premium} {currency}** for your **{fish}** and buys it on the spot. New balance: **{new_bal} {currency}**."
 
-    async def _event_pearl(self, ctx, user_conf):
+    async def _event_pearl(self, ctx, state):
         value = random.randint(50, 150)
         new_bal, currency = await self._deposit(ctx.author, value, ctx)
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._inc_stat(ctx.author, "pearl_found", 1)
-        
+        state.inc_stat("pearl_found")
+
         # give the player a Pearl item
-        items = await user_conf.items()
-        items.append("Pearl")
-        await user_conf.items.set(items)
-        
-        msg_ach = None
-        if not await self._has_achievement(ctx.author, "pearl_finder"):
-            msg_ach = await self._award_achievement(ctx, ctx.author, "pearl_finder")
-        
-        base = (
+        state.add_item("Pearl")
+
+        state.grant("pearl_finder")
+
+        return False, (
             f"💎 You found a lustrous pearl worth **{value} {currency}**, "
             f"and received a **Pearl** item. Your new balance is **{new_bal} {currency}**."
         )
-        if msg_ach:
-            return False, base + "\n\n" + msg_ach
-        return False, base
-
-    async def _event_map(self, ctx, user_conf):
-        items = await user_conf.items()
-        items.append("Treasure Map")
-        await user_conf.items.set(items)
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._inc_stat(ctx.author, "map_found", 1)
-        if not await self._has_achievement(ctx.author, "map_collector"):
-            msg = await self._award_achievement(ctx, ctx.author, "map_collector")
-            if msg:
-                return False, "🗺️ You found a Treasure Map! Use it later to start a treasure hunt.\n\n" + msg
+
+    async def _event_map(self, ctx, state):
+        state.add_item("Treasure Map")
+        state.inc_stat("map_found")
+        state.grant("map_collector")
         return False, "🗺️ You found a Treasure Map! Use it later to start a treasure hunt."
 
-    async def _event_sea_monster(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_sea_monster(self, ctx, state):
         if random.random() < 0.5:
-            data = await user_conf.caught()
-            lost = []
-            for _ in range(min(3, len(data))):
-                lost.append(data.pop(random.randrange(len(data))))
-            await user_conf.caught.set(data)
+            lost = state.pop_random_fish(3)
             return False, f"🪸 A sea monster thrashes by and steals: {', '.join(lost)}! Escape barely."
         else:
             rare = self._random_fish()
-            data = await user_conf.caught()
-            data.append(rare)
-            await user_conf.caught.set(data)
-            await self._maybe_update_unique_and_highest(ctx.author, rare)
-            if not await self._has_achievement(ctx.author, "sea_monster_survivor"):
-                msg = await self._award_achievement(ctx, ctx.author, "sea_monster_survivor")
-                if msg:
-                    return False, f"🪸 You managed to hook a **{rare}** from the sea monster's grip!\n\n{msg}"
+            self._record_catch(state, rare)
+            state.grant("sea_monster_survivor")
             return False, f"🪸 You managed to hook a **{rare}** from the sea monster's grip!"
 
-    async def _event_hook_snag(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_hook_snag(self, ctx, state):
         if random.random() < 0.6:
-            await user_conf.rod_broken.set(True)
+            state.rod_broken = True
             return False, "⛓️ Your hook snagged on something sharp and your rod snapped!"
         return False, "⛓️ Your hook snagged on an old anchor but you freed it."
 
-    async def _event_festival(self, ctx, user_conf):
-        await user_conf.luck.set(3)
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._inc_stat(ctx.author, "festival_events", 1)
+    async def _event_festival(self, ctx, state):
+        state.luck = 3
+        state.inc_stat("festival_events")
         return False, "🎉 Festival of Fishermen! Sold fish pay more for a short while."
 
-    async def _event_charity(self, ctx, user_conf):
-        bal = await bank.get_balance(ctx.author)
+    async def _event_charity(self, ctx, state):
+        bal = await self._bank.get_balance(ctx.author)
         donation = min(random.randint(1, 10), bal)
         if donation > 0:
-            await bank.withdraw_credits(ctx.author, donation)
-            currency = await bank.get_currency_name(ctx.guild)
-            await self._inc_stat(ctx.author, "casts", 1)
+            await self._bank.withdraw_credits(ctx.author, donation)
+            currency = await self._bank.get_currency_name(ctx.guild)
             return False, f"🤝 You gave **{donation} {currency}** to a community cause."
-        await self._inc_stat(ctx.author, "casts", 1)
         return False, "🤝 You feel generous but have no funds to donate."
 
-    async def _event_salvage(self, ctx, user_conf):
+    async def _event_salvage(self, ctx, state):
         coins = random.randint(5, 40)
         new_bal, currency = await self._deposit(ctx.author, coins, ctx)
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._inc_stat(ctx.author, "salvage_events", 1)
+        state.inc_stat("salvage_events")
         r = random.random()
         if r < 0.03:
-            items = await user_conf.items()
-            items.append("Rod Core")
-            await user_conf.items.set(items)
-        try:
-            if not await self._has_achievement(ctx.author, "core_seeker"):
-                await self._award_achievement(ctx, ctx.author, "core_seeker")
-        except Exception:
-            pass            
+            state.add_item("Rod Core")
             return False, f"🛠️ You salvage rare parts, get **{coins} {currency}** and a **Rod Core**!"
         if r < 0.10:
-            items = await user_conf.items()
-            items.append("Rod Fragment")
-            await user_conf.items.set(items)
-        try:
-            if not await self._has_achievement(ctx.author, "fragment_collector"):
-                items_now = await user_conf.items()
-                if items_now.count("Rod Fragment") >= 10:
-                    await self._award_achievement(ctx, ctx.author, "fragment_collector")
-        except Exception:
-            pass            
+            state.add_item("Rod Fragment")
             return False, f"🛠️ You salvage pieces, get **{coins} {currency}** and a **Rod Fragment**!"
         if random.random() < 0.15:
-            items = await user_conf.items()
-            items.append("Treasure Map")
-            await user_conf.items.set(items)
-            await self._inc_stat(ctx.author, "map_found", 1)
+            state.add_item("Treasure Map")
+            state.inc_stat("map_found")
             return False, f"🛠️ You salvage usable pieces and find **{coins} {currency}** and a **Treasure Map**!"
         return False, f"🛠️ You salvage metal and get **{coins} {currency}**."
 
-    async def _event_message(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_message(self, ctx, state):
         if random.random() < 0.5:
             bait = random.randint(1, 3)
-            current = await user_conf.bait()
-            await user_conf.bait.set(current + bait)
-            return False, f"✉️ A friendly note contains **{bait}** bait. You now have **{current + bait}** bait."
+            state.bait += bait
+            return False, f"✉️ A friendly note contains **{bait}** bait. You now have **{state.bait}** bait."
         else:
             coins = random.randint(5, 20)
             new_bal, currency = await self._deposit(ctx.author, coins, ctx)
             return False, f"✉️ You find **{coins} {currency}** tucked in a note. New balance: **{new_bal} {currency}**."
-            
-    async def _event_bubble_burst(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+
+    async def _event_bubble_burst(self, ctx, state):
         if random.random() < 0.25:
             # small fish
             catch = self._random_fish()
-            data = await user_conf.caught()
-            data.append(catch)
-            await user_conf.caught.set(data)
-            await self._maybe_update_unique_and_highest(ctx.author, catch)
+            self._record_catch(state, catch)
             return False, f" bubbles! You spot a small fish and catch a **{catch}**!"
         else:
             bait = random.randint(1, 2)
-            current = await user_conf.bait()
-            await user_conf.bait.set(current + bait)
+            state.bait += bait
             return False, f" Bubbles reveal some bait. You found **{bait}** bait."
 
-    async def _event_kelp_tangle(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_kelp_tangle(self, ctx, state):
         if random.random() < 0.15:
-            data = await user_conf.caught()
-            data.append("Seagrass Fish")
-            await user_conf.caught.set(data)
-            await self._maybe_update_unique_and_highest(ctx.author, "Seagrass Fish")
+            self._record_catch(state, "Seagrass Fish")
             return False, "🪴 Your line tangles in kelp but you free a **Seagrass Fish**!"
         return False, "🪴 Your line gets tangled in kelp — nothing worth keeping this time."
 
-    async def _event_whale_song(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
-        await user_conf.luck.set((await user_conf.luck()) + 3)
+    async def _event_whale_song(self, ctx, state):
+        state.luck += 3
         return False, "🐋 A whale sings — your luck rises for a few casts."
 
-    async def _event_siren_call(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_siren_call(self, ctx, state):
         r = random.random()
         if r < 0.12:
             # mythic reward
             catch = self._random_fish()
-            data = await user_conf.caught()
-            data.append(catch)
-            await user_conf.caught.set(data)
-            await self._maybe_update_unique_and_highest(ctx.author, catch)
+            self._record_catch(state, catch)
             return False, f"🧜 A siren lures something incredible — you catch a **{catch}**!"
         if r < 0.35:
             # lose an item
-            items = await user_conf.items()
-            if items:
-                lost = items.pop(random.randrange(len(items)))
-                await user_conf.items.set(items)
+            lost = state.pop_random_item()
+            if lost:
                 return False, f"🧜 A siren's song steals **{lost}** from you!"
         return False, "🧜 A haunting song passes by. You steady the line and move on."
 
-    async def _event_tide_pool(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_tide_pool(self, ctx, state):
         count = random.randint(2, 5)
         caught = [self._random_fish() for _ in range(count)]
-        data = await user_conf.caught()
-        data.extend(caught)
-        await user_conf.caught.set(data)
         for c in caught:
-            await self._maybe_update_unique_and_highest(ctx.author, c)
+            self._record_catch(state, c)
         return False, f"🌊 You explore a tide pool and net {len(caught)} fish: {', '.join(caught)}."
 
-    async def _event_meteor_shower(self, ctx, user_conf):
-      await self._inc_stat(ctx.author, "cosmic_events", 1)
+    async def _event_meteor_shower(self, ctx, state):
+      state.inc_stat("cosmic_events")
 
-      # try awarding the achievement and capture its message
-      ach_msg = None
-      if not await self._has_achievement(ctx.author, "cosmic_watcher"):
-          ach_msg = await self._award_achievement(ctx, ctx.author, "cosmic_watcher")
+      state.grant("cosmic_watcher")
 
       if random.random() < 0.10:
           # celestial fish
           catch = "Star Pike"
-          data = await user_conf.caught()
-          data.append(catch)
-          await user_conf.caught.set(data)
-          await self._maybe_update_unique_and_highest(ctx.author, catch)
+          self._record_catch(state, catch)
           base = "☄️ Meteor light guides you to a **Star Pike**!"
       else:
           coins = random.randint(10, 50)
           new_bal, currency = await self._deposit(ctx.author, coins, ctx)
           base = f"☄️ Falling sparks wash ashore coins — you get **{coins} {currency}**."
 
-      # append achievement announcement if any
-      if ach_msg:
-          return False, f"{base}\n\n{ach_msg}"
       return False, base
 
-    async def _event_coral_gift(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_coral_gift(self, ctx, state):
         if random.random() < 0.25:
-            items = await user_conf.items()
-            items.append("Coral Trinket")
-            await user_conf.items.set(items)
+            state.add_item("Coral Trinket")
             return False, "🪸 The coral cradles a **Coral Trinket** and gives it to you."
         coins = random.randint(5, 25)
         new_bal, currency = await self._deposit(ctx.author, coins, ctx)
         return False, f"🪸 Tiny coral pieces yield **{coins} {currency}**."
 
-    async def _event_water_sprite(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_water_sprite(self, ctx, state):
         if random.random() < 0.5:
             bait = random.randint(1, 3)
-            current = await user_conf.bait()
-            await user_conf.bait.set(current + bait)
+            state.bait += bait
             return False, f"🧚 A water sprite blesses you with **{bait}** bait."
-        await user_conf.luck.set((await user_conf.luck()) + 1)
+        state.luck += 1
         return False, "🧚 A sprite whispers. Your luck increases slightly."
 
-    async def _event_whirlpool(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
-        data = await user_conf.caught()
-        if data:
-            lost = []
-            lost_count = min(random.randint(1, 3), len(data))
-            for _ in range(lost_count):
-                lost.append(data.pop(random.randrange(len(data))))
-            await user_conf.caught.set(data)
+    async def _event_whirlpool(self, ctx, state):
+        if state.caught:
+            lost = state.pop_random_fish(random.randint(1, 3))
             return False, f"🌀 A whirlpool swallows {', '.join(lost)} from your haul!"
         return False, "🌀 A whirlpool churns but you had nothing to lose."
 
-    async def _event_fisherman_friend(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
-        inv = await user_conf.caught()
-        if not inv:
+    async def _event_fisherman_friend(self, ctx, state):
+        fish = state.random_fish()
+        if not fish:
             coins = random.randint(1, 8)
             new_bal, currency = await self._deposit(ctx.author, coins, ctx)
             return False, f"🧑‍⚖️ A helpful fisherman tips you **{coins} {currency}**."
-        fish = random.choice(inv)
         premium = int(self.fish_prices.get(fish, 10) * random.uniform(1.4, 2.5))
-        inv.remove(fish)
-        await user_conf.caught.set(inv)
+        state.remove_fish(fish)
         new_bal, currency = await self._deposit(ctx.author, premium, ctx)
         return False, f"🧑‍⚖️ A friendly fisherman buys your **{fish}** for **{premium} {currency}** on the spot."
 
-    async def _event_barnacle_pearl(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_barnacle_pearl(self, ctx, state):
         if random.random() < 0.12:
             value = random.randint(30, 120)
             new_bal, currency = await self._deposit(ctx.author, value, ctx)
             return False, f"🐚 You pry open a barnacle and find a pearl worth **{value} {currency}**!"
         return False, "🐚 Barnacles cling to nothing of value this time."
 
-    async def _event_crystal_wash(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_crystal_wash(self, ctx, state):
         if random.random() < 0.10:
-            data = await user_conf.caught()
-            data.append("Crystal Trout")
-            await user_conf.caught.set(data)
-            await self._maybe_update_unique_and_highest(ctx.author, "Crystal Trout")
+            self._record_catch(state, "Crystal Trout")
             return False, "🔹 A crystal wash frees a **Crystal Trout** into your net!"
         return False, "🔹 Shimmering water passes but nothing uncommon shows."
 
-    async def _event_echo_call(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_echo_call(self, ctx, state):
         if random.random() < 0.5:
-            await user_conf.luck.set((await user_conf.luck()) + 2)
+            state.luck += 2
             return False, "🔔 Echoes call — your next casts are luckier."
         return False, "🔔 You hear distant echoes; nothing else."
 
-    async def _event_drifting_crate(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_drifting_crate(self, ctx, state):
         coins = random.randint(5, 40)
         new_bal, currency = await self._deposit(ctx.author, coins, ctx)
-        items = await user_conf.items()
         if random.random() < 0.10:
-            items.append("Rod Fragment")
-            await user_conf.items.set(items)
-        try:
-            if not await self._has_achievement(ctx.author, "fragment_collector"):
-                items_now = await user_conf.items()
-                if items_now.count("Rod Fragment") >= 10:
-                    await self._award_achievement(ctx, ctx.author, "fragment_collector")
-        except Exception:
-            pass            
+            state.add_item("Rod Fragment")
             return False, f"📦 You pull a drifting crate with **{coins} {currency}** and a **Rod Fragment**!"
         return False, f"📦 You open a drifting crate and find **{coins} {currency}**."
 
-    async def _event_phantom_net(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
-        await self._inc_stat(ctx.author, "spectral_events", 1)
+    async def _event_phantom_net(self, ctx, state):
+        state.inc_stat("spectral_events")
         if random.random() < 0.08:
-            data = await user_conf.caught()
-            data.append("Spectral Herring")
-            await user_conf.caught.set(data)
-            await self._maybe_update_unique_and_highest(ctx.author, "Spectral Herring")
-            spec_msg = None
-            if not await self._has_achievement(ctx.author, "spectral_hunter"):
-                spec_msg = await self._award_achievement(ctx, ctx.author, "spectral_hunter")
-            text = "👻 A ghostly net yields a **Spectral Herring**!"
-            return False, f"{text}\n\n{spec_msg}" if spec_msg else text
+            self._record_catch(state, "Spectral Herring")
+            state.grant("spectral_hunter")
+            return False, "👻 A ghostly net yields a **Spectral Herring**!"
         return False, "👻 An old phantom net drops off a tangle of junk."
 
-    async def _event_lazy_sun(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
-        await user_conf.luck.set((await user_conf.luck()) + 1)
+    async def _event_lazy_sun(self, ctx, state):
+        state.luck += 1
         return False, "☀️ The sun is calm — common and uncommon fish are more likely."
 
-    async def _event_thunder_clap(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_thunder_clap(self, ctx, state):
         # reduce luck briefly but maybe rare storm fish
         # 8% chance to hook the rare Stormwing Tuna
         if random.random() < 0.08:
-            data = await user_conf.caught()
-            data.append("Stormwing Tuna")
-            await user_conf.caught.set(data)
-            await self._maybe_update_unique_and_highest(ctx.author, "Stormwing Tuna")
+            self._record_catch(state, "Stormwing Tuna")
 
             # 10% chance to salvage a Storm Scale alongside it
             scale_msg = ""
             if random.random() < 0.10:
-                items = await user_conf.items()
-                items.append("Storm Scale")
-                await user_conf.items.set(items)
+                state.add_item("Storm Scale")
                 scale_msg = " You also salvage a **Storm Scale**!"
 
             return False, f"⚡ A thunderclap unleashes a **Stormwing Tuna**!{scale_msg}"
 
         # small luck penalty on a normal clap
-        await user_conf.luck.set(max(0, (await user_conf.luck()) - 1))
+        state.luck -= 1
 
         # still a 10% chance to get a Storm Scale even if no tuna
         scale_msg = ""
         if random.random() < 0.10:
-            items = await user_conf.items()
-            items.append("Storm Scale")
-            await user_conf.items.set(items)
+            state.add_item("Storm Scale")
             scale_msg = " You salvage a small **Storm Scale** from the thunder."
 
         return False, f"⚡ A thunderclap startles the water; luck reduced slightly.{scale_msg}"
 
-    async def _event_sponge_cache(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_sponge_cache(self, ctx, state):
         bait_found = random.randint(1, 3)
-        current = await user_conf.bait()
-        await user_conf.bait.set(current + bait_found)
+        state.bait += bait_found
         if random.random() < 0.06:
-            items = await user_conf.items()
-            items.append("Rod Fragment")
-            await user_conf.items.set(items)
-        try:
-            if not await self._has_achievement(ctx.author, "fragment_collector"):
-                items_now = await user_conf.items()
-                if items_now.count("Rod Fragment") >= 10:
-                    await self._award_achievement(ctx, ctx.author, "fragment_collector")
-        except Exception:
-            pass            
+            state.add_item("Rod Fragment")
             return False, f"🧽 A sponge cache yields **{bait_found}** bait and a **Rod Fragment**!"
         return False, f"🧽 A sponge cache yields **{bait_found}** bait."
 
-    async def _event_tide_change(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_tide_change(self, ctx, state):
         # temporarily give player a small luck boost and message; actual biome weighting handled elsewhere if implemented
-        await user_conf.luck.set((await user_conf.luck()) + 1)
+        state.luck += 1
         return False, "🌊 The tide changes — coastal/reef spawns feel stronger for a short time."
 
-    async def _event_moon_phase(self, ctx, user_conf):
-      await self._inc_stat(ctx.author, "cosmic_events", 1)
+    async def _event_moon_phase(self, ctx, state):
+      state.inc_stat("cosmic_events")
 
-      # try awarding the achievement and capture its message
-      ach_msg = None
-      if not await self._has_achievement(ctx.author, "cosmic_watcher"):
-          ach_msg = await self._award_achievement(ctx, ctx.author, "cosmic_watcher")
+      state.grant("cosmic_watcher")
 
       if random.random() < 0.05:
           catch = "Silver Seraph"
-          data = await user_conf.caught()
-          data.append(catch)
-          await user_conf.caught.set(data)
-          await self._maybe_update_unique_and_highest(ctx.author, catch)
+          self._record_catch(state, catch)
           base = "🌕 Under the moon's eye you catch a **Silver Seraph**!"
       else:
           base = "🌕 The moon glances off the water — a quiet, promising night."
 
-      # append achievement announcement if any
-      if ach_msg:
-          return False, f"{base}\n\n{ach_msg}"
       return False, base
 
-    async def _event_rift_glimpse(self, ctx, user_conf):
-        await self._inc_stat(ctx.author, "casts", 1)
+    async def _event_rift_glimpse(self, ctx, state):
         if random.random() < 0.03:
-            data = await user_conf.caught()
-            data.append("Abyssal Wisp")
-            await user_conf.caught.set(data)
-            await self._maybe_update_unique_and_highest(ctx.author, "Abyssal Wisp")
+            self._record_catch(state, "Abyssal Wisp")
             return False, "🔱 A rift glimpse draws forth an **Abyssal Wisp**!"
         return False, "🔱 You glimpse a rift far below; nothing pulled up this time."
-        
-    async def _event_luminous_cavern(self, ctx, user_conf):
+
+    async def _event_luminous_cavern(self, ctx, state):
         """
         Bioluminal Sea vibes: catch a Glimmer Eel or find extra bait.
         """
-        await self._inc_stat(ctx.author, "casts", 1)
-
         if random.random() < 0.25:
             bait = random.randint(1, 3)
-            cur = await user_conf.bait()
-            await user_conf.bait.set(cur + bait)
+            state.bait += bait
             return False, f"🌌 Luminous Cavern sparkles — you gather **{bait}** bait."
 
         catch = "Glimmer Eel"
-        data = await user_conf.caught()
-        data.append(catch)
-        await user_conf.caught.set(data)
+        self._record_catch(state, catch)
 
         info = self.fish_definitions[catch]
-        await self._maybe_update_unique_and_highest(ctx.author, catch)
-        await self._advance_quest_on_catch(ctx.author, catch)
         return False, f"{info['emoji']} You net a **{catch}** from the glowing depths!"
 
-    async def _event_prehistoric_trench(self, ctx, user_conf):
+    async def _event_prehistoric_trench(self, ctx, state):
         """
         Ancient waters: chance for a Coelacanth, Trilobite, or a brush with a Megalodon.
         """
-        await self._inc_stat(ctx.author, "casts", 1)
-
         r = random.random()
         if r < 0.10:
-            await user_conf.rod_broken.set(True)
+            state.rod_broken = True
             return False, "🦈 A colossal silhouette thrashes—your rod shatters as you escape!"
 
         catch = "Coelacanth" if r < 0.35 else "Trilobite"
-        data = await user_conf.caught()
-        data.append(catch)
-        await user_conf.caught.set(data)
+        self._record_catch(state, catch)
 
         info = self.fish_definitions[catch]
-        await self._maybe_update_unique_and_highest(ctx.author, catch)
-        await self._advance_quest_on_catch(ctx.author, catch)
         return False, f"{info['emoji']} In the trench you haul up a **{catch}**!"
 
-    async def _event_smoldering_pool(self, ctx, user_conf):
+    async def _event_smoldering_pool(self, ctx, state):
         """Volcanic Spring: yielding Fire Goby or Magma Eel."""
-        await self._inc_stat(ctx.author, "casts", 1)
         choice = "Magma Eel" if random.random() < 0.20 else "Fire Goby"
-
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} Scorching currents yield a **{choice}** ({info['rarity']})!"
 
-    async def _event_lava_spout(self, ctx, user_conf):
+    async def _event_lava_spout(self, ctx, state):
         """Volcanic Spring burst: Ember Carp blast."""
-        await self._inc_stat(ctx.author, "casts", 1)
-
         choice = "Ember Carp"
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} A sudden lava spout spews a **{choice}**!"
 
-    async def _event_phantom_tide(self, ctx, user_conf):
+    async def _event_phantom_tide(self, ctx, state):
         """Haunted Shoals tide: Wraith Herring or Bonefish."""
-        await self._inc_stat(ctx.author, "casts", 1)
         choice = "Wraith Herring" if random.random() < 0.30 else "Bonefish"
-
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} Ghostly tide brings in a **{choice}** ({info['rarity']})!"
 
-    async def _event_haunted_whispers(self, ctx, user_conf):
+    async def _event_haunted_whispers(self, ctx, state):
         """Haunted Shoals whispers: steal or grant Phantom Carp."""
-        await self._inc_stat(ctx.author, "casts", 1)
         if random.random() < 0.25:
-            inv = await user_conf.items()
-            if inv:
-                lost = inv.pop(random.randrange(len(inv)))
-                await user_conf.items.set(inv)
+            lost = state.pop_random_item()
+            if lost:
                 return False, f"👻 Haunting whispers steal your **{lost}**!"
 
         choice = "Phantom Carp"
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} You hook a **{choice}** from the darkness!"
 
-    async def _event_dream_reverie(self, ctx, user_conf):
+    async def _event_dream_reverie(self, ctx, state):
         """Dreaming Deep: chance for Dream Pike or Sleepfin."""
-        await self._inc_stat(ctx.author, "casts", 1)
         choice = "Dream Pike" if random.random() < 0.30 else "Sleepfin"
-
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} In a dream current you net a **{choice}**!"
 
-    async def _event_nightmare_bloom(self, ctx, user_conf):
+    async def _event_nightmare_bloom(self, ctx, state):
         """Dreaming Deep bloom: Nightmare Grouper lurks."""
-        await self._inc_stat(ctx.author, "casts", 1)
         choice = "Nightmare Grouper"
-
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} A nightmare bloom surfaces a **{choice}**!"
 
-    async def _event_titan_quake(self, ctx, user_conf):
+    async def _event_titan_quake(self, ctx, state):
         """Titan's Trench tremor: Titan Crab or Pressure Pike."""
-        await self._inc_stat(ctx.author, "casts", 1)
         choice = "Titan Crab" if random.random() < 0.30 else "Pressure Pike"
-
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} A trench quake yields a **{choice}**!"
 
-    async def _event_deepwyrm_raise(self, ctx, user_conf):
+    async def _event_deepwyrm_raise(self, ctx, state):
         """Titan's Trench abyss: Leviathan Cod or Deepwyrm."""
-        await self._inc_stat(ctx.author, "casts", 1)
         choice = "Leviathan Cod" if random.random() < 0.25 else "Deepwyrm"
-
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} From the depths a **{choice}** emerges!"
 
-    async def _event_cavern_glow(self, ctx, user_conf):
+    async def _event_cavern_glow(self, ctx, state):
         """Bioluminal Cavern glow: Neon Sprat or Glowfin Trout."""
-        await self._inc_stat(ctx.author, "casts", 1)
         choice = "Neon Sprat" if random.random() < 0.40 else "Glowfin Trout"
-
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} Cavern lights guide you to a **{choice}**!"
 
-    async def _event_ethereal_gust(self, ctx, user_conf):
+    async def _event_ethereal_gust(self, ctx, state):
         """Ethereal Lagoon breeze: Moonshadow Koi or Celestial Salmon."""
-        await self._inc_stat(ctx.author, "casts", 1)
         choice = "Moonshadow Koi" if random.random() < 0.30 else "Celestial Salmon"
-
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} A gentle lagoon breeze lands a **{choice}**!"
 
-    async def _event_volcanic_spring(self, ctx, user_conf):
+    async def _event_volcanic_spring(self, ctx, state):
         """
         Volcanic Spring:
         – 20% chance to uncover a Lava Pearl item
         – otherwise catch a volcanic fish (Cinderfish or Ember Carp)
         """
-        await self._inc_stat(ctx.author, "casts", 1)
-
         if random.random() < 0.20:
-            items = await user_conf.items()
-            items.append("Lava Pearl")
-            await user_conf.items.set(items)
-            await self._inc_stat(ctx.author, "treasure_found", 1)
+            state.add_item("Lava Pearl")
+            state.inc_stat("treasure_found")
             return False, (
                 "🌋 You brave the molten depths and unearth a **Lava Pearl**! "
                 "Use it or deliver it for special rewards."
             )
 
         choice = random.choice(["Cinderfish", "Ember Carp"])
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} You caught a **{choice}** ({info['rarity']}) in the lava spring!"
 
-    async def _event_haunted_shoal(self, ctx, user_conf):
+    async def _event_haunted_shoal(self, ctx, state):
         """
         Haunted Shoals:
         – 15% chance to receive a Phantom Pearl item
         – else catch a ghostly fish (Spectral Herring or Ghost Carp)
         """
-        await self._inc_stat(ctx.author, "casts", 1)
-
         if random.random() < 0.15:
-            items = await user_conf.items()
-            items.append("Phantom Pearl")
-            await user_conf.items.set(items)
-            await self._inc_stat(ctx.author, "pearl_found", 1)
+            state.add_item("Phantom Pearl")
+            state.inc_stat("pearl_found")
             return False, (
                 "🌑 A skeletal tide washes in a **Phantom Pearl**! "
                 "Keep it safe or turn it in to Grimma."
             )
 
         choice = random.choice(["Spectral Herring", "Ghost Carp"])
-        data = await user_conf.caught()
-        data.append(choice)
-        await user_conf.caught.set(data)
+        self._record_catch(state, choice)
 
         info = self.fish_definitions[choice]
-        await self._maybe_update_unique_and_highest(ctx.author, choice)
-        await self._advance_quest_on_catch(ctx.author, choice)
         return False, f"{info['emoji']} A shadowy form coalesces—you hook a **{choice}**!"
-        
-    async def _event_find_reel(self, ctx, user_conf):
+
+    async def _event_find_reel(self, ctx, state):
         """
         Rare salvage: coins + bait, small chance for Rod Fragment,
         and an extra chance to uncover a Reel attachment.
         """
-        await self._inc_stat(ctx.author, "casts", 1)
-
         # 1) Coins
         coins = random.randint(10, 40)
         new_bal, currency = await self._deposit(ctx.author, coins, ctx)
 
         # 2) Bait
         bait_found = random.randint(1, 3)
-        cur_bait = await user_conf.bait()
-        await user_conf.bait.set(cur_bait + bait_found)
+        state.bait += bait_found
 
         # 3) Maybe a Rod Fragment
-        items = await user_conf.items()
         frag_msg = ""
         if random.random() < 0.05:  # 5% frag chance
-            items.append("Rod Fragment")
+            state.add_item("Rod Fragment")
             frag_msg = " You also salvage a **Rod Fragment**."
 
         # 4) Maybe a Reel
         gear_msg = ""
         if random.random() < 0.10:  # 10% gear chance
             gear = random.choice(list(self.gear_definitions["reels"].keys()))
-            items.append(gear)
+            state.add_item(gear)
             gear_msg = f" And among the debris you uncover a **{gear}**!"
 
-        # Save items list
-        await user_conf.items.set(items)
-
         msg = (
             f"🔧 You scour the shoreline wreckage and earn **{coins} {currency}** "
             f"(new balance: **{new_bal} {currency}**), and find **{bait_found}** bait."
@@ -2449,34 +1113,28 @@ class Fishing(commands.Cog):
         return False, msg
 
 
-    async def _event_find_line(self, ctx, user_conf):
+    async def _event_find_line(self, ctx, state):
         """
         Rare salvage: coins + bait, small chance for Rod Fragment,
         and an extra chance to snag a Line attachment.
         """
-        await self._inc_stat(ctx.author, "casts", 1)
-
         coins = random.randint(5, 35)
         new_bal, currency = await self._deposit(ctx.author, coins, ctx)
 
         bait_found = random.randint(1, 2)
-        cur_bait = await user_conf.bait()
-        await user_conf.bait.set(cur_bait + bait_found)
+        state.bait += bait_found
 
-        items = await user_conf.items()
         frag_msg = ""
         if random.random() < 0.05:
-            items.append("Rod Fragment")
+            state.add_item("Rod Fragment")
             frag_msg = " You also salvage a **Rod Fragment**."
 
         gear_msg = ""
         if random.random() < 0.10:
             gear = random.choice(list(self.gear_definitions["lines"].keys()))
-            items.append(gear)
+            state.add_item(gear)
             gear_msg = f" Your line frees a **{gear}** from tangled junk!"
 
-        await user_conf.items.set(items)
-
         msg = (
             f"🪝 You pull successively on rusted chains and net **{coins} {currency}** "
             f"(new balance: **{new_bal} {currency}**), plus **{bait_found}** bait."
@@ -2485,35 +1143,28 @@ class Fishing(commands.Cog):
         return False, msg
 
 
-    async def _event_find_lure(self, ctx, user_conf):
+    async def _event_find_lure(self, ctx, state):
         """
         Rare salvage: coins + bait, small chance for Rod Fragment,
         and an extra chance to fish up a Lure attachment.
         """
-        await self._inc_stat(ctx.author, "casts", 1)
-
         coins = random.randint(15, 50)
         new_bal, currency = await self._deposit(ctx.author, coins, ctx)
 
         bait_found = random.randint(0, 2)
-        cur_bait = await user_conf.bait()
-        if bait_found > 0:
-            await user_conf.bait.set(cur_bait + bait_found)
+        state.bait += bait_found
 
-        items = await user_conf.items()
         frag_msg = ""
         if random.random() < 0.05:
-            items.append("Rod Fragment")
+            state.add_item("Rod Fragment")
             frag_msg = " You also discover a **Rod Fragment**."
 
         gear_msg = ""
         if random.random() < 0.10:
             gear = random.choice(list(self.gear_definitions["lures"].keys()))
-            items.append(gear)
+            state.add_item(gear)
             gear_msg = f" A glint in the mud reveals a **{gear}**!"
 
-        await user_conf.items.set(items)
-
         bait_text = f", plus **{bait_found}** bait" if bait_found else ""
         msg = (
             f"🦤 You dredge through old tackle and earn **{coins} {currency}** "
@@ -2521,148 +1172,64 @@ class Fishing(commands.Cog):
             f"{frag_msg}{gear_msg}"
         )
         return False, msg
-        
-     
-        
-    async def _paginate_embeds(self, ctx, embeds: List[discord.Embed], timeout: float = 120.0):
-        """Show embeds with reaction pagination controlled by the invoking user."""
-        if not embeds:
-            return await ctx.send("Nothing to show.")
-        message = await ctx.send(embed=embeds[0])
-        if len(embeds) == 1:
-            return message
-        controls = ["⏮️", "⬅️", "⏹️", "➡️", "⏭️"]
-        for r in controls:
-            try:
-                await message.add_reaction(r)
-            except Exception:
-                break
-        current = 0
 
-        def check(reaction, user):
-            return (
-                reaction.message.id == message.id
-                and user.id == ctx.author.id
-                and str(reaction.emoji) in controls
-            )
+    _PAGE_CACHE_SIZE = 128
+
+    def _cached_pages(self, key: Tuple, build: Callable[[], EmbedPages]) -> EmbedPages:
+        """Listing pages for ``key``, built lazily and reused until definitions change."""
+        pages = self._page_cache.pop(key, None)
+        if pages is None:
+            pages = build()
+            if len(self._page_cache) >= self._PAGE_CACHE_SIZE:
+                # free-text fishlist filters are unbounded; drop the least recently used
+                del self._page_cache[next(iter(self._page_cache))]
+        self._page_cache[key] = pages
+        return pages
+
+    def invalidate_pages(self):
+        """Forget every cached listing page, e.g. after definitions are edited."""
+        self._page_cache.clear()
+
+    def _did_you_mean(self, query: str, *kinds: str, among=None) -> str:
+        """" Did you mean **A**, **B**?" for a name that didn't resolve, or "" if nothing is close."""
+        suggestions = self.names.suggest(query, *kinds, limit=3 if among is None else 10)
+        if among is not None:
+            suggestions = [s for s in suggestions if s in among][:3]
+        if not suggestions:
+            return ""
+        return " Did you mean " + ", ".join(f"**{s}**" for s in suggestions) + "?"
 
-        while True:
-            try:
-                reaction, user = await ctx.bot.wait_for("reaction_add", timeout=timeout, check=check)
-            except asyncio.TimeoutError:
-                try:
-                    await message.clear_reactions()
-                except Exception:
-                    pass
-                break
-
-            emoji = str(reaction.emoji)
-            try:
-                await message.remove_reaction(reaction.emoji, user)
-            except Exception:
-                pass
-
-            if emoji == "⏹️":
-                try:
-                    await message.clear_reactions()
-                except Exception:
-                    pass
-                break
-            elif emoji == "⬅️":
-                current = (current - 1) % len(embeds)
-                try:
-                    await message.edit(embed=embeds[current])
-                except Exception:
-                    pass
-            elif emoji == "➡️":
-                current = (current + 1) % len(embeds)
-                try:
-                    await message.edit(embed=embeds[current])
-                except Exception:
-                    pass
-            elif emoji == "⏮️":
-                current = 0
-                try:
-                    await message.edit(embed=embeds[current])
-                except Exception:
-                    pass
-            elif emoji == "⏭️":
-                current = len(embeds) - 1
-                try:
-                    await message.edit(embed=embeds[current])
-                except Exception:
-                    pass
-        return message
+    async def _paginate_embeds(self, ctx, embeds: List[discord.Embed], timeout: float = 120.0):
+        """Show embeds with button pagination controlled by the invoking user."""
+        return await self.menus.send(ctx, embeds, timeout=timeout)
 
     # ---------- Core fish command ----------
-    @commands.cooldown(1, 30, commands.BucketType.user)
-    @commands.command()
-    @award_achievements
-    async def fish(self, ctx):
-    
-        user_conf = self.config.user(ctx.author)
-        # prevent fishing when your rod is broken
-        if await user_conf.rod_broken():
-            return await ctx.send("🔧 Your rod is broken. Repair it with `repairrod` first.")
-
-        # pick a random intro
-        intro = random.choice(self.cast_flavor)
-        waiting_msg = await ctx.send(intro)
-        await asyncio.sleep(random.uniform(1.5, 5.5))
-
-        # use pre-cached lists instead of rebuilding every time
-        keys    = self._event_keys
-        weights = self._event_base_weights.copy()
-
-        # bait modifier (your existing code)
-        try:
-            bait_amount = await user_conf.bait()
-        except Exception:
-            bait_amount = 0
-
-        if bait_amount > 0:
-            if random.random() < 0.9:
-                await user_conf.bait.set(bait_amount - 1)
-            for i, event in enumerate(keys):
-                if event in ("fish", "double"):
-                    weights[i] = int(weights[i] * 1.6)
-
-        # luck modifier
-        try:
-            luck = await user_conf.luck()
-        except Exception:
-            luck = 0
-        if luck and luck > 0:
-            await user_conf.luck.set(max(0, luck - 1))
-            for i, k in enumerate(keys):
-                if k in ("fish", "double", "treasure", "pearl", "merchant"):
-                    weights[i] = int(weights[i] * 2)
-
-        # rod level modifier
-        try:
-            rod_level = await user_conf.rod_level()
-        except Exception:
-            rod_level = 0
-        fish_mult = self.rod_level_fish_multiplier.get(rod_level, 1.0)
-        break_reduc = self.rod_level_break_reduction.get(rod_level, 1.0)
-        for i, k in enumerate(keys):
-            if k in ("fish", "double", "treasure", "pearl", "merchant"):
-                weights[i] = int(weights[i] * fish_mult)
-            if k in ("break", "hook_snag"):
-                weights[i] = max(1, int(weights[i] * break_reduc))
-
-        weights = [max(1, w) for w in weights]
-        chosen = random.choices(keys, weights=weights, k=1)[0]
+    async def _resolve_cast(self, ctx, state: UserState) -> Tuple[str, Optional[str]]:
+        """
+        Everything a cast decides, without the waiting or the messages:
+        spend bait, count down buffs, pick the event, run its handler and the
+        achievement pass. Returns (event key, text to show). Also used by the
+        simulator.
+        """
+        # the weight table for this bait/buff/gear combination is cached.
+        # Buffs are read once here and hold for the whole cast, so a one-cast
+        # buff still shapes the fish this cast draws; bait is used up (90% of
+        # the time) and cast-limited buffs tick down before the handler runs
+        table = self._event_table(self._active_event_modifiers(state))
+        state.cast_buffs = state.active_buffs()
+        if state.bait > 0 and random.random() < 0.9:
+            state.bait -= 1
+        state.tick_buffs()
+
+        chosen = table.pick()
         handler = self.event_handlers[chosen][0]
 
+        state.inc_stat("casts")
+        state.cast_origin = (getattr(ctx.guild, "id", None), chosen)
         try:
-            result = await handler(ctx, user_conf)
-        except Exception:
-            try:
-                await waiting_msg.edit(content="⚠️ An error occurred while resolving the event.")
-            except Exception:
-                pass
-            raise
+            result = await handler(ctx, state)
+        finally:
+            state.cast_origin = None
 
         message = None
         # pull out the content string
@@ -2670,35 +1237,147 @@ class Fishing(commands.Cog):
             message = result[1]
         elif isinstance(result, str):
             message = result
-        else:
-            message = None
-             
-        if message is not None:
-            ach_msgs = await self._check_and_award(ctx, ctx.author)
-            if ach_msgs:
-                # append any newly unlocked achievements
-                message = message + "\n\n" + "\n".join(ach_msgs)             
-             
-        try:
-            if message:
-                if len(message) > 1900:
-                    message = message[:1897] + "..."
-                await waiting_msg.edit(content=message)
-            else:
-                await waiting_msg.edit(content="…An event occurred. See the channel for details.")
-        except Exception:
-            if message:
-                await ctx.send(message)
+
+        # the one achievement pass for this cast
+        ach_msgs = await self._check_and_award(ctx, state)
+        if message is not None and ach_msgs:
+            # append any newly unlocked achievements
+            message = message + "\n\n" + "\n".join(ach_msgs)
+        return chosen, message
+
+    def _lockout_left(self, user) -> float:
+        """Seconds until a fishauto trip's cooldown ends for ``user`` (0 if none)."""
+        until = self._auto_lockout.get(user.id)
+        if until is None:
+            return 0.0
+        left = until - time.monotonic()
+        if left <= 0:
+            del self._auto_lockout[user.id]
+            return 0.0
+        return left
+
+    @commands.cooldown(1, CAST_COOLDOWN, commands.BucketType.user)
+    @commands.command()
+    async def fish(self, ctx):
+        wait = self._lockout_left(ctx.author)
+        if wait:
+            # the trip already paid this cooldown; don't start a new one too
+            ctx.command.reset_cooldown(ctx)
+            return await ctx.send(f"⏳ You're still out on your fishing trip. Cast again in **{wait:.0f}s**.")
+
+        # one read for the whole cast; handlers work on this copy
+        async with self._states.session(ctx.author) as state:
+            # a trip may have started while we waited for the session
+            wait = self._lockout_left(ctx.author)
+            if wait:
+                ctx.command.reset_cooldown(ctx)
+                return await ctx.send(f"⏳ You're still out on your fishing trip. Cast again in **{wait:.0f}s**.")
+            # prevent fishing when your rod is broken
+            if state.rod_broken:
+                return await ctx.send("🔧 Your rod is broken. Repair it with `repairrod` first.")
+            # the outcome is decided and committed now; only the reveal waits
+            _, message = await self._resolve_cast(ctx, state)
+            # a faster reel (hook_speed) shortens the wait for the result
+            delay = random.uniform(1.5, 5.5) * (1 - self._rod_profile(state).hook_speed)
+
+        if not message:
+            message = "…An event occurred. See the channel for details."
+        elif len(message) > 1900:
+            message = message[:1897] + "..."
+        # pick a random intro, then let the scheduler swap in the result
+        waiting_msg = await ctx.send(random.choice(self.cast_flavor))
+        self.reveals.schedule(waiting_msg, message, delay)
+
+    @commands.command()
+    async def fishauto(self, ctx, casts: int = 5):
+        """
+        Go on a fishing trip: make several casts at once and get one summary.
+        Each cast costs the usual cast cooldown, paid after the trip.
+        Usage: fishauto 5
+        """
+        if not 1 <= casts <= self.MAX_AUTO_CASTS:
+            return await ctx.send(f"❌ Pick between 1 and {self.MAX_AUTO_CASTS} casts.")
+        wait = max(self._lockout_left(ctx.author), self.fish.get_cooldown_retry_after(ctx))
+        if wait:
+            return await ctx.send(f"⏳ Your line needs a rest. Try again in **{wait:.0f}s**.")
+
+        async with self._states.session(ctx.author) as state:
+            # checked again now we hold the session: another trip or cast may have
+            # been waiting on it too, and the first check ran before that await
+            wait = max(self._lockout_left(ctx.author), self.fish.get_cooldown_retry_after(ctx))
+            if wait:
+                return await ctx.send(f"⏳ Your line needs a rest. Try again in **{wait:.0f}s**.")
+            if state.rod_broken:
+                return await ctx.send("🔧 Your rod is broken. Repair it with `repairrod` first.")
+            # claim the cooldown before the trip yields to the loop; later commands
+            # see it as soon as they get the session
+            until = time.monotonic() + casts * self.CAST_COOLDOWN
+            self._auto_lockout[ctx.author.id] = until
+
+            caught_before = dict(state.caught)
+            items_before = dict(state.items)
+            earned_before = len(state.achievements)
+            balance_before = await self._bank.get_balance(ctx.author)
+            events: Dict[str, int] = {}
+            made = 0
+            async with ctx.typing():
+                while made < casts and not state.rod_broken:
+                    chosen, _ = await self._resolve_cast(ctx, state)
+                    events[chosen] = events.get(chosen, 0) + 1
+                    made += 1
+            balance_after = await self._bank.get_balance(ctx.author)
+
+            # a trip cut short by a broken rod only pays for the casts it made;
+            # take the unused casts off the claim rather than restarting the clock
+            self._auto_lockout[ctx.author.id] = until - (casts - made) * self.CAST_COOLDOWN
+
+            def gained(before: Dict[str, int], after: Dict[str, int]) -> str:
+                diff = {n: c - before.get(n, 0) for n, c in after.items() if c > before.get(n, 0)}
+                text = ", ".join(f"{c}× {n}" for n, c in sorted(diff.items(), key=lambda kv: -kv[1]))
+                return text[:1021] + "..." if len(text) > 1024 else text
+
+            currency = await self._bank.get_currency_name(ctx.guild)
+            embed = discord.Embed(
+                title=f"🎣 {ctx.author.display_name}'s fishing trip — {made} cast{'s' if made != 1 else ''}",
+                colour=discord.Colour.blue(),
+            )
+            embed.add_field(name="Catches", value=gained(caught_before, state.caught) or "Nothing this time.", inline=False)
+            found = gained(items_before, state.items)
+            if found:
+                embed.add_field(name="Found", value=found, inline=False)
+            delta = balance_after - balance_before
+            if delta:
+                embed.add_field(name="Coins", value=f"{delta:+} {currency} (balance {balance_after} {currency})", inline=False)
+            new_ach = state.achievements[earned_before:]
+            if new_ach:
+                names = ", ".join(self.achievements[a].name if a in self.achievements else a for a in new_ach)
+                embed.add_field(name="🏆 Achievements", value=names[:1024], inline=False)
+            embed.add_field(
+                name="Events",
+                value=", ".join(f"{k} ×{n}" for k, n in sorted(events.items(), key=lambda kv: -kv[1]))[:1024],
+                inline=False,
+            )
+            footer = f"Next cast in {made * self.CAST_COOLDOWN}s."
+            if state.rod_broken:
+                footer = f"🔧 Your rod broke — repair it with repairrod. {footer}"
+            embed.set_footer(text=footer)
+        await ctx.send(embed=embed)
 
     # ---------- fishlist with embed pagination ----------
     @commands.command()
     async def fishlist(self, ctx, *, filter_by: str = None):
         """Show available fish with price and rarity in a paged embed."""
-        rarity_order = {"Common": 0, "Uncommon": 1, "Rare": 2, "Epic": 3, "Legendary": 4, "Mythic": 5, "Boss": 6}
+        key = filter_by.strip().lower() if filter_by else ""
+        pages = self._cached_pages(("fishlist", key), lambda: self._build_fish_list_pages(key))
+        if not pages:
+            return await ctx.send("No fish match that filter.")
+        await self._paginate_embeds(ctx, pages)
+
+    def _build_fish_list_pages(self, key: str) -> EmbedPages:
+        rarity_order = self.rarity_rank
         items = list(self.fish_definitions.items())
 
-        if filter_by:
-            key = filter_by.strip().lower()
+        if key:
             filtered = []
             for name, info in items:
                 if info.get("rarity", "").lower() == key:
@@ -2711,9 +1390,6 @@ class Fishing(commands.Cog):
 
         items = sorted(items, key=lambda kv: (rarity_order.get(kv[1].get("rarity", ""), 99), -kv[1].get("price", 0)))
 
-        if not items:
-            return await ctx.send("No fish match that filter.")
-
         per_page = 8
         pages: List[List[Tuple[str, Dict]]] = [items[i:i+per_page] for i in range(0, len(items), per_page)]
 
@@ -2721,8 +1397,8 @@ class Fishing(commands.Cog):
             page_items = pages[page_idx]
             embed = discord.Embed(title="Available Fish", colour=discord.Colour.blue())
             embed.set_thumbnail(url="https://files.catbox.moe/yl5ytl.png")
-            if filter_by:
-                embed.description = f"Filter: **{filter_by}**"
+            if key:
+                embed.description = f"Filter: **{key}**"
             for name, info in page_items:
                 emoji = info.get("emoji", "")
                 rarity = info.get("rarity", "Unknown")
@@ -2733,96 +1409,27 @@ class Fishing(commands.Cog):
                     value=f"**Rarity:** {rarity}\n**Price:** {price}\n**Biome:** {biome}",
                     inline=False,
                 )
-            embed.set_footer(text=f"Page {page_idx+1}/{len(pages)} — Use reactions to navigate")
+            embed.set_footer(text=f"Page {page_idx+1}/{len(pages)} — Use the buttons to navigate")
             return embed
 
-        message = await ctx.send(embed=make_embed(0))
-        if len(pages) == 1:
-            return
-
-        left = "⬅️"; right = "➡️"; first = "⏮️"; last = "⏭️"; stop = "⏹️"
-        controls = [first, left, stop, right, last]
-        for r in controls:
-            try:
-                await message.add_reaction(r)
-            except Exception:
-                return
-
-        current = 0
-
-        def check(reaction, user):
-            return (
-                reaction.message.id == message.id
-                and user.id == ctx.author.id
-                and str(reaction.emoji) in controls
-            )
-
-        while True:
-            try:
-                reaction, user = await ctx.bot.wait_for("reaction_add", timeout=120.0, check=check)
-            except asyncio.TimeoutError:
-                try:
-                    await message.clear_reactions()
-                except Exception:
-                    pass
-                break
-
-            try:
-                await message.remove_reaction(reaction.emoji, user)
-            except Exception:
-                pass
-
-            emoji = str(reaction.emoji)
-            if emoji == stop:
-                try:
-                    await message.clear_reactions()
-                except Exception:
-                    pass
-                break
-            elif emoji == left:
-                current = (current - 1) % len(pages)
-                try:
-                    await message.edit(embed=make_embed(current))
-                except Exception:
-                    pass
-            elif emoji == right:
-                current = (current + 1) % len(pages)
-                try:
-                    await message.edit(embed=make_embed(current))
-                except Exception:
-                    pass
-            elif emoji == first:
-                current = 0
-                try:
-                    await message.edit(embed=make_embed(current))
-                except Exception:
-                    pass
-            elif emoji == last:
-                current = len(pages) - 1
-                try:
-                    await message.edit(embed=make_embed(current))
-                except Exception:
-                    pass
+        return EmbedPages(len(pages), make_embed)
 
     # ---------- fishstats, achievements, repairrod, sell ----------
     @commands.command()
     async def fishstats(self, ctx):
         """View how many fish you’ve caught, your items, and your bank balance (embed, paged)."""
-        data = await self.config.user(ctx.author).all()
-        bait = data["bait"]
-        caught = data["caught"]
+        state = await self._load_state(ctx.author)
+        bait = state.bait
+        buffs = self._buff_lines(state)
+        caught = state.caught
         if not caught:
             return await ctx.send(
                 f"You haven't caught anything yet. Use `{ctx.clean_prefix}fish` to start fishing!"
             )
 
-        # 1) tally up each species into lines
-        counts: Dict[str, int] = {}
-        for f in caught:
-            counts[f] = counts.get(f, 0) + 1
-
+        # 1) one line per species
         lines: List[str] = []
-        for fish, cnt in counts.items():
+        for fish, cnt in caught.items():
             info = self.fish_definitions.get(fish, {})
             emoji = info.get("emoji", "")
             rarity = info.get("rarity", "Unknown")
@@ -2836,8 +1443,8 @@ class Fishing(commands.Cog):
         # 3) build an embed for each page
         embeds: List[discord.Embed] = []
         image_url = "https://files.catbox.moe/w2zsia.png"
-        bal = await bank.get_balance(ctx.author)
-        currency = await bank.get_currency_name(ctx.guild)
+        bal = await self._bank.get_balance(ctx.author)
+        currency = await self._bank.get_currency_name(ctx.guild)
 
         for idx, page_lines in enumerate(pages):
             emb = discord.Embed(
@@ -2849,6 +1456,8 @@ class Fishing(commands.Cog):
             # always show balance & bait
             emb.add_field(name="Balance", value=f"**{bal}** {currency}", inline=False)
             emb.add_field(name="Bait", value=str(bait), inline=True)
+            if buffs:
+                emb.add_field(name="Buffs", value="\n".join(buffs), inline=True)
 
             # caught chunk
             emb.add_field(
@@ -2859,13 +1468,10 @@ class Fishing(commands.Cog):
 
             # only on the last page, show items
             if idx == len(pages) - 1:
-                items = data["items"]
+                items = state.items
                 if items:
-                    inv_counts: Dict[str, int] = {}
-                    for it in items:
-                        inv_counts[it] = inv_counts.get(it, 0) + 1
                     item_lines = "\n".join(f"• {iname}: {cnt}"
-                                           for iname, cnt in inv_counts.items())
+                                           for iname, cnt in items.items())
                     emb.add_field(name="Items", value=item_lines, inline=False)
 
             emb.set_footer(text=f"Page {idx+1}/{len(pages)}")
@@ -2880,16 +1486,15 @@ class Fishing(commands.Cog):
     @commands.command()
     async def fishachievements(self, ctx):
         """Show your earned achievements and progress in an embed (paged if long)."""
-        user_conf = self.config.user(ctx.author)
-        earned = await user_conf.achievements()
+        state = await self._load_state(ctx.author)
+        earned = state.achievements
         image_url = "https://files.catbox.moe/fldzkv.png"        
-        stats = await user_conf.stats()
-        caught = await user_conf.caught()
+        stats = state.stats
         lines = []
         if earned:
             for aid in earned:
-                name, desc, _ = self.achievements.get(aid, (aid, "", ""))
-                lines.append((f"🏆 {name}", desc))
+                ach = self.achievements.get(aid)
+                lines.append((f"🏆 {ach.name if ach else aid}", ach.description if ach else ""))
         else:
             lines.append(("No achievements yet", "You haven't earned any achievements yet."))
 
@@ -2897,7 +1502,7 @@ class Fishing(commands.Cog):
         progress_fields = [
             ("Total casts", str(stats.get("casts", 0))),
             ("Fish caught", str(stats.get("fish_caught", 0))),
-            ("Unique species", str(len(set(x for x in caught if x and not x.lower().startswith("treasure"))))),
+            ("Unique species", str(stats.get("unique_fish", 0))),
             ("Sell total", str(stats.get("sell_total", 0))),
         ]
 
@@ -2928,8 +1533,8 @@ class Fishing(commands.Cog):
             chunk = items[i:i+per_page]
             emb = discord.Embed(title="All Achievements", colour=discord.Colour.dark_gold())
             emb.set_image(url=image_url)
-            for aid, (name, desc, cat) in chunk:
-                emb.add_field(name=f"{name} [{cat}]", value=f"{desc} — id: `{aid}`", inline=False)
+            for aid, ach in chunk:
+                emb.add_field(name=f"{ach.name} [{ach.category}]", value=f"{ach.description} — id: `{aid}`", inline=False)
             emb.set_footer(text=f"Page {i//per_page+1}/{(len(items)-1)//per_page+1}")
             embeds.append(emb)
         await self._paginate_embeds(ctx, embeds)
@@ -2938,64 +1543,152 @@ class Fishing(commands.Cog):
     @commands.command()
     async def repairrod(self, ctx):
         """Repair your broken rod for 20 coins and award achievement."""
-        user_conf = self.config.user(ctx.author)
-        if not await user_conf.rod_broken():
-            return await ctx.send("Your rod is already in good shape!")
-        cost = 20
-        if not await bank.can_spend(ctx.author, cost):
-            bal = await bank.get_balance(ctx.author)
-            currency = await bank.get_currency_name(ctx.guild)
-            return await ctx.send(
-                f"❌ You need **{cost}** {currency} to repair, but you only have **{bal}** {currency}."
-            )
-        await bank.withdraw_credits(ctx.author, cost)
-        await user_conf.rod_broken.set(False)
-        ach_msg = None
-        if not await self._has_achievement(ctx.author, "rod_repaired"):
-            ach_msg = await self._award_achievement(ctx, ctx.author, "rod_repaired")
-        if ach_msg:
-            await ctx.send("🔧 Your rod is repaired! " + ach_msg)
-        else:
-            await ctx.send("🔧 Your rod is repaired! Time to cast again.")
+        async with self._states.session(ctx.author) as state:
+            if not state.rod_broken:
+                return await ctx.send("Your rod is already in good shape!")
+            cost = 20
+            if not await self._bank.can_spend(ctx.author, cost):
+                bal = await self._bank.get_balance(ctx.author)
+                currency = await self._bank.get_currency_name(ctx.guild)
+                return await ctx.send(
+                    f"❌ You need **{cost}** {currency} to repair, but you only have **{bal}** {currency}."
+                )
+            await self._bank.withdraw_credits(ctx.author, cost)
+            state.rod_broken = False
+            state.grant("rod_repaired")
+            ach_msgs = await self._check_and_award(ctx, state)
+            if ach_msgs:
+                await ctx.send("🔧 Your rod is repaired! " + "\n".join(ach_msgs))
+            else:
+                await ctx.send("🔧 Your rod is repaired! Time to cast again.")
 
     @commands.command()
     async def fishsell(self, ctx, amount: int, *, fish_name: str):
         """Sell a number of fish for your server currency."""
-        user_conf = self.config.user(ctx.author)
-        inventory = await user_conf.caught()
-        match = next((fish for fish in self.fish_definitions if fish.lower() == fish_name.lower()), None)
-        if not match:
-            valid = ", ".join(self.fish_definitions.keys())
-            return await ctx.send(f"❌ Unknown fish `{fish_name}`. You can sell: {valid}")
-        have = inventory.count(match)
-        if have < amount:
-            return await ctx.send(f"❌ You only have {have}× **{match}** to sell.")
-        for _ in range(amount):
-            inventory.remove(match)
-        await user_conf.caught.set(inventory)
-        total = self.fish_definitions[match]["price"] * amount
-        new_bal = await bank.deposit_credits(ctx.author, total)
-        currency = await bank.get_currency_name(ctx.guild)
-        stats = await user_conf.stats()
-        stats["sell_total"] = stats.get("sell_total", 0) + total
-        await user_conf.stats.set(stats)
-        msgs = await self._check_and_award(ctx, ctx.author)
-        message = f"💰 You sold {amount}× **{match}** for **{total}** {currency}!\nYour new balance is **{new_bal} {currency}**."
-        if msgs:
-            message += "\n\n" + "\n".join(msgs)
-        await ctx.send(message)
+        async with self._states.session(ctx.author) as state:
+            match = self.names.resolve(fish_name, "fish")
+            if not match:
+                return await ctx.send(f"❌ Unknown fish `{fish_name}`.{self._did_you_mean(fish_name, 'fish')}")
+            have = state.fish_count(match)
+            if have < amount:
+                return await ctx.send(f"❌ You only have {have}× **{match}** to sell.")
+            state.remove_fish(match, amount)
+            total = self.fish_definitions[match]["price"] * amount
+            new_bal = await self._bank.deposit_credits(ctx.author, total)
+            currency = await self._bank.get_currency_name(ctx.guild)
+            state.inc_stat("sell_total", total)
+            msgs = await self._check_and_award(ctx, state)
+            message = f"💰 You sold {amount}× **{match}** for **{total}** {currency}!\nYour new balance is **{new_bal} {currency}**."
+            if msgs:
+                message += "\n\n" + "\n".join(msgs)
+            await ctx.send(message)
+
+    def _sell_selection(self, state: UserState, selector: str) -> Optional[Dict[str, int]]:
+        """
+        Resolve a fishsellall selector to {fish: count} in one pass over the
+        haul. Returns None if the selector names nothing we know.
+        """
+        defs = self.fish_definitions
+        sel = selector.strip().lower()
+        if sel in ("", "all", "everything"):
+            keep = lambda info: True
+        elif sel in {i.get("rarity", "").lower() for i in defs.values()}:
+            keep = lambda info: info.get("rarity", "").lower() == sel
+        elif sel in {i.get("biome", "").lower() for i in defs.values()}:
+            keep = lambda info: info.get("biome", "").lower() == sel
+        else:
+            # explicit names sell every copy, favourites included
+            names = [self.names.resolve(part, "fish") for part in selector.split(",") if part.strip()]
+            if not names or None in names:
+                return None
+            return {name: state.fish_count(name) for name in names if state.fish_count(name)}
+
+        favourites = set(state.favourites)
+        return {
+            name: count
+            for name, count in state.caught.items()
+            if name in defs and name not in favourites and keep(defs[name])
+        }
+
+    @commands.command()
+    async def fishsellall(self, ctx, *, selector: str = "all"):
+        """
+        Sell many fish at once. Favourites are kept unless named explicitly.
+        Usage: fishsellall               (everything except favourites)
+               fishsellall Rare          (by rarity)
+               fishsellall Coastal       (by biome)
+               fishsellall Salmon, Trout (every copy of each name)
+        """
+        async with self._states.session(ctx.author) as state:
+            selection = self._sell_selection(state, selector)
+            if selection is None:
+                return await ctx.send(
+                    f"❌ `{selector}` isn't a rarity, biome or fish name. "
+                    "Use commas to list several fish."
+                )
+            if not selection:
+                return await ctx.send("❌ You have no matching fish to sell.")
+
+            total = 0
+            for name, count in selection.items():
+                state.remove_fish(name, count)
+                total += self.fish_definitions[name]["price"] * count
+            new_bal = await self._bank.deposit_credits(ctx.author, total)
+            currency = await self._bank.get_currency_name(ctx.guild)
+            state.inc_stat("sell_total", total)
+            msgs = await self._check_and_award(ctx, state)
+
+            sold = ", ".join(f"{count}× {name}" for name, count in selection.items())
+            if len(sold) > 1200:
+                sold = sold[:1200].rsplit(",", 1)[0] + ", …"
+            message = (
+                f"💰 You sold **{sum(selection.values())}** fish for **{total}** {currency}!\n"
+                f"{sold}\nYour new balance is **{new_bal} {currency}**."
+            )
+            if msgs:
+                message += "\n\n" + "\n".join(msgs)
+            await ctx.send(message[:1900])
+
+    @commands.command()
+    async def fishfav(self, ctx, *, fish_name: str = None):
+        """
+        Toggle a fish as a favourite so `fishsellall` keeps it.
+        With no name, list your favourites.
+        """
+        async with self._states.session(ctx.author) as state:
+            favourites = state.favourites
+            if not fish_name:
+                if not favourites:
+                    return await ctx.send("You have no favourite fish yet.")
+                return await ctx.send("⭐ Favourites: " + ", ".join(favourites))
+            match = self.names.resolve(fish_name, "fish")
+            if not match:
+                return await ctx.send(f"❌ Unknown fish `{fish_name}`.{self._did_you_mean(fish_name, 'fish')}")
+            if match in favourites:
+                favourites.remove(match)
+                reply = f"☆ **{match}** is no longer a favourite."
+            else:
+                favourites.append(match)
+                reply = f"⭐ **{match}** added to your favourites."
+            state.touch()
+            await ctx.send(reply)
 
     # ---------- Crafting (fish fusion) ----------
     @commands.command()
     async def fishcraftlist(self, ctx):
         """List available crafting recipes in embeds (paged), showing the full command to use."""
+        prefix = ctx.clean_prefix
+        pages = self._cached_pages(("fishcraftlist", prefix), lambda: self._build_craft_list_pages(prefix))
+        await self._paginate_embeds(ctx, pages)
+
+    def _build_craft_list_pages(self, prefix: str) -> EmbedPages:
         image_url = "https://files.catbox.moe/dt1sh1.png"
         items = list(self.crafting_recipes.items())
-        embeds: List[discord.Embed] = []
         per_page = 6
+        page_count = (len(items) - 1) // per_page + 1
 
-        for i in range(0, len(items), per_page):
-            chunk = items[i:i+per_page]
+        def make_embed(page_idx: int):
+            chunk = items[page_idx*per_page:(page_idx+1)*per_page]
             emb = discord.Embed(
                 title="Crafting Recipes",
                 colour=discord.Colour.teal()
@@ -3011,7 +1704,7 @@ class Fishing(commands.Cog):
                 # field title shows the human name and exact command
                 field_name = (
                     f"{info.get('name')} — Usage: "
-                    f"`{ctx.clean_prefix}fishcraft {recipe_id}`"
+                    f"`{prefix}fishcraft {recipe_id}`"
                 )
                 # field value shows description, requirements and result
                 field_value = (
@@ -3022,267 +1715,181 @@ class Fishing(commands.Cog):
                 emb.add_field(name=field_name, value=field_value, inline=False)
 
             emb.set_footer(
-                text=f"Page {i//per_page+1}/{(len(items)-1)//per_page+1}"
+                text=f"Page {page_idx+1}/{page_count}"
             )
-            embeds.append(emb)
+            return emb
 
-        await self._paginate_embeds(ctx, embeds)
+        return EmbedPages(page_count if items else 0, make_embed)
 
+    def _resolve_recipe(
+        self, state: UserState, reqs: Dict[str, int], times: int = 1
+    ) -> Optional[Tuple[Dict[str, int], Dict[str, int]]]:
+        """
+        Work out what crafting ``times`` copies of a recipe would consume,
+        without touching the state. Returns (fish, items) as {name: count},
+        or None if the user can't cover every requirement.
 
-    @commands.command()
-    async def fishcraft(self, ctx, recipe_id: str):
-        """Craft an item using a recipe id. Use `craftlist` to see available recipes."""
-        recipe_id = recipe_id.lower()
-        if recipe_id not in self.crafting_recipes:
-            return await ctx.send("❌ Unknown recipe. Use `craftlist` to view available recipes.")
-        recipe = self.crafting_recipes[recipe_id]
-        reqs = recipe["requirements"]
-        user_conf = self.config.user(ctx.author)
-        inventory = await user_conf.caught()
-        remaining_inv = list(inventory)
-        removed_fish = []
+        Exact requirements are matched before rarity ones, and ``any_fish``
+        last, so a broad requirement never eats a fish a narrower one needs.
+        Within a pool the cheapest fish go first.
+        """
+        caught, items = state.caught, state.items
+        fish_used: Dict[str, int] = {}
+        items_used: Dict[str, int] = {}
 
-        ok = True
-        for key, needed in reqs.items():
-            if key == "any_fish":
-                if len(remaining_inv) < needed:
-                    ok = False
-                    break
-                remaining_inv.sort(key=lambda n: self.fish_definitions.get(n, {}).get("price", 0))
-                for _ in range(needed):
-                    removed_fish.append(remaining_inv.pop(0))
-            elif key.startswith("rarity:"):
-                rarity = key.split(":", 1)[1]
-                have = sum(1 for f in remaining_inv if f in self.fish_definitions and self.fish_definitions[f].get("rarity") == rarity)
-                if have < needed:
-                    ok = False
+        def draw(pool, needed: int) -> bool:
+            for name in pool:
+                if needed <= 0:
                     break
-                to_remove = needed
-                new_rem = []
-                for f in remaining_inv:
-                    if to_remove > 0 and f in self.fish_definitions and self.fish_definitions[f].get("rarity") == rarity:
-                        removed_fish.append(f)
-                        to_remove -= 1
-                        continue
-                    new_rem.append(f)
-                remaining_inv = new_rem
-            elif key.startswith("fish:"):
-                fname = key.split(":", 1)[1]
-                have = remaining_inv.count(fname)
-                if have < needed:
-                    ok = False
-                    break
-                removed = 0
-                new_rem = []
-                for f in remaining_inv:
-                    if f == fname and removed < needed:
-                        removed_fish.append(f)
-                        removed += 1
-                        continue
-                    new_rem.append(f)
-                remaining_inv = new_rem
-            elif key.startswith("item:"):
-                item_name = key.split(":", 1)[1]
-                # pull inventory once
-                items_list = await user_conf.items()
-                have = items_list.count(item_name)
-                if have < needed:
-                    ok = False
-                    break
-                # consume exactly `needed` copies
-                new_items = []
-                removed = 0
-                for it in items_list:
-                    if it == item_name and removed < needed:
-                        removed += 1
-                        continue
-                    new_items.append(it)
-                await user_conf.items.set(new_items)                
+                free = caught.get(name, 0) - fish_used.get(name, 0)
+                if free > 0:
+                    taken = min(free, needed)
+                    fish_used[name] = fish_used.get(name, 0) + taken
+                    needed -= taken
+            return needed <= 0
+
+        def rank(key: str) -> int:
+            return {"item": 0, "fish": 1, "rarity": 2}.get(key.split(":", 1)[0], 3)
+
+        for key in sorted(reqs, key=rank):
+            needed = reqs[key] * times
+            kind, _, name = key.partition(":")
+            if key == "any_fish":
+                # anything held that isn't a known fish is worth nothing, so it goes first
+                pool = [n for n in caught if n not in self.fish_definitions]
+                if not draw(pool + self._craft_pools["any_fish"], needed):
+                    return None
+            elif kind == "item":
+                if items.get(name, 0) < needed:
+                    return None
+                items_used[name] = needed
+            elif kind == "fish" and name in self.fish_definitions:
+                if not draw((name,), needed):
+                    return None
+            elif kind == "fish" and "biome:" + name in self._craft_pools:
+                # recipes may name a biome ("fish:Pond") for any fish from it
+                if state.tally("biome:" + name) < needed or not draw(self._craft_pools["biome:" + name], needed):
+                    return None
+            elif kind == "rarity" and key in self._craft_pools:
+                # the tally says up front whether the haul can cover it
+                if state.tally(key) < needed or not draw(self._craft_pools[key], needed):
+                    return None
             else:
-                ok = False
-                break
+                return None
+        return fish_used, items_used
 
-        if not ok:
-            return await ctx.send("❌ You don't have the necessary fish/items to craft that recipe.")
-
-        await user_conf.caught.set(remaining_inv)
-        result = recipe["result"]
-        messages = []
-        if "coins" in result:
-            amt = int(result["coins"])
-            new_bal, currency = await self._deposit(ctx.author, amt, ctx)
-            messages.append(f"🏆 Craft successful: **{recipe['name']}** — you received **{amt} {currency}**! New balance: **{new_bal} {currency}**.")
-        if "item" in result:
-            items = await user_conf.items()
-            items.append(result["item"])
-            await user_conf.items.set(items)
-            messages.append(f"🔧 Craft successful: **{recipe['name']}** — you received **{result['item']}**.")
-            await self._inc_stat(ctx.author, "crafts_done", 1)
-        if "items" in result:
-            items_cfg = await user_conf.items()
-            for iname, count in result["items"].items():
-                for _ in range(count):
-                    items_cfg.append(iname)
-            await user_conf.items.set(items_cfg)
-            added = ", ".join(f"{c}× {n}" for n, c in result["items"].items())
-            messages.append(f"🔧 Craft successful: **{recipe['name']}** — you received {added}.")
-
-        removed_summary = {}
-        for r in removed_fish:
-            removed_summary[r] = removed_summary.get(r, 0) + 1
-        removed_lines = ", ".join(f"{v}× {k}" for k, v in removed_summary.items()) if removed_summary else "None"
-        messages.insert(0, f"🛠️ You used: {removed_lines}")
-        try:
-            if recipe_id == "chum" and not await self._has_achievement(ctx.author, "first_chum"):
-                msg = await self._award_achievement(ctx, ctx.author, "first_chum")
-                if msg:
-                    messages.append(msg)
-                
-            if recipe_id == "trophy" and not await self._has_achievement(ctx.author, "trophy_maker"):
-                msg = await self._award_achievement(ctx, ctx.author, "trophy_maker")
-                if msg:
-                    messages.append(msg)
-                
-        except Exception:
-            pass        
-        await ctx.send("\n".join(messages))
+    @commands.command()
+    async def fishcraft(self, ctx, recipe_id: str, times: int = 1):
+        """
+        Craft an item using a recipe id. Use `fishcraftlist` to see available recipes.
+        Usage: fishcraft chum
+               fishcraft chum 20
+        """
+        recipe_id = self.names.resolve(recipe_id, "recipe")
+        if recipe_id is None:
+            return await ctx.send("❌ Unknown recipe. Use `fishcraftlist` to view available recipes.")
+        if times < 1:
+            return await ctx.send("❌ You need to craft at least once.")
+        recipe = self.crafting_recipes[recipe_id]
+        async with self._states.session(ctx.author) as state:
+            # validate everything first; nothing is consumed unless the whole batch fits
+            used = self._resolve_recipe(state, recipe["requirements"], times)
+            if used is None:
+                if times > 1:
+                    return await ctx.send(f"❌ You don't have the necessary fish/items to craft that recipe {times} times.")
+                return await ctx.send("❌ You don't have the necessary fish/items to craft that recipe.")
+            fish_used, items_used = used
+            for name, count in fish_used.items():
+                state.remove_fish(name, count)
+            for name, count in items_used.items():
+                state.remove_item(name, count)
+
+            result = recipe["result"]
+            batch = f"{times}× " if times > 1 else ""
+            messages = []
+            if "coins" in result:
+                amt = int(result["coins"]) * times
+                new_bal, currency = await self._deposit(ctx.author, amt, ctx)
+                messages.append(f"🏆 Craft successful: **{batch}{recipe['name']}** — you received **{amt} {currency}**! New balance: **{new_bal} {currency}**.")
+            if "item" in result:
+                state.add_item(result["item"], times)
+                messages.append(f"🔧 Craft successful: **{batch}{recipe['name']}** — you received **{batch}{result['item']}**.")
+                state.inc_stat("crafts_done", times)
+            if "items" in result:
+                for iname, count in result["items"].items():
+                    state.add_item(iname, count * times)
+                added = ", ".join(f"{c * times}× {n}" for n, c in result["items"].items())
+                messages.append(f"🔧 Craft successful: **{batch}{recipe['name']}** — you received {added}.")
+
+            consumed = {**fish_used, **items_used}
+            removed_lines = ", ".join(f"{v}× {k}" for k, v in consumed.items()) if consumed else "None"
+            if len(removed_lines) > 1000:
+                removed_lines = removed_lines[:1000].rsplit(",", 1)[0] + ", …"
+            messages.insert(0, f"🛠️ You used: {removed_lines}")
+            if recipe_id == "chum":
+                state.grant("first_chum")
+            if recipe_id == "trophy":
+                state.grant("trophy_maker")
+            messages.extend(await self._check_and_award(ctx, state))
+            await ctx.send("\n".join(messages)[:1900])
+
+    # "Chum 50" / "Chum x50" -> ("Chum", "50")
+    _USE_COUNT = re.compile(r"^(.+?)(?:\s+[x×]?(\d+))?$")
 
     @commands.command()
     async def fishuseitem(self, ctx, *, item_name: str):
-        """Use a consumable item from your items list (e.g., Chum, Stew Bowl, Mystery Box)."""
-        user_conf = self.config.user(ctx.author)
-        items = await user_conf.items()
-        # find exact item
-        match = next((it for it in items if it.lower() == item_name.lower()), None)
-        if not match:
-            return await ctx.send(f"❌ You don’t have **{item_name}** in your items.")
-        
-        # remove it once
-        items.remove(match)
-        await user_conf.items.set(items)
-
-        # handle each new recipe output
-        if match == "Trophy":
-            new_bal, currency = await self._deposit(ctx.author, 100, ctx)
-            return await ctx.send(
-                f"🏆 You used a **Trophy** and received **100 {currency}**! "
-                f"New balance: **{new_bal} {currency}**."
-            )
-            
-        if match == "Stew Bowl":
-            # +2 luck for next 5 casts
-            cur = await user_conf.luck()
-            await user_conf.luck.set(cur + 2)
-            return await ctx.send(
-                "🥣 You eat the **Hearty Fish Stew**. Your luck increases by **2** for the next casts!"
-            )
-
-        if match == "Stormcaller Lure":
-            cur = await user_conf.luck()
-            await user_conf.luck.set(cur + 3)
-            return await ctx.send(
-                "🌀 You attach the **Stormcaller Lure**. Next cast chance of Rare+ fish is doubled!"
-            )
-
-        if match == "Plaque":
-            # sellable trophy plaque
-            new_bal, currency = await self._deposit(ctx.author, 200, ctx)
-            return await ctx.send(
-                f"🏆 You display the **Angler’s Plaque** and gain **200 {currency}**! "
-                f"New balance: **{new_bal} {currency}**."
-            )
-
-        if match == "Fish Oil Flask":
-            # instant coins
-            new_bal, currency = await self._deposit(ctx.author, 50, ctx)
-            return await ctx.send(
-                f"🛢️ You extract the **Fish Oil Flask** for **50 {currency}**. "
-                f"New balance: **{new_bal} {currency}**."
-            )
-
-        if match == "Nutrient Pack":
-            # gain 3 bait immediately
-            cur = await user_conf.bait()
-            await user_conf.bait.set(cur + 3)
-            return await ctx.send(
-                f"🌱 You use the **Nutrient Pack**. You gain **3** bait (now {cur+3})."
-            )
-
-        if match == "Rod Coil":
-            # temporary rod durability buff
-            await ctx.send(
-                "⚙️ You install the **Durability Coil**. Your rod break chance is halved for your next 100 casts!"
-            )
-            # optionally you could track a counter in config to expire this buff after 100 casts
-
-        if match == "Tonic Bottle":
-            # reset streak + coin bonus
-            stats = await user_conf.stats()
-            stats["consecutive_catches"] = 0
-            await user_conf.stats.set(stats)
-            new_bal, currency = await self._deposit(ctx.author, 200, ctx)
-            return await ctx.send(
-                f"🧪 You drink the **Mystic Angler’s Tonic**. Your catch streak resets and you gain **200 {currency}**!"
-            )
-
-        if match == "Festival Pack":
-            cur = await user_conf.luck()
-            await user_conf.luck.set(cur + 5)
-            return await ctx.send(
-                "🎊 You open the **Festival Pack**! Next cast triggers a Festival event for bonus rewards."
-            )
-
-        if match == "Biome Explorer’s Journal":
-            new_bal, currency = await self._deposit(ctx.author, 100, ctx)
-            return await ctx.send(
-                f"📖 You study the **Biome Explorer’s Journal**. Rare biome fish chance +10% for 10 casts, "
-                f"and you gain **100 {currency}**! New balance: **{new_bal} {currency}**."
-            )
-
-        if match == "Mystery Box":
-            # randomize one of three rewards
-            choice = random.choice(["Rod Core", "coins", "Treasure Map"])
-            if choice == "Rod Core":
-                items = await user_conf.items()
-                items.append("Rod Core")
-                await user_conf.items.set(items)
-                return await ctx.send("📦 Mystery Box! You found a **Rod Core** inside!")
-            elif choice == "Treasure Map":
-                items = await user_conf.items()
-                items.append("Treasure Map")
-                await user_conf.items.set(items)
-                return await ctx.send("📦 Mystery Box! You found a **Treasure Map** inside!")
+        """
+        Use a consumable item from your items list (e.g., Chum, Stew Bowl, Mystery Box).
+        Add a count to use several at once.
+        Usage: fishuseitem Mystery Box
+               fishuseitem Chum 50
+        """
+        m = self._USE_COUNT.match(item_name.strip())
+        item_name, count = m.group(1), int(m.group(2) or 1)
+        if count < 1:
+            return await ctx.send("❌ Use at least one.")
+        async with self._states.session(ctx.author) as state:
+            match = self.names.resolve(item_name, "item")
+            if not match or state.item_count(match) < 1:
+                hint = self._did_you_mean(item_name, "item", among=state.items)
+                return await ctx.send(f"❌ You don’t have **{item_name}** in your items.{hint}")
+            effect = self._data.effects.get(match)
+            # anything else isn’t usable, and is not consumed
+            if effect is None:
+                return await ctx.send(f"❌ **{match}** cannot be used directly.")
+            have = state.item_count(match)
+            if have < count:
+                return await ctx.send(f"❌ You only have {have}× **{match}**.")
+
+            state.remove_item(match, count)
+            result = use_effect(effect, state, count)
+            currency = await self._bank.get_currency_name(ctx.guild)
+            balance = await self._bank.deposit_credits(ctx.author, result.coins) if result.coins else None
+
+            if count == 1 and result.message:
+                reply = result.message.format(
+                    coins=result.coins, currency=currency, balance=balance, bait=state.bait, luck=state.luck
+                )
             else:
-                amt = random.randint(100, 300)
-                new_bal, currency = await self._deposit(ctx.author, amt, ctx)
-                return await ctx.send(f"📦 Mystery Box! You got **{amt} {currency}**!")
-
-        # fallback for older items
-        if match == "Chum":
-            cur = await user_conf.luck()
-            await user_conf.luck.set(cur + 3)
-            return await ctx.send("🪼 You used **Chum**. Your luck increased by **3** for the next casts.")
-
-        if match == "Treasure Map":
-            coins = random.randint(20, 100)
-            new_bal, currency = await self._deposit(ctx.author, coins, ctx)
-            return await ctx.send(
-                f"🗺️ You follow the map and dig up **{coins} {currency}**! New balance: **{new_bal} {currency}**."
-            )
-
-        # anything else isn’t usable
-        return await ctx.send(f"❌ **{match}** cannot be used directly.")
+                buff_names = {b: d.name for b, d in self.buff_definitions.items()}
+                done = "; ".join(result.summary(currency, buff_names)) or "nothing happened"
+                reply = f"🎒 You used **{count}× {match}**: {done}."
+                if balance is not None:
+                    reply += f" New balance: **{balance} {currency}**."
+            ach_msgs = await self._check_and_award(ctx, state)
+            if ach_msgs:
+                reply += "\n\n" + "\n".join(ach_msgs)
+            await ctx.send(reply)
 
 
     # ---------- Rod view and upgrade ----------
     @commands.command()
     async def rod(self, ctx):
         """Show your rod level, fragments, cores and next upgrade requirements (embed + image)."""
-        user_conf = self.config.user(ctx.author)
-        lvl       = await user_conf.rod_level()
-        items     = await user_conf.items()
-        fragments = items.count("Rod Fragment")
-        cores     = items.count("Rod Core")
+        state     = await self._load_state(ctx.author)
+        lvl       = state.rod_level
+        fragments = state.item_count("Rod Fragment")
+        cores     = state.item_count("Rod Core")
         next_req  = self.rod_upgrade_requirements.get(lvl + 1)
 
         # Build the embed
@@ -3314,52 +1921,43 @@ class Fishing(commands.Cog):
     @commands.command()
     async def upgraderod(self, ctx):
         """Upgrade your rod using fragments/cores and (optional) coins."""
-        user_conf = self.config.user(ctx.author)
-        lvl = await user_conf.rod_level()
-        target = lvl + 1
-        req = self.rod_upgrade_requirements.get(target)
-        if not req:
-            return await ctx.send("🔒 Your rod is already at max level.")
-
-        items = await user_conf.items()
-        fragments = items.count("Rod Fragment")
-        cores = items.count("Rod Core")
-
-        if cores >= 1:
-            items.remove("Rod Core")
-            await user_conf.items.set(items)
-            await user_conf.rod_level.set(target)
-            ach_id = f"rod_master_{target}"
-            if ach_id in self.achievements and not await self._has_achievement(ctx.author, ach_id):
-                msg = await self._award_achievement(ctx, ctx.author, ach_id)
-                if msg:
-                    await ctx.send(msg)            
-            return await ctx.send(f"✨ You used a Rod Core and upgraded your rod to level **{target}**!")
-
-        need_frag = req["fragments"]
-        cost = req.get("coins", 0)
-        if fragments < need_frag:
-            return await ctx.send(f"❌ You need **{need_frag} Rod Fragments** (you have {fragments}).")
-
-        if cost and not await bank.can_spend(ctx.author, cost):
-            bal = await bank.get_balance(ctx.author)
-            currency = await bank.get_currency_name(ctx.guild)
-            return await ctx.send(f"❌ Upgrade costs **{cost} {currency}**, you only have **{bal} {currency}**.")
-
-        removed = 0
-        new_items = []
-        for it in items:
-            if it == "Rod Fragment" and removed < need_frag:
-                removed += 1
-                continue
-            new_items.append(it)
-        await user_conf.items.set(new_items)
-
-        if cost:
-            await bank.withdraw_credits(ctx.author, cost)
-
-        await user_conf.rod_level.set(target)
-        await ctx.send(f"🔧 Upgrade complete! Your rod is now level **{target}**.")
+        async with self._states.session(ctx.author) as state:
+            lvl = state.rod_level
+            target = lvl + 1
+            req = self.rod_upgrade_requirements.get(target)
+            if not req:
+                return await ctx.send("🔒 Your rod is already at max level.")
+
+            fragments = state.item_count("Rod Fragment")
+            cores = state.item_count("Rod Core")
+
+            if cores >= 1:
+                state.remove_item("Rod Core")
+                state.rod_level = target
+                ach_msgs = await self._check_and_award(ctx, state)
+                if ach_msgs:
+                    await ctx.send("\n".join(ach_msgs))
+                return await ctx.send(f"✨ You used a Rod Core and upgraded your rod to level **{target}**!")
+
+            need_frag = req["fragments"]
+            cost = req.get("coins", 0)
+            if fragments < need_frag:
+                return await ctx.send(f"❌ You need **{need_frag} Rod Fragments** (you have {fragments}).")
+
+            if cost and not await self._bank.can_spend(ctx.author, cost):
+                bal = await self._bank.get_balance(ctx.author)
+                currency = await self._bank.get_currency_name(ctx.guild)
+                return await ctx.send(f"❌ Upgrade costs **{cost} {currency}**, you only have **{bal} {currency}**.")
+
+            if cost:
+                await self._bank.withdraw_credits(ctx.author, cost)
+
+            state.remove_item("Rod Fragment", need_frag)
+            state.rod_level = target
+            ach_msgs = await self._check_and_award(ctx, state)
+            if ach_msgs:
+                await ctx.send("\n".join(ach_msgs))
+            await ctx.send(f"🔧 Upgrade complete! Your rod is now level **{target}**.")
 
     # ---------- NPC and Quest Commands ----------
     @commands.command()
@@ -3381,7 +1979,8 @@ class Fishing(commands.Cog):
 
     @commands.command()
     async def fishtalknpc(self, ctx, npc_key: str):
-        npc = self.npcs.get(npc_key.lower())
+        npc_key = self.names.resolve(npc_key, "npc") or npc_key
+        npc = self.npcs.get(npc_key)
         if not npc:
             return await ctx.send("❌ Unknown NPC. Use `npcs` to see available NPCs.")
 
@@ -3513,17 +2112,17 @@ class Fishing(commands.Cog):
 
         if str(reaction.emoji) == "✅":
             # accept logic
-            user_conf = self.config.user(ctx.author)
-            qstate    = await user_conf.quests()
-            if qstate.get("active"):
-                return await ctx.send("❌ Finish or abandon your current quest first.")
-            prev = qstate.get("completed", [])
-            await user_conf.quests.set({
-                "active":    quest_id,
-                "step":      0,
-                "progress":  {},
-                "completed": prev,
-            })
+            async with self._states.session(ctx.author) as state:
+                qstate = state.quests
+                if qstate.get("active"):
+                    return await ctx.send("❌ Finish or abandon your current quest first.")
+                prev = qstate.get("completed", [])
+                state.quests = {
+                    "active":    quest_id,
+                    "step":      0,
+                    "progress":  {},
+                    "completed": prev,
+                }
             await ctx.send(f"✅ Quest accepted: **{qdef['title']}**. Use `fishquest` to track progress.")
         else:
             await ctx.send("❌ Quest acceptance cancelled.")
@@ -3534,8 +2133,8 @@ class Fishing(commands.Cog):
     @commands.command()
     async def fishquest(self, ctx):
         """Show your current quest and progress (embed + static image)."""
-        user_conf = self.config.user(ctx.author)
-        qstate    = await user_conf.quests()
+        state     = await self._load_state(ctx.author)
+        qstate    = state.quests
         active    = qstate.get("active")
         if not active:
             return await ctx.send(
@@ -3545,7 +2144,9 @@ class Fishing(commands.Cog):
 
         qdef       = self.quests.get(active)
         if not qdef:
-            await user_conf.quests.set({})
+            async with self._states.session(ctx.author) as state:
+                if state.quests.get("active") == active:
+                    state.quests = {}
             return await ctx.send(
                 "Your active quest was invalid and has been cleared. Please pick a new quest."
             )
@@ -3578,26 +2179,17 @@ class Fishing(commands.Cog):
                 needed = step["count"]
                 name   = step.get("name")
                 rarity = step.get("rarity")
-                inv    = await user_conf.caught()
-                have = (
-                    inv.count(name)
-                    if name
-                    else sum(1 for f in inv
-                             if f in self.fish_definitions
-                             and self.fish_definitions[f]["rarity"] == rarity)
-                )
+                have   = self._quest_fish_count(state, name, rarity)
                 prog = f"{have}/{needed}"
             elif step["type"] == "deliver_item":
                 needed = step["count"]
                 item   = step["item"]
-                inv_it = await user_conf.items()
-                have   = inv_it.count(item)
+                have   = state.item_count(item)
                 prog   = f"{have}/{needed} × {item}"
             elif step["type"] == "sell_value":
                 needed = step["amount"]
-                stats  = await user_conf.stats()
-                have   = stats.get("sell_total", 0)
-                curr   = await bank.get_currency_name(ctx.guild)
+                have   = state.stats.get("sell_total", 0)
+                curr   = await self._bank.get_currency_name(ctx.guild)
                 prog   = f"{have}/{needed} {curr}"
 
             if prog:
@@ -3616,17 +2208,22 @@ class Fishing(commands.Cog):
     @commands.command()
     async def fishabandonquest(self, ctx):
         """Abandon your current active quest."""
-        user_conf = self.config.user(ctx.author)
-        qstate = await user_conf.quests()
-        if not qstate or not qstate.get("active"):
-            return await ctx.send("You have no active quest to abandon.")
-        prev_completed = qstate.get("completed", [])
-        await user_conf.quests.set({"completed": prev_completed})
+        async with self._states.session(ctx.author) as state:
+            qstate = state.quests
+            if not qstate or not qstate.get("active"):
+                return await ctx.send("You have no active quest to abandon.")
+            prev_completed = qstate.get("completed", [])
+            state.quests = {"completed": prev_completed}
         await ctx.send("You abandoned your active quest. Use `talknpc <npc>` to pick up new ones.")
 
-    async def _advance_quest_on_catch(self, user, fish_name: str):
-        user_conf = self.config.user(user)
-        qstate = await user_conf.quests()
+    def _quest_fish_count(self, state: UserState, name: Optional[str], rarity: Optional[str]) -> int:
+        """How many held fish satisfy a collect_fish step (by exact name, else by rarity)."""
+        if name:
+            return state.fish_count(name)
+        return state.tally("rarity:" + rarity) if rarity else 0
+
+    def _advance_quest_on_catch(self, state: UserState, fish_name: str):
+        qstate = state.quests
         active = qstate.get("active")
         if not active:
             return
@@ -3641,32 +2238,25 @@ class Fishing(commands.Cog):
             needed = step.get("count", 1)
             name = step.get("name")
             rarity = step.get("rarity")
-            inv = await user_conf.caught()
-            have = 0
-            if name:
-                have = inv.count(name)
-            else:
-                for f in inv:
-                    if f in self.fish_definitions and self.fish_definitions[f].get("rarity") == rarity:
-                        have += 1
-            if have >= needed:
+            if self._quest_fish_count(state, name, rarity) >= needed:
                 qstate["step"] = step_idx + 1
-                await user_conf.quests.set(qstate)
+                state.touch()
+
+    async def _complete_quest_for_user(self, state: UserState, ctx=None):
+        """Internal helper: complete and pay out the active quest on a loaded state. Returns message string.
 
-    async def _complete_quest_for_user(self, user, ctx=None):
-        """Internal helper: complete and pay out the active quest for a user. Returns message string."""
-        user_conf = self.config.user(user)
-        qstate = await user_conf.quests()
+        The caller is responsible for committing ``state``.
+        """
+        user = state.user
+        qstate = state.quests
         active = qstate.get("active")
         if not active:
             return "No active quest to complete."
         qdef = self.quests.get(active)
         if not qdef:
-            await user_conf.quests.set({})
+            state.quests = {}
             return "Quest data invalid; cleared."
-        inv = await user_conf.caught()
-        items = await user_conf.items()
-        stats = await user_conf.stats()
+        stats = state.stats
         # verify steps
         for step in qdef["steps"]:
             t = step["type"]
@@ -3674,20 +2264,12 @@ class Fishing(commands.Cog):
                 needed = step.get("count", 1)
                 name = step.get("name")
                 rarity = step.get("rarity")
-                have = 0
-                if name:
-                    have = inv.count(name)
-                else:
-                    for f in inv:
-                        if f in self.fish_definitions and self.fish_definitions[f].get("rarity") == rarity:
-                            have += 1
-                if have < needed:
+                if self._quest_fish_count(state, name, rarity) < needed:
                     return "You have not yet completed the quest steps."
             elif t == "deliver_item":
                 needed = step.get("count", 1)
                 item = step.get("item")
-                have = items.count(item)
-                if have < needed:
+                if state.item_count(item) < needed:
                     return "You have not yet completed the quest steps."
             elif t == "sell_value":
                 needed = step.get("amount", 0)
@@ -3699,44 +2281,22 @@ class Fishing(commands.Cog):
                 return "Unknown quest step type; cannot complete."
 
         # consume required things
-        remaining_inv = list(inv)
-        remaining_items = list(items)
         for step in qdef["steps"]:
             if step["type"] == "collect_fish":
                 needed = step.get("count", 1)
                 name = step.get("name")
                 rarity = step.get("rarity")
                 if name:
-                    removed = 0
-                    new_rem = []
-                    for f in remaining_inv:
-                        if f == name and removed < needed:
-                            removed += 1
-                            continue
-                        new_rem.append(f)
-                    remaining_inv = new_rem
+                    state.remove_fish(name, needed)
                 else:
+                    # cheapest fish of the rarity first, as crafting does
                     to_remove = needed
-                    for f in list(remaining_inv):
+                    for f in self._craft_pools.get("rarity:" + rarity, ()):
                         if to_remove <= 0:
                             break
-                        if f in self.fish_definitions and self.fish_definitions[f].get("rarity") == rarity:
-                            remaining_inv.remove(f)
-                            to_remove -= 1
+                        to_remove -= state.remove_fish(f, to_remove)
             elif step["type"] == "deliver_item":
-                needed = step.get("count", 1)
-                item = step.get("item")
-                removed = 0
-                new_items = []
-                for it in remaining_items:
-                    if it == item and removed < needed:
-                        removed += 1
-                        continue
-                    new_items.append(it)
-                remaining_items = new_items
-
-        await user_conf.caught.set(remaining_inv)
-        await user_conf.items.set(remaining_items)
+                state.remove_item(step.get("item"), step.get("count", 1))
 
         rewards = qdef.get("rewards", {})
         messages = []
@@ -3746,69 +2306,59 @@ class Fishing(commands.Cog):
             messages.append(f"You received {amt} {currency}. New balance: {new_bal} {currency}.")
         if "items" in rewards:
             added_items = []
-            items_cfg = await user_conf.items()
             for iname, cnt in rewards["items"].items():
-                for _ in range(cnt):
-                    items_cfg.append(iname)
+                state.add_item(iname, cnt)
                 added_items.append(f"{cnt}× {iname}")
-            await user_conf.items.set(items_cfg)
             messages.append("You received: " + ", ".join(added_items))
 
-        prev = await self.config.user(user).quests()
-        completed_list = prev.get("completed", [])
+        completed_list = qstate.get("completed", [])
         if not qdef.get("repeatable", False):
             if active not in completed_list:
                 completed_list.append(active)
-        await user_conf.quests.set({"completed": completed_list})
-        try:
-            stats = await user_conf.stats()
-            stats["quests_completed_total"] = stats.get("quests_completed_total", 0) + 1
-            await user_conf.stats.set(stats)
-            if stats["quests_completed_total"] >= 5 and not await self._has_achievement(user, "npc_friend"):
-                await self._award_achievement(ctx or None, user, "npc_friend")
-            if stats["quests_completed_total"] >= 25 and not await self._has_achievement(user, "quest_master"):
-                await self._award_achievement(ctx or None, user, "quest_master")
-        except Exception:
-            pass        
+        state.quests = {"completed": completed_list}
+        state.inc_stat("quests_completed_total")
         return "Quest complete! " + " ".join(messages)
 
     @commands.command()
     async def fishcompletequest(self, ctx):
         """Attempt to complete and claim rewards for your active quest."""
-        user_conf = self.config.user(ctx.author)
-        qstate    = await user_conf.quests()
-        active    = qstate.get("active")
-        if not active:
-            return await ctx.send("❌ You have no active quest.")
-
-        # try to complete the quest
-        result = await self._complete_quest_for_user(ctx.author, ctx)
-
-        # helper returns "Quest complete! …" on success
-        if result.startswith("Quest complete!"):
-            qdef = self.quests.get(active, {})
-            # build embed
-            embed = discord.Embed(
-                title=f"🏁 Quest Completed: {qdef.get('title','Unknown')}",
-                description="Congratulations! Here’s what you earned:",
-                colour=discord.Colour.purple()
-            )
-            # banner
-            embed.set_image(url="https://files.catbox.moe/npxvr7.png")
+        async with self._states.session(ctx.author) as state:
+            active = state.quests.get("active")
+            if not active:
+                return await ctx.send("❌ You have no active quest.")
+
+            # try to complete the quest
+            result = await self._complete_quest_for_user(state, ctx)
+            ach_msgs = await self._check_and_award(ctx, state)
+
+            # helper returns "Quest complete! …" on success
+            if result.startswith("Quest complete!"):
+                qdef = self.quests.get(active, {})
+                # build embed
+                embed = discord.Embed(
+                    title=f"🏁 Quest Completed: {qdef.get('title','Unknown')}",
+                    description="Congratulations! Here’s what you earned:",
+                    colour=discord.Colour.purple()
+                )
+                # banner
+                embed.set_image(url="https://files.catbox.moe/npxvr7.png")
 
-            # strip the "Quest complete! " prefix and put the rest into a field
-            rewards_text = result[len("Quest complete! "):]
-            embed.add_field(name="Rewards", value=rewards_text, inline=False)
+                # strip the "Quest complete! " prefix and put the rest into a field
+                rewards_text = result[len("Quest complete! "):]
+                embed.add_field(name="Rewards", value=rewards_text, inline=False)
 
-            await ctx.send(embed=embed)
-        else:
-            # something went wrong (e.g. steps not done)
-            await ctx.send(result)
+                await ctx.send(embed=embed)
+                if ach_msgs:
+                    await ctx.send("\n".join(ach_msgs))
+            else:
+                # something went wrong (e.g. steps not done)
+                await ctx.send(result)
 
     @commands.command()
     async def fishvisitnpc(self, ctx, npc_key: str):
         """Visit an NPC to advance a quest step or just chat. Shows a banner embed."""
-        npc = self.npcs.get(npc_key.lower())
+        npc_key = self.names.resolve(npc_key, "npc") or npc_key
+        npc = self.npcs.get(npc_key)
         if not npc:
             return await ctx.send("❌ Unknown NPC. Use `npcs` to list them.")
 
@@ -3824,113 +2374,171 @@ class Fishing(commands.Cog):
             embed.set_image(url=image_url)
 
         # Quest‐advancement logic
-        user_conf = self.config.user(ctx.author)
-        qstate    = await user_conf.quests()
-        active    = qstate.get("active")
-        advanced  = False
-
-        if active:
-            qdef = self.quests.get(active)
-            step_idx = qstate.get("step", 0)
-            if qdef and step_idx < len(qdef["steps"]):
-                step = qdef["steps"][step_idx]
-                if step["type"] == "visit_npc" and step.get("npc") == npc_key.lower():
-                    qstate["step"] = step_idx + 1
-                    await user_conf.quests.set(qstate)
-                    advanced = True
-                    embed.add_field(
-                        name="Quest Updated",
-                        value=f"Step {step_idx+1}/{len(qdef['steps'])} complete: “{step.get('desc','')}”",
-                        inline=False
-                    )
+        async with self._states.session(ctx.author) as state:
+            qstate    = state.quests
+            active    = qstate.get("active")
+            advanced  = False
+
+            if active:
+                qdef = self.quests.get(active)
+                step_idx = qstate.get("step", 0)
+                if qdef and step_idx < len(qdef["steps"]):
+                    step = qdef["steps"][step_idx]
+                    if step["type"] == "visit_npc" and step.get("npc") == npc_key:
+                        qstate["step"] = step_idx + 1
+                        state.touch()
+                        advanced = True
+                        embed.add_field(
+                            name="Quest Updated",
+                            value=f"Step {step_idx+1}/{len(qdef['steps'])} complete: “{step.get('desc','')}”",
+                            inline=False
+                        )
 
         # If no active quest or nothing to advance, just show the greeting
         await ctx.send(embed=embed)
 
         
     @commands.command()
-    async def fishleaderboard(self, ctx, top: int = 10):
+    @commands.guild_only()
+    async def fishleaderboard(self, ctx, metric: str = "fish", top: int = 10):
         """
-        Show the top anglers on this server by total fish caught.
+        Show the top anglers on this server.
+        Metrics: fish (default), value, sold, unique
+        Usage: fishleaderboard
+               fishleaderboard sold 5
         """
-        # gather (member, count) for everyone who has cast at least once
-        entries = []
-        for member in ctx.guild.members:
-            stats = await self.config.user(member).stats()
-            count = stats.get("fish_caught", 0)
-            if count > 0:
-                entries.append((member.display_name, count))
-
+        # keep the old `fishleaderboard 5` form working
+        if metric.isdigit():
+            metric, top = "fish", int(metric)
+        key = self.leaderboard.resolve_metric(metric)
+        if key is None:
+            return await ctx.send("❌ Unknown leaderboard. Choose from: fish, value, sold, unique.")
+        top = max(1, min(top, 25))
+
+        await self.leaderboard.ensure_built()
+        guild = ctx.guild
+        entries = self.leaderboard.top(key, top, among={m.id for m in guild.members})
+
+        title, unit = LEADERBOARD_METRICS[key]
         if not entries:
-            return await ctx.send("No one has caught any fish yet on this server.")
+            if key == "fish_caught":
+                return await ctx.send("No one has caught any fish yet on this server.")
+            return await ctx.send(f"No one is on the {title} leaderboard yet on this server.")
 
-        # sort highest → lowest and take the top N
-        entries.sort(key=lambda x: x[1], reverse=True)
-        entries = entries[:top]
+        if unit is None:
+            unit = await self._bank.get_currency_name(guild)
 
         # build embed
+        lines = []
+        for i, (user_id, value) in enumerate(entries):
+            lines.append(f"**{i+1}.** {guild.get_member(user_id).display_name}: {value:,} {unit}")
         emb = discord.Embed(
-            title="🐟 Fishing Leaderboard",
-            description="\n".join(f"**{i+1}.** {name}: {count} fish"
-                                 for i, (name, count) in enumerate(entries)),
+            title=f"🐟 Fishing Leaderboard — {title}",
+            description="\n".join(lines),
             colour=discord.Colour.blue()
         )
         # thumbnail for flavor—swap this URL for your own graphic
         emb.set_thumbnail(url="https://files.catbox.moe/awbf4w.png")
 
         await ctx.send(embed=emb)
+
+    @commands.command()
+    @commands.guild_only()
+    async def fishdaily(self, ctx, top: int = 10):
+        """
+        Show who caught the most fish on this server in the last 24 hours.
+        Usage: fishdaily
+               fishdaily 5
+        """
+        if self.catch_log is None:
+            return await ctx.send("❌ The catch log isn't available right now.")
+        top = max(1, min(top, 25))
+        guild = ctx.guild
+        counts: Dict[int, int] = {}
+        values: Dict[int, int] = {}
+        for user_id, fish_name, n in await self.catch_log.last_day(guild_id=guild.id):
+            counts[user_id] = counts.get(user_id, 0) + n
+            values[user_id] = values.get(user_id, 0) + n * self.fish_prices.get(fish_name, 0)
+        ranked = sorted(
+            (uid for uid in counts if guild.get_member(uid) is not None),
+            key=lambda uid: (-counts[uid], -values[uid]),
+        )[:top]
+        if not ranked:
+            return await ctx.send("No one has caught any fish on this server in the last 24 hours.")
+
+        currency = await self._bank.get_currency_name(guild)
+        lines = [
+            f"**{i + 1}.** {guild.get_member(uid).display_name}: {counts[uid]:,} fish "
+            f"(worth {values[uid]:,} {currency})"
+            for i, uid in enumerate(ranked)
+        ]
+        emb = discord.Embed(
+            title="🐟 Fishing Leaderboard — Last 24 Hours",
+            description="\n".join(lines),
+            colour=discord.Colour.blue()
+        )
+        emb.set_thumbnail(url="https://files.catbox.moe/awbf4w.png")
+        await ctx.send(embed=emb)
         
+    _GIFT_PART = re.compile(r"^(?:(\d+)\s*[x×]?\s+)?(.+)$")
+
+    @classmethod
+    def _parse_gift(cls, text: str) -> Optional[List[Tuple[int, str]]]:
+        """Parse "2 Salmon, 1 Treasure Map" into [(2, "Salmon"), (1, "Treasure Map")]."""
+        parts = []
+        for chunk in text.split(","):
+            chunk = chunk.strip()
+            if not chunk:
+                continue
+            m = cls._GIFT_PART.match(chunk)
+            name = m.group(2).strip().strip('"').strip()
+            if not name:
+                return None
+            parts.append((int(m.group(1) or 1), name))
+        return parts or None
+
     @commands.command()
-    async def givefish(self, ctx, recipient: discord.Member, amount: int, *, name: str):
+    async def givefish(self, ctx, recipient: discord.Member, *, gift: str):
         """
         Give away your fish or items to another user.
         Usage: givefish @Bob 2 Salmon
                givefish @Bob 1 "Treasure Map"
+               givefish @Bob 2 Salmon, 1 Treasure Map
         """
-        giver_conf = self.config.user(ctx.author)
-        rec_conf   = self.config.user(recipient)
-
-        # Normalize lookup
-        # Try fish first, then items
-        is_fish = name in self.fish_definitions
-        if is_fish:
-            src_list = await giver_conf.caught()
-        else:
-            src_list = await giver_conf.items()
-
-        have = src_list.count(name)
-        if have < amount:
-            return await ctx.send(
-                f"❌ You only have {have}× **{name}** to give, but tried to give {amount}."
-            )
-
-        # remove from giver
-        for _ in range(amount):
-            src_list.remove(name)
-        if is_fish:
-            await giver_conf.caught.set(src_list)
-        else:
-            await giver_conf.items.set(src_list)
-
-        # add to recipient
-        if is_fish:
-            dst_list = await rec_conf.caught()
-            dst_list.extend([name] * amount)
-            await rec_conf.caught.set(dst_list)
-        else:
-            dst_list = await rec_conf.items()
-            dst_list.extend([name] * amount)
-            await rec_conf.items.set(dst_list)
-
-        await ctx.send(
-            f"🤝 {ctx.author.mention} gave {amount}× **{name}** to {recipient.mention}!"
-        )
+        if recipient == ctx.author or recipient.bot:
+            return await ctx.send("❌ Pick another angler to give to.")
+        parts = self._parse_gift(gift)
+        if not parts or any(count < 1 for count, _ in parts):
+            return await ctx.send("❌ Tell me what to give, e.g. `givefish @Bob 2 Salmon, 1 Treasure Map`.")
+
+        async with self._states.session_many(ctx.author, recipient) as (giver, receiver):
+            fish: Dict[str, int] = {}
+            items: Dict[str, int] = {}
+            for count, name in parts:
+                real = self.names.resolve(name, "fish", "item") or name
+                if real in self.fish_definitions:
+                    fish[real] = fish.get(real, 0) + count
+                else:
+                    items[real] = items.get(real, 0) + count
+
+            missing = transfer(giver, receiver, fish, items)
+            if missing:
+                short = ", ".join(f"{n}× **{name}**" for name, n in missing.items())
+                return await ctx.send(f"❌ You're short of {short} — nothing was given.")
+            ach_msgs = await self._check_and_award(ctx, receiver)
+
+        given = ", ".join(f"{count}× **{name}**" for name, count in {**fish, **items}.items())
+        reply = f"🤝 {ctx.author.mention} gave {given} to {recipient.mention}!"
+        if ach_msgs:
+            # the unlocks (and their rewards) are the recipient's
+            reply += f"\n\n{recipient.mention}:\n" + "\n".join(ach_msgs)
+        await ctx.send(reply)
         
     @commands.command(name="fishgear")
     async def fishgear(self, ctx):
         """Show your equipped reel, line, and lure."""
-        user_conf = self.config.user(ctx.author)
-        eq = await user_conf.equipment()
+        state = await self._load_state(ctx.author)
+        eq = state.equipment
 
         embed = discord.Embed(
             title=f"{ctx.author.display_name}'s Fishing Gear",
@@ -3947,8 +2555,9 @@ class Fishing(commands.Cog):
         embed.add_field(name="⚙️ Reel", value=fmt("rod_reel", "reels"), inline=False)
         embed.add_field(name="🧵 Line", value=fmt("rod_line", "lines"), inline=False)
         embed.add_field(name="🪝 Lure", value=fmt("rod_lure", "lures"), inline=False)
-        vessel = await user_conf.vessel()
-        embed.add_field(name="⛵ Vessel", value=vessel or "None", inline=False)        
+        embed.add_field(name="⛵ Vessel", value=state.vessel or "None", inline=False)
+        effects = self._rod_profile(state).describe()
+        embed.add_field(name="📈 Rod effects", value=", ".join(effects) or "None", inline=False)
 
         await ctx.send(embed=embed)
 
@@ -3961,111 +2570,118 @@ class Fishing(commands.Cog):
                fishequip lure "Glow Lure"
         """
         slot = slot.lower()
-        user_conf = self.config.user(ctx.author)
-        items = await user_conf.items()
-
-        mapping = {
-            "reel": ("rod_reel", "reels"),
-            "line": ("rod_line", "lines"),
-            "lure": ("rod_lure", "lures"),
-        }
-        if slot not in mapping:
-            return await ctx.send("❌ Invalid slot. Choose one of: reel, line, lure.")
+        async with self._states.session(ctx.author) as state:
 
-        cfg_key, category = mapping[slot]
-        if item_name not in self.gear_definitions[category]:
-            valid = ", ".join(self.gear_definitions[category].keys())
-            return await ctx.send(f"❌ Unknown {slot}. Available: {valid}")
+            mapping = {
+                "reel": ("rod_reel", "reels"),
+                "line": ("rod_line", "lines"),
+                "lure": ("rod_lure", "lures"),
+            }
+            if slot not in mapping:
+                return await ctx.send("❌ Invalid slot. Choose one of: reel, line, lure.")
 
-        if items.count(item_name) < 1:
-            return await ctx.send(f"❌ You don't have **{item_name}** in your items.")
+            cfg_key, category = mapping[slot]
+            item_name = self.names.resolve(item_name, "gear") or item_name
+            if item_name not in self.gear_definitions[category]:
+                valid = ", ".join(self.gear_definitions[category].keys())
+                return await ctx.send(f"❌ Unknown {slot}. Available: {valid}")
 
-        # remove the new gear from inventory
-        items.remove(item_name)
-        # return the old gear (if any) back to inventory
-        eq = await user_conf.equipment()
-        previous = eq.get(cfg_key)
-        if previous:
-            items.append(previous)
+            if state.item_count(item_name) < 1:
+                return await ctx.send(f"❌ You don't have **{item_name}** in your items.")
 
-        # save changes
-        await user_conf.items.set(items)
-        eq[cfg_key] = item_name
-        await user_conf.equipment.set(eq)
+            # swap the new gear in, returning the old gear (if any) to inventory
+            state.remove_item(item_name)
+            previous = state.equip(cfg_key, item_name)
+            if previous:
+                state.add_item(previous)
 
-        await ctx.send(f"✨ You equipped **{item_name}** to your {slot} slot!")
+            await ctx.send(f"✨ You equipped **{item_name}** to your {slot} slot!")
 
     @commands.command(name="fishshop")
     async def fishshop(self, ctx):
         """
         Shop split in 3 pages: Vessels, Gear, Consumables.
-        Navigate with ⬅️/➡️, stop with ⏹️.
+        Navigate with the ⬅️/➡️ buttons, stop with ⏹️.
         """
-        currency = await bank.get_currency_name(ctx.guild)
-        bal = await bank.get_balance(ctx.author)
-
-        # Page 1: Vessels
-        page1 = discord.Embed(
-            title="🎣 Fishing Shop — Page 1/3: Vessels",
-            colour=discord.Colour.gold(),
-            description=f"Balance: **{bal} {currency}**\nUse `fishbuy <item>` to purchase."
-        )
-        page1.set_thumbnail(url="https://files.catbox.moe/9r0mzw.png")
-
-        emoji_map = {
-            "Rowboat":"⛵","Canoe":"🛶","Wooden Dinghy":"🚤",
-            "Glass-Bottom Skiff":"🔍","Steel Trawler":"⚙️","Sailboat":"⛵",
-            "Magma Dinghy":"🔥","Ghost Drifter":"👻","Dreamboat":"🌙",
-            "Enchanted Barque":"🔮","Submersible Pod":"🧜","Fossil Frigate":"⚓",
-            "Fishing Yacht":"🚢",
-        }
-        for name, info in self.vessel_definitions.items():
-            icon = emoji_map.get(name, "⛵")
-            # show “All Biomes” for the Yacht
-            biome_text = "All Biomes" if name == "Fishing Yacht" \
-                         else ", ".join(info["unlock_biomes"])
-            page1.add_field(
-                name=f"{icon} {name}",
-                value=f"**{info['price']} {currency}**\n{biome_text}",
-                inline=True
-            )
+        currency = await self._bank.get_currency_name(ctx.guild)
+        bal = await self._bank.get_balance(ctx.author)
+        shop = self._cached_pages(("fishshop", currency), lambda: self._build_shop_pages(currency))
 
-        # Page 2: Gear Attachments
-        page2 = discord.Embed(
-            title="🎣 Fishing Shop — Page 2/3: Gear",
-            colour=discord.Colour.blue(),
-            description=f"Balance: **{bal} {currency}**\nUse `fishbuy <item>` to purchase."
-        )
-        page2.set_thumbnail(url="https://files.catbox.moe/9r0mzw.png")
-
-        for category, icon in [("reels","⚙️"), ("lines","🧵"), ("lures","🪝")]:
-            page2.add_field(name=f"{icon} {category.capitalize()}",
-                            value="\u200b", inline=False)
-            for gname, ginfo in self.gear_definitions[category].items():
-                price = ginfo.get("price", "—")
-                page2.add_field(
-                    name=f"{icon} {gname}",
-                    value=f"**{price} {currency}**\n{ginfo['description']}",
+        def with_balance(page_idx: int):
+            # the cached pages are shared; only the balance line is per user
+            emb = shop[page_idx].copy()
+            emb.description = f"Balance: **{bal} {currency}**\n{emb.description}"
+            return emb
+
+        # Use your paginator helper
+        await self._paginate_embeds(ctx, EmbedPages(len(shop), with_balance))
+
+    def _build_shop_pages(self, currency: str) -> EmbedPages:
+        def vessels_page():
+            page1 = discord.Embed(
+                title="🎣 Fishing Shop — Page 1/3: Vessels",
+                colour=discord.Colour.gold(),
+                description="Use `fishbuy <item>` to purchase."
+            )
+            page1.set_thumbnail(url="https://files.catbox.moe/9r0mzw.png")
+
+            emoji_map = {
+                "Rowboat":"⛵","Canoe":"🛶","Wooden Dinghy":"🚤",
+                "Glass-Bottom Skiff":"🔍","Steel Trawler":"⚙️","Sailboat":"⛵",
+                "Magma Dinghy":"🔥","Ghost Drifter":"👻","Dreamboat":"🌙",
+                "Enchanted Barque":"🔮","Submersible Pod":"🧜","Fossil Frigate":"⚓",
+                "Fishing Yacht":"🚢",
+            }
+            for name, info in self.vessel_definitions.items():
+                icon = emoji_map.get(name, "⛵")
+                # show “All Biomes” for the Yacht
+                biome_text = "All Biomes" if name == "Fishing Yacht" \
+                             else ", ".join(info["unlock_biomes"])
+                page1.add_field(
+                    name=f"{icon} {name}",
+                    value=f"**{info['price']} {currency}**\n{biome_text}",
                     inline=True
                 )
+            return page1
 
-        # Page 3: Consumables
-        page3 = discord.Embed(
-            title="🎣 Fishing Shop — Page 3/3: Consumables",
-            colour=discord.Colour.green(),
-            description=f"Balance: **{bal} {currency}**\nUse `fishbuy <item>` to purchase."
-        )
-        page3.set_thumbnail(url="https://files.catbox.moe/9r0mzw.png")
+        def gear_page():
+            page2 = discord.Embed(
+                title="🎣 Fishing Shop — Page 2/3: Gear",
+                colour=discord.Colour.blue(),
+                description="Use `fishbuy <item>` to purchase."
+            )
+            page2.set_thumbnail(url="https://files.catbox.moe/9r0mzw.png")
+
+            for category, icon in [("reels","⚙️"), ("lines","🧵"), ("lures","🪝")]:
+                page2.add_field(name=f"{icon} {category.capitalize()}",
+                                value="\u200b", inline=False)
+                for gname, ginfo in self.gear_definitions[category].items():
+                    price = ginfo.get("price", "—")
+                    page2.add_field(
+                        name=f"{icon} {gname}",
+                        value=f"**{price} {currency}**\n{ginfo['description']}",
+                        inline=True
+                    )
+            return page2
 
-        for name, info in self.consumable_definitions.items():
-            page3.add_field(
-                name=f"{info['emoji']} {name}",
-                value=f"**{info['price']} {currency}**\n{info['description']}",
-                inline=True
+        def consumables_page():
+            page3 = discord.Embed(
+                title="🎣 Fishing Shop — Page 3/3: Consumables",
+                colour=discord.Colour.green(),
+                description="Use `fishbuy <item>` to purchase."
             )
+            page3.set_thumbnail(url="https://files.catbox.moe/9r0mzw.png")
 
-        # Use your paginator helper
-        await self._paginate_embeds(ctx, [page1, page2, page3])
+            for name, info in self.consumable_definitions.items():
+                page3.add_field(
+                    name=f"{info['emoji']} {name}",
+                    value=f"**{info['price']} {currency}**\n{info['description']}",
+                    inline=True
+                )
+            return page3
+
+        builders = (vessels_page, gear_page, consumables_page)
+        return EmbedPages(len(builders), lambda i: builders[i]())
 
 
 
@@ -4077,68 +2693,157 @@ class Fishing(commands.Cog):
         Buy a vessel, gear attachment, or consumable from the shop.
         Vessels unlock new biomes; gear & consumables go into your items.
         """
-        user_conf = self.config.user(ctx.author)
-        currency = await bank.get_currency_name(ctx.guild)
-        name = item_name.strip()
+        currency = await self._bank.get_currency_name(ctx.guild)
+        name = self.names.resolve(item_name, "vessel", "gear", "consumable")
+        if name is None:
+            hint = self._did_you_mean(item_name, "vessel", "gear", "consumable")
+            return await ctx.send(f"❌ Item not found in shop. Check `fishshop`.{hint}")
         price = None
         buy_type = None
 
-        # 1) Vessel?
-        if name in self.vessel_definitions:
-            price = self.vessel_definitions[name]["price"]
-            buy_type = "vessel"
-            current = await user_conf.vessel()
-            if current == name:
-                return await ctx.send(f"❌ You already own the **{name}**.")
-
-        # 2) Gear?
-        else:
-            for cat in ("reels", "lines", "lures"):
-                if name in self.gear_definitions.get(cat, {}):
-                    price = self.gear_definitions[cat][name].get("price")
-                    buy_type = "gear"
-                    break
+        async with self._states.session(ctx.author) as state:
+            # 1) Vessel?
+            if name in self.vessel_definitions:
+                price = self.vessel_definitions[name]["price"]
+                buy_type = "vessel"
+                if state.vessel == name:
+                    return await ctx.send(f"❌ You already own the **{name}**.")
 
-        # 3) Consumable?
-        if price is None and name in self.consumable_definitions:
-            price = self.consumable_definitions[name]["price"]
-            buy_type = "consumable"
-
-        # 4) Validate
-        if price is None:
-            return await ctx.send("❌ Item not found in shop. Check `fishshop`.")
-        bal = await bank.get_balance(ctx.author)
-        if bal < price:
-            return await ctx.send(f"❌ You need **{price} {currency}**, but have **{bal} {currency}**.")
-
-        # 5) Deduct cost
-        await bank.withdraw_credits(ctx.author, price)
-
-        # 6) Deliver purchase
-        if buy_type == "vessel":
-            await user_conf.vessel.set(name)
-            return await ctx.send(f"🚤 You bought the **{name}**! New waters await you.")
-
-        # special-case Bait so it bumps your bait counter by 5
-        if buy_type == "consumable" and name == "Bait":
-            current_bait = await user_conf.bait()
-            new_bait = current_bait + 5
-            await user_conf.bait.set(new_bait)
-            return await ctx.send(f"🪱 You bought 5 bait! You now have **{new_bait}** bait.")
-
-        # default: put gear or other consumable into items
-        items = await user_conf.items()
-        items.append(name)
-        await user_conf.items.set(items)
-        emoji = "⚙️" if buy_type == "gear" else "🧪"
-        return await ctx.send(f"{emoji} You bought **{name}**, it’s been added to your items.")
+            # 2) Gear?
+            else:
+                for cat in ("reels", "lines", "lures"):
+                    if name in self.gear_definitions.get(cat, {}):
+                        price = self.gear_definitions[cat][name].get("price")
+                        buy_type = "gear"
+                        break
+
+            # 3) Consumable?
+            if price is None and name in self.consumable_definitions:
+                price = self.consumable_definitions[name]["price"]
+                buy_type = "consumable"
+
+            # 4) Validate
+            if price is None:
+                return await ctx.send("❌ Item not found in shop. Check `fishshop`.")
+            bal = await self._bank.get_balance(ctx.author)
+            if bal < price:
+                return await ctx.send(f"❌ You need **{price} {currency}**, but have **{bal} {currency}**.")
+
+            # 5) Deduct cost
+            await self._bank.withdraw_credits(ctx.author, price)
+
+            # 6) Deliver purchase
+            if buy_type == "vessel":
+                state.vessel = name
+                reply = f"🚤 You bought the **{name}**! New waters await you."
+
+            # special-case Bait so it bumps your bait counter by 5
+            elif buy_type == "consumable" and name == "Bait":
+                state.bait += 5
+                reply = f"🪱 You bought 5 bait! You now have **{state.bait}** bait."
+
+            # default: put gear or other consumable into items
+            else:
+                state.add_item(name)
+                emoji = "⚙️" if buy_type == "gear" else "🧪"
+                reply = f"{emoji} You bought **{name}**, it’s been added to your items."
+        await ctx.send(reply)
 
 
         
 
 
+    # ---------- Owner tools ----------
+    @commands.command()
+    @commands.is_owner()
+    async def fishbalance(self, ctx, *, vessel: str = None):
+        """
+        Expected value per cast, payout spread, catch mix and casts to each
+        achievement, computed from the live weight tables for an angler
+        with no gear and no buffs.
+        Usage: fishbalance
+               fishbalance Fishing Yacht
+        """
+        from .balance import BalanceEngine
+
+        if vessel is not None:
+            match = self.names.resolve(vessel, "vessel")
+            if match is None:
+                return await ctx.send(f"❌ Unknown vessel `{vessel}`.{self._did_you_mean(vessel, 'vessel')}")
+            vessel = match
+        async with ctx.typing():
+            # handler profiles don't change with the weight tables, so keep them
+            if self._balance is None:
+                self._balance = BalanceEngine(self)
+                await self._balance.prepare()
+            # the tables come from the cog's caches, so fetch them here; the
+            # sampling is CPU-bound and runs off the event loop on copies
+            plan = self._balance.plan()
+            loop = asyncio.get_running_loop()
+            sections = await loop.run_in_executor(None, self._balance.report, vessel, plan)
+        for section in sections:
+            await ctx.send(f"```\n{section[:1900]}\n```")
+
+    @commands.command()
+    @commands.is_owner()
+    async def fishanalytics(self, ctx, export: str = None):
+        """
+        Economy-wide totals: fish and items in circulation, coins from
+        sales, rarity mix, event rates and how wealth is spread.
+        Cached for a few minutes; add json or csv to get a file.
+        Usage: fishanalytics
+               fishanalytics csv
+        """
+        from .analytics import aggregate
+
+        export = export.lower() if export else None
+        if export not in (None, "json", "csv"):
+            return await ctx.send("❌ Export as `json` or `csv`, or leave it out for a summary.")
+        async with ctx.typing():
+            cached = self._analytics
+            if cached is None or time.monotonic() - cached[0] > self.ANALYTICS_TTL:
+                users = await self.config.all_users()
+                # one pass over every document; keep it off the event loop
+                loop = asyncio.get_running_loop()
+                snap = await loop.run_in_executor(None, aggregate, users, self.fish_definitions)
+                cached = self._analytics = (time.monotonic(), snap)
+            age, snap = time.monotonic() - cached[0], cached[1]
+
+        if export:
+            body = snap.to_json() if export == "json" else snap.to_csv()
+            return await ctx.send(file=discord.File(io.BytesIO(body.encode("utf-8")), f"fishing_analytics.{export}"))
+
+        currency = await self._bank.get_currency_name(ctx.guild) if ctx.guild else "credits"
+        embed = discord.Embed(title="🎣 Fishing economy", colour=discord.Colour.teal())
+        for name, value in snap.summary(currency):
+            embed.add_field(name=name, value=value[:1024], inline=name not in ("By rarity", "Events per 1k casts"))
+        embed.set_footer(text=f"Snapshot from {age:.0f}s ago · fishanalytics json|csv to export")
+        await ctx.send(embed=embed)
+
+    @commands.command()
+    @commands.is_owner()
+    async def fishreloaddata(self, ctx):
+        """Re-read the fish, gear, vessel, quest, ... data files without reloading the cog."""
+        loop = asyncio.get_running_loop()
+        try:
+            data = await loop.run_in_executor(None, read_data)
+            self._apply_data(data)
+        except DataError as e:
+            return await ctx.send(f"❌ Data not reloaded, keeping the current definitions: {e}")
+        install_data(data)
+        await ctx.send(
+            f"✅ Reloaded {len(data.fish)} fish, {len(data.gear_by_name)} gear, {len(data.vessels)} vessels, "
+            f"{len(data.recipes)} recipes, {len(data.quests)} quests and {len(data.event_weights)} events."
+        )
+
+    async def cog_load(self):
+        self.catch_log = CatchLog(cog_data_path(self) / "catches.sqlite3")
+
     async def cog_unload(self):
-        pass
+        self.menus.close()
+        await self.reveals.close()
+        if self.catch_log is not None:
+            await self.catch_log.close()
 
 
 async def setup(bot):
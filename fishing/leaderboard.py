@@ -0,0 +1,118 @@
+import asyncio
+import bisect
+import heapq
+from typing import Collection, Dict, List, Optional, Set, Tuple
+
+# metric key (a stats key) -> (title, unit shown after the value; None = currency)
+LEADERBOARD_METRICS: Dict[str, Tuple[str, Optional[str]]] = {
+    "fish_caught": ("Fish Caught", "fish"),
+    "highest_value_catch": ("Most Valuable Catch", None),
+    "sell_total": ("Total Sales", None),
+    "unique_fish": ("Unique Species", "species"),
+}
+
+LEADERBOARD_ALIASES: Dict[str, str] = {
+    "fish": "fish_caught",
+    "caught": "fish_caught",
+    "value": "highest_value_catch",
+    "highest": "highest_value_catch",
+    "sell": "sell_total",
+    "sold": "sell_total",
+    "sales": "sell_total",
+    "unique": "unique_fish",
+    "species": "unique_fish",
+}
+
+
+class Leaderboard:
+    """
+    Sorted per-metric index of every user's fishing stats.
+
+    Built lazily from one ``config.all_users()`` read and then kept current
+    by ``update`` whenever a user's document is committed, so the top N of a
+    metric is a slice of an already sorted list.
+    """
+
+    def __init__(self, config, metrics=LEADERBOARD_METRICS):
+        self.config = config
+        self.metrics = tuple(metrics)
+        # metric -> {user_id: value}
+        self._scores: Dict[str, Dict[int, int]] = {m: {} for m in self.metrics}
+        # metric -> [(-value, user_id)], ascending, i.e. best first
+        self._ranked: Dict[str, List[Tuple[int, int]]] = {m: [] for m in self.metrics}
+        self._built = False
+        # users updated since the index was last reset; their entries are
+        # newer than anything a build's all_users() snapshot can hold
+        self._fresh: Set[int] = set()
+        self._lock = asyncio.Lock()
+
+    @staticmethod
+    def resolve_metric(name: Optional[str]) -> Optional[str]:
+        if not name:
+            return "fish_caught"
+        key = name.strip().lower()
+        if key in LEADERBOARD_METRICS:
+            return key
+        return LEADERBOARD_ALIASES.get(key)
+
+    async def ensure_built(self):
+        if self._built:
+            return
+        async with self._lock:
+            if self._built:
+                return
+            all_users = await self.config.all_users()
+            fresh = self._fresh
+            for user_id, doc in all_users.items():
+                if user_id not in fresh:
+                    self.update(user_id, doc.get("stats") or {})
+            self._built = True
+            self._fresh = set()
+
+    def invalidate(self):
+        """Forget the index; the next read rebuilds it from Config."""
+        self._scores = {m: {} for m in self.metrics}
+        self._ranked = {m: [] for m in self.metrics}
+        self._built = False
+        self._fresh = set()
+
+    def update(self, user_id: int, stats: Dict[str, int]):
+        if not self._built:
+            self._fresh.add(user_id)
+        for metric in self.metrics:
+            new = int(stats.get(metric, 0) or 0)
+            scores = self._scores[metric]
+            old = scores.get(user_id, 0)
+            if new == old:
+                continue
+            ranked = self._ranked[metric]
+            if old > 0:
+                idx = bisect.bisect_left(ranked, (-old, user_id))
+                if idx < len(ranked) and ranked[idx] == (-old, user_id):
+                    del ranked[idx]
+            if new > 0:
+                bisect.insort(ranked, (-new, user_id))
+                scores[user_id] = new
+            else:
+                scores.pop(user_id, None)
+
+    def top(self, metric: str, n: int, among: Optional[Collection[int]] = None) -> List[Tuple[int, int]]:
+        """
+        Best ``n`` (user_id, value) pairs for a metric, optionally limited to
+        the user ids in ``among`` (e.g. a guild's members).
+        """
+        ranked = self._ranked.get(metric, [])
+        if among is None:
+            return [(user_id, -neg) for neg, user_id in ranked[:n]]
+        if len(among) < len(ranked):
+            # a small group: rank its members instead of scanning everyone
+            scores = self._scores[metric]
+            best = heapq.nsmallest(n, ((-scores[u], u) for u in among if u in scores))
+            return [(user_id, -neg) for neg, user_id in best]
+        out: List[Tuple[int, int]] = []
+        for neg, user_id in ranked:
+            if user_id in among:
+                out.append((user_id, -neg))
+                if len(out) >= n:
+                    break
+        return out
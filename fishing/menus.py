@@ -0,0 +1,130 @@
+import asyncio
+import math
+from typing import Dict, List, Optional, Sequence, Set
+
+import discord
+
+
+class PageMenu(discord.ui.View):
+    """Button paginator for one message. Expiry is driven by ``MenuService``."""
+
+    def __init__(self, service: "MenuService", author_id: int, pages: Sequence[discord.Embed], timeout: float):
+        # timeout=None: no per-view timer, the service's wheel expires us
+        super().__init__(timeout=None)
+        self.service = service
+        self.author_id = author_id
+        self.pages = pages
+        self.idle = timeout
+        self.index = 0
+        self.message: Optional[discord.Message] = None
+        self.slot: Optional[int] = None
+        if len(pages) <= 2:
+            self.remove_item(self.first_page)
+            self.remove_item(self.last_page)
+
+    async def interaction_check(self, interaction: discord.Interaction) -> bool:
+        if interaction.user.id != self.author_id:
+            await interaction.response.send_message("This menu isn't yours.", ephemeral=True)
+            return False
+        return True
+
+    async def _show(self, interaction: discord.Interaction, index: int):
+        self.index = index % len(self.pages)
+        self.service.touch(self)
+        await interaction.response.edit_message(embed=self.pages[self.index], view=self)
+
+    @discord.ui.button(emoji="⏮️", style=discord.ButtonStyle.secondary)
+    async def first_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, 0)
+
+    @discord.ui.button(emoji="⬅️", style=discord.ButtonStyle.primary)
+    async def prev_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.index - 1)
+
+    @discord.ui.button(emoji="⏹️", style=discord.ButtonStyle.danger)
+    async def close_menu(self, interaction: discord.Interaction, button: discord.ui.Button):
+        self.service.discard(self)
+        await interaction.response.edit_message(view=None)
+
+    @discord.ui.button(emoji="➡️", style=discord.ButtonStyle.primary)
+    async def next_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, self.index + 1)
+
+    @discord.ui.button(emoji="⏭️", style=discord.ButtonStyle.secondary)
+    async def last_page(self, interaction: discord.Interaction, button: discord.ui.Button):
+        await self._show(interaction, len(self.pages) - 1)
+
+
+class MenuService:
+    """
+    Open paginated menus for one cog.
+
+    Button clicks are routed to the right menu by discord.py's view store
+    (keyed on message id), so there is no ``wait_for`` predicate per menu
+    and no remove-reaction call per click. Idle menus are expired by a
+    single timer wheel: ``SLOTS`` buckets of ``TICK`` seconds advanced by
+    one background task, so scheduling and rescheduling are O(1).
+    """
+
+    TICK = 5.0
+    SLOTS = 128
+
+    def __init__(self, bot):
+        self.bot = bot
+        self._menus: Dict[int, PageMenu] = {}
+        self._wheel: List[Set[int]] = [set() for _ in range(self.SLOTS)]
+        self._cursor = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def send(self, ctx, pages: Sequence[discord.Embed], timeout: float = 120.0):
+        """Send ``pages`` with navigation buttons for ``ctx.author``. Returns the message."""
+        if not pages:
+            return await ctx.send("Nothing to show.")
+        if len(pages) == 1:
+            return await ctx.send(embed=pages[0])
+        menu = PageMenu(self, ctx.author.id, pages, timeout)
+        menu.message = await ctx.send(embed=pages[0], view=menu)
+        self._menus[menu.message.id] = menu
+        self.touch(menu)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return menu.message
+
+    def touch(self, menu: PageMenu):
+        """(Re)arm a menu's idle timeout."""
+        if menu.message is None:
+            return
+        if menu.slot is not None:
+            self._wheel[menu.slot].discard(menu.message.id)
+        ticks = min(self.SLOTS - 1, max(1, math.ceil(menu.idle / self.TICK)))
+        menu.slot = (self._cursor + ticks) % self.SLOTS
+        self._wheel[menu.slot].add(menu.message.id)
+
+    def discard(self, menu: PageMenu):
+        if menu.message is not None and self._menus.pop(menu.message.id, None) is not None:
+            self._wheel[menu.slot].discard(menu.message.id)
+        menu.stop()
+
+    async def _run(self):
+        while self._menus:
+            await asyncio.sleep(self.TICK)
+            self._cursor = (self._cursor + 1) % self.SLOTS
+            expired, self._wheel[self._cursor] = self._wheel[self._cursor], set()
+            for message_id in expired:
+                menu = self._menus.pop(message_id, None)
+                if menu is None:
+                    continue
+                menu.stop()
+                try:
+                    await menu.message.edit(view=None)
+                except discord.HTTPException:
+                    pass
+
+    def close(self):
+        """Stop every open menu; call from ``cog_unload``."""
+        if self._task is not None:
+            self._task.cancel()
+        for menu in self._menus.values():
+            menu.stop()
+        self._menus.clear()
+        self._wheel = [set() for _ in range(self.SLOTS)]
@@ -0,0 +1,102 @@
+import difflib
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+def normalize(name: str) -> str:
+    """Lowercase, trim quotes and spacing, and fold typographic apostrophes."""
+    name = name.strip().strip('"').replace("’", "'").replace("‘", "'")
+    return " ".join(name.casefold().split())
+
+
+class _Node:
+    __slots__ = ("children", "names")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # (kind, canonical name) of every key passing through this node
+        self.names: Set[Tuple[str, str]] = set()
+
+
+class NameIndex:
+    """
+    Case-insensitive lookup of definition names (fish, items, gear, ...).
+
+    Every name is stored under a kind, together with its aliases. Lookups
+    try an exact (normalised) match first and then a unique prefix, where a
+    prefix may start at any word of the name ("yacht" finds "Fishing
+    Yacht"). Misses can ask for suggestions, drawn from the prefix matches
+    and from close spellings.
+    """
+
+    MIN_PREFIX = 3
+
+    def __init__(self):
+        # normalised key -> {kind: canonical name}
+        self._exact: Dict[str, Dict[str, str]] = {}
+        # kind -> normalised keys, for spelling suggestions
+        self._keys: Dict[str, List[str]] = {}
+        self._root = _Node()
+
+    def add(self, kind: str, name: str, aliases: Iterable[str] = ()):
+        for key in {normalize(name), *(normalize(a) for a in aliases)}:
+            if not key:
+                continue
+            self._exact.setdefault(key, {})[kind] = name
+            self._keys.setdefault(kind, []).append(key)
+            words = key.split(" ")
+            for i in range(len(words)):
+                self._insert(" ".join(words[i:]), kind, name)
+
+    def _insert(self, key: str, kind: str, name: str):
+        node = self._root
+        for ch in key:
+            node = node.children.setdefault(ch, _Node())
+            node.names.add((kind, name))
+
+    def __contains__(self, name: str) -> bool:
+        return normalize(name) in self._exact
+
+    def lookup(self, query: str, *kinds: str) -> Optional[str]:
+        """Exact name or alias, in the first of ``kinds`` that has it."""
+        found = self._exact.get(normalize(query))
+        if not found:
+            return None
+        for kind in kinds or found:
+            if kind in found:
+                return found[kind]
+        return None
+
+    def prefixed(self, query: str, *kinds: str) -> List[str]:
+        """
+        Every name of ``kinds`` with a word starting with ``query``; names
+        that start with it come first, then shorter names.
+        """
+        key = normalize(query)
+        node = self._root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return []
+        found = {name for kind, name in node.names if not kinds or kind in kinds}
+        return sorted(found, key=lambda name: (not normalize(name).startswith(key), len(name), name))
+
+    def resolve(self, query: str, *kinds: str) -> Optional[str]:
+        """Exact match, else the only name the query is a prefix of."""
+        exact = self.lookup(query, *kinds)
+        if exact is not None:
+            return exact
+        if len(normalize(query)) < self.MIN_PREFIX:
+            return None
+        matches = self.prefixed(query, *kinds)
+        return matches[0] if len(matches) == 1 else None
+
+    def suggest(self, query: str, *kinds: str, limit: int = 3) -> List[str]:
+        """Likely meant names for a query that didn't resolve."""
+        out = self.prefixed(query, *kinds)[:limit] if normalize(query) else []
+        keys = [k for kind in (kinds or self._keys) for k in self._keys.get(kind, ())]
+        for key in difflib.get_close_matches(normalize(query), keys, n=limit * 2, cutoff=0.6):
+            found = self._exact[key]
+            name = next((found[k] for k in (kinds or found) if k in found), None)
+            if name is not None and name not in out:
+                out.append(name)
+        return out[:limit]
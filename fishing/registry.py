@@ -0,0 +1,383 @@
+"""
+Static game data for the Fishing cog.
+
+Fish, gear, vessels, consumables, achievements, rod levels, recipes, NPCs,
+quests, event weights, item effects and buffs live in ``data/*.json``. Each file carries a
+``"version"`` so an incompatible edit fails loudly at load time instead of
+half-working. ``load_data`` parses them once per process into frozen,
+``__slots__``-based definition objects plus the lookup indexes the cog
+needs (fish by rarity and by biome, a ``NameIndex`` of every name). Every
+``Fishing`` instance in the process (the live cog, the simulator, the
+balance engine's shadow cog) shares that one copy. The owner reload command parses the files
+again with ``read_data`` and only swaps them in with ``install_data`` once
+the cog has accepted them.
+
+Definitions also answer ``defn["price"]`` / ``defn.get("price")`` so code
+written against the old plain dicts keeps working.
+"""
+import hashlib
+import json
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from .names import NameIndex
+
+DATA_DIR = Path(__file__).parent / "data"
+DATA_VERSION = 1
+
+
+class DataError(ValueError):
+    """A data file is missing, unreadable or doesn't match the expected shape."""
+
+
+class FrozenDict(dict):
+    """A dict that refuses writes; prints and serialises like a plain dict."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("definition data is read-only")
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Recursively turn dicts into FrozenDicts and lists into tuples."""
+    if isinstance(value, dict):
+        # dict.__init__ fills the dict without going through __setitem__
+        return FrozenDict((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+class Definition:
+    """
+    Base for immutable definitions. Subclasses list their fields in
+    ``__slots__``; ``REQUIRED`` ones must be present in the data file, the
+    rest default to None. Optional fields that are None read as missing
+    through the mapping interface, like an absent key did before.
+    """
+
+    __slots__ = ()
+    REQUIRED: Tuple[str, ...] = ()
+
+    def __init__(self, **fields):
+        for slot in self.__slots__:
+            object.__setattr__(self, slot, freeze(fields.get(slot)))
+
+    def __setattr__(self, key, value):
+        raise AttributeError(f"{type(self).__name__} is read-only")
+
+    __delattr__ = __setattr__
+
+    @classmethod
+    def from_data(cls, source: str, ident: str, raw: Mapping[str, Any], **extra):
+        if not isinstance(raw, dict):
+            raise DataError(f"{source}: {ident!r} must be an object")
+        missing = [f for f in cls.REQUIRED if f not in raw and f not in extra]
+        if missing:
+            raise DataError(f"{source}: {ident!r} is missing {', '.join(missing)}")
+        unknown = set(raw) - set(cls.__slots__)
+        if unknown:
+            raise DataError(f"{source}: {ident!r} has unknown field(s) {', '.join(sorted(unknown))}")
+        return cls(**raw, **extra)
+
+    # mapping interface, for code that treats definitions as dicts
+    def __getitem__(self, key: str) -> Any:
+        if key in self.__slots__:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value = getattr(self, key, None) if key in self.__slots__ else None
+        return default if value is None else value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+    def keys(self) -> Iterator[str]:
+        return (slot for slot in self.__slots__ if getattr(self, slot) is not None)
+
+    def items(self) -> Iterator[Tuple[str, Any]]:
+        return ((slot, getattr(self, slot)) for slot in self.keys())
+
+    def __repr__(self):
+        fields = ", ".join(f"{k}={v!r}" for k, v in self.items())
+        return f"{type(self).__name__}({fields})"
+
+
+class FishDef(Definition):
+    __slots__ = ("name", "weight", "price", "emoji", "rarity", "biome", "aliases")
+    REQUIRED = ("weight", "price", "rarity", "biome")
+
+
+class GearDef(Definition):
+    __slots__ = (
+        "name", "category", "description", "price",
+        "hook_speed", "durability_boost", "double_catch_boost", "rare_fish_boost", "mythic_boost", "aliases",
+    )
+    REQUIRED = ("description",)
+
+
+class VesselDef(Definition):
+    __slots__ = ("name", "price", "unlock_biomes", "description", "aliases")
+    REQUIRED = ("price", "unlock_biomes")
+
+
+class ConsumableDef(Definition):
+    __slots__ = ("name", "price", "emoji", "description", "aliases")
+    REQUIRED = ("price",)
+
+
+class AchievementDef(Definition):
+    __slots__ = ("id", "name", "description", "category", "rule", "reward")
+    REQUIRED = ("name", "description", "category")
+
+
+class RecipeDef(Definition):
+    __slots__ = ("id", "name", "requirements", "result", "description", "aliases")
+    REQUIRED = ("name", "requirements", "result")
+
+
+class NpcDef(Definition):
+    __slots__ = ("key", "display", "greeting", "quests", "image")
+    REQUIRED = ("display", "quests")
+
+
+class QuestDef(Definition):
+    __slots__ = ("id", "title", "steps", "rewards", "repeatable", "difficulty")
+    REQUIRED = ("title", "steps")
+
+
+class BuffDef(Definition):
+    """
+    A temporary bonus. ``events`` multiplies event weights and ``rarity``
+    multiplies the weight of fish of that rarity while the buff runs.
+    """
+
+    __slots__ = ("id", "name", "emoji", "events", "rarity")
+    REQUIRED = ("name",)
+
+
+class EffectDef(Definition):
+    """What using one item does; see effects.py for how each field applies."""
+
+    __slots__ = ("item", "luck", "bait", "coins", "items", "reset_stats", "buff", "roll", "message")
+
+    @classmethod
+    def from_data(cls, source: str, ident: str, raw: Mapping[str, Any], **extra):
+        for i, entry in enumerate(raw.get("roll") or ()):
+            unknown = set(entry) - set(cls.__slots__) - {"weight"}
+            if unknown:
+                raise DataError(f"{source}: {ident!r} roll #{i + 1} has unknown field(s) {', '.join(sorted(unknown))}")
+        return super().from_data(source, ident, raw, **extra)
+
+
+class FishingData:
+    """Everything ``load_data`` read, plus derived indexes. Treat as read-only."""
+
+    def __init__(self, files: Dict[str, Dict[str, Any]]):
+        def section(source: str, key: str, kind, id_field: str) -> Mapping[str, Any]:
+            return self._definitions(source, self._body(files, source, key), kind, id_field)
+
+        self.fish: Mapping[str, FishDef] = section("fish.json", "fish", FishDef, "name")
+        self.gear: Mapping[str, Mapping[str, GearDef]] = MappingProxyType({
+            category: self._definitions("gear.json", items, GearDef, "name", category=category)
+            for category, items in self._body(files, "gear.json", "gear").items()
+        })
+        self.vessels: Mapping[str, VesselDef] = section("vessels.json", "vessels", VesselDef, "name")
+        self.consumables: Mapping[str, ConsumableDef] = section("consumables.json", "consumables", ConsumableDef, "name")
+        self.recipes: Mapping[str, RecipeDef] = section("recipes.json", "recipes", RecipeDef, "id")
+        self.npcs: Mapping[str, NpcDef] = section("npcs.json", "npcs", NpcDef, "key")
+        self.quests: Mapping[str, QuestDef] = section("quests.json", "quests", QuestDef, "id")
+        self.achievements: Mapping[str, AchievementDef] = section(
+            "achievements.json", "achievements", AchievementDef, "id"
+        )
+        self.effects: Mapping[str, EffectDef] = section("effects.json", "effects", EffectDef, "item")
+        self.buffs: Mapping[str, BuffDef] = section("effects.json", "buffs", BuffDef, "id")
+
+        world = files["world.json"]
+        self.rarities: Tuple[str, ...] = tuple(world.get("rarities", ()))
+        self.rarity_rank: Mapping[str, int] = MappingProxyType({r: i for i, r in enumerate(self.rarities)})
+        self.cast_flavor: Tuple[str, ...] = tuple(world.get("cast_flavor", ()))
+
+        levels = {int(lvl): info for lvl, info in self._body(files, "rods.json", "levels").items()}
+        self.rod_fish_multiplier = MappingProxyType({lvl: float(i["fish_multiplier"]) for lvl, i in sorted(levels.items())})
+        self.rod_break_reduction = MappingProxyType({lvl: float(i["break_reduction"]) for lvl, i in sorted(levels.items())})
+        self.rod_upgrade_requirements = MappingProxyType(
+            {lvl: freeze(i["upgrade"]) for lvl, i in sorted(levels.items()) if i.get("upgrade")}
+        )
+
+        self.event_weights: Mapping[str, float] = MappingProxyType(dict(self._body(files, "events.json", "events")))
+
+        for buff_id, buff in self.buffs.items():
+            for event in buff.events or ():
+                if event not in self.event_weights:
+                    raise DataError(f"effects.json: buff {buff_id!r} scales unknown event {event!r}")
+            for rarity in buff.rarity or ():
+                if rarity not in self.rarity_rank:
+                    raise DataError(f"effects.json: buff {buff_id!r} scales unknown rarity {rarity!r}")
+        for item, effect in self.effects.items():
+            for record in (effect, *(effect.roll or ())):
+                spec = record.get("buff")
+                if spec is None:
+                    continue
+                if spec.get("id") not in self.buffs:
+                    raise DataError(f"effects.json: {item!r} grants unknown buff {spec.get('id')!r}")
+                if not (spec.get("casts") or spec.get("minutes")):
+                    raise DataError(f"effects.json: {item!r} buff needs casts or minutes")
+
+        # ----- indexes -----
+        by_rarity: Dict[str, List[str]] = {}
+        by_biome: Dict[str, List[str]] = {}
+        for name, info in self.fish.items():
+            if info.rarity not in self.rarity_rank:
+                raise DataError(f"fish.json: {name!r} has unknown rarity {info.rarity!r}")
+            by_rarity.setdefault(info.rarity, []).append(name)
+            by_biome.setdefault(info.biome, []).append(name)
+        self.fish_by_rarity: Mapping[str, Tuple[str, ...]] = MappingProxyType({k: tuple(v) for k, v in by_rarity.items()})
+        self.fish_by_biome: Mapping[str, Tuple[str, ...]] = MappingProxyType({k: tuple(v) for k, v in by_biome.items()})
+        self.gear_by_name: Mapping[str, GearDef] = MappingProxyType(
+            {name: gdef for category in self.gear.values() for name, gdef in category.items()}
+        )
+
+        # biomes reachable on foot: every fish biome no vessel unlocks
+        self.biomes: Tuple[str, ...] = tuple(sorted(by_biome))
+        locked = set().union(*(v.unlock_biomes for v in self.vessels.values()))
+        self.base_biomes: Tuple[str, ...] = tuple(sorted(set(by_biome) - locked))
+
+        # achievement rules and rewards; a threshold of "all" means every
+        # recipe (crafts_done) or every biome (biomes_caught)
+        every = {"crafts_done": len(self.recipes), "biomes_caught": len(self.biomes)}
+        rules: Dict[str, Tuple[str, int]] = {}
+        for ach_id, ach in self.achievements.items():
+            if ach.rule is None:
+                continue
+            metric, threshold = ach.rule["metric"], ach.rule["threshold"]
+            if threshold == "all":
+                if metric not in every:
+                    raise DataError(f"achievements.json: {ach_id!r} can't use threshold 'all' for {metric!r}")
+                threshold = every[metric]
+            rules[ach_id] = (metric, int(threshold))
+        self.achievement_rules: Mapping[str, Tuple[str, int]] = MappingProxyType(rules)
+        self.achievement_rewards: Mapping[str, FrozenDict] = MappingProxyType(
+            {ach_id: ach.reward for ach_id, ach in self.achievements.items() if ach.reward is not None}
+        )
+
+        self.names = self._name_index(tuple(world.get("items", ())))
+
+        # identifies the rarity/biome of every fish; users' held-fish tallies
+        # are recounted when it changes
+        layout = json.dumps(sorted((n, f.rarity, f.biome) for n, f in self.fish.items()))
+        self.tally_version = hashlib.sha1(layout.encode("utf-8")).hexdigest()[:12]
+
+    def _name_index(self, loose_items: Tuple[str, ...]) -> NameIndex:
+        """
+        Every name a command can take. "item" covers anything that can sit in
+        a user's items: consumables, gear, crafted results, quest and
+        achievement rewards and the loose event drops listed in world.json.
+        """
+        names = NameIndex()
+        for name, info in self.fish.items():
+            names.add("fish", name, info.aliases or ())
+        for name, info in self.vessels.items():
+            names.add("vessel", name, info.aliases or ())
+        for name, info in self.gear_by_name.items():
+            names.add("gear", name, info.aliases or ())
+            names.add("item", name, info.aliases or ())
+        for name, info in self.consumables.items():
+            names.add("consumable", name, info.aliases or ())
+            names.add("item", name, info.aliases or ())
+        for recipe_id, info in self.recipes.items():
+            names.add("recipe", recipe_id, (info.name, *(info.aliases or ())))
+            result = info.result
+            made = ([result["item"]] if "item" in result else []) + list(result.get("items", {}))
+            for item in made:
+                # a single-output recipe's display name ("Angler’s Plaque") also names its item
+                names.add("item", item, [info.name] if len(made) == 1 else [])
+        for quest in self.quests.values():
+            for item in (quest.rewards or {}).get("items", {}):
+                names.add("item", item)
+        for reward in self.achievement_rewards.values():
+            for item in reward.get("items", {}):
+                names.add("item", item)
+        for item in loose_items:
+            names.add("item", item)
+        for item, effect in self.effects.items():
+            names.add("item", item)
+            for entry in effect.roll or ():
+                for found in entry.get("items", {}):
+                    names.add("item", found)
+        for key, npc in self.npcs.items():
+            names.add("npc", key, [npc.display])
+        return names
+
+    @staticmethod
+    def _body(files: Dict[str, Dict[str, Any]], source: str, key: str) -> Dict[str, Any]:
+        body = files[source].get(key)
+        if not isinstance(body, dict):
+            raise DataError(f"{source}: expected an object under {key!r}")
+        return body
+
+    @staticmethod
+    def _definitions(source: str, body: Dict[str, Any], kind, id_field: str, **extra) -> Mapping[str, Definition]:
+        if not isinstance(body, dict):
+            raise DataError(f"{source}: expected an object of definitions")
+        return MappingProxyType({
+            name: kind.from_data(source, name, raw, **{id_field: name}, **extra)
+            for name, raw in body.items()
+        })
+
+
+_FILES = (
+    "fish.json", "gear.json", "vessels.json", "consumables.json", "achievements.json",
+    "rods.json", "recipes.json", "npcs.json", "quests.json", "events.json", "effects.json", "world.json",
+)
+_loaded: Optional[FishingData] = None
+
+
+def _read(path: Path) -> Dict[str, Any]:
+    try:
+        with path.open(encoding="utf-8") as f:
+            doc = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise DataError(f"{path.name}: {e}") from e
+    version = doc.get("version") if isinstance(doc, dict) else None
+    if version != DATA_VERSION:
+        raise DataError(f"{path.name}: data version {version!r}, expected {DATA_VERSION}")
+    return doc
+
+
+def read_data(data_dir: Path = DATA_DIR) -> FishingData:
+    """Parse the data files without touching the shared copy. Raises ``DataError``."""
+    files = {name: _read(data_dir / name) for name in _FILES}
+    try:
+        return FishingData(files)
+    except (KeyError, TypeError, AttributeError) as e:
+        raise DataError(f"malformed data: {e!r}") from e
+
+
+def load_data(force: bool = False) -> FishingData:
+    """The shared game data, read from disk on first use (or when ``force``)."""
+    global _loaded
+    if _loaded is None or force:
+        _loaded = read_data()
+    return _loaded
+
+
+def install_data(data: FishingData):
+    """Make ``data`` the shared copy, e.g. once a reload has been validated."""
+    global _loaded
+    _loaded = data
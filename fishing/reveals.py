@@ -0,0 +1,98 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+import discord
+
+
+class RevealScheduler:
+    """
+    Delayed message edits for cast results.
+
+    A cast is resolved and committed straight away; only the reveal waits.
+    Pending reveals sit in one heap ordered by due time and a single task
+    sleeps until the earliest one, so a waiting cast costs a heap entry
+    (message + text) instead of a suspended command with its state.
+
+    Due reveals are handed to one sender per channel, which edits them in
+    order; a channel that is being rate limited only delays itself.
+    """
+
+    def __init__(self):
+        self._heap: List[Tuple[float, int, discord.Message, str]] = []
+        self._seq = itertools.count()
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        # channel id -> reveals due but not yet sent, and the task sending them
+        self._outbox: Dict[int, Deque[Tuple[discord.Message, str]]] = {}
+        self._senders: Dict[int, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._heap) + sum(len(q) for q in self._outbox.values())
+
+    def schedule(self, message: discord.Message, content: str, delay: float):
+        """Edit ``message`` to ``content`` after ``delay`` seconds."""
+        entry = (time.monotonic() + delay, next(self._seq), message, content)
+        heapq.heappush(self._heap, entry)
+        if self._heap[0] is entry:
+            # new earliest deadline: cut the dispatcher's sleep short
+            self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._heap:
+            delay = self._heap[0][0] - time.monotonic()
+            if delay > 0:
+                self._wake.clear()
+                try:
+                    await asyncio.wait_for(self._wake.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            now = time.monotonic()
+            while self._heap and self._heap[0][0] <= now:
+                _, _, message, content = heapq.heappop(self._heap)
+                self._post(message, content)
+
+    def _post(self, message: discord.Message, content: str):
+        channel_id = message.channel.id
+        self._outbox.setdefault(channel_id, deque()).append((message, content))
+        if channel_id not in self._senders:
+            self._senders[channel_id] = asyncio.create_task(self._send(channel_id))
+
+    async def _send(self, channel_id: int):
+        queue = self._outbox[channel_id]
+        try:
+            while queue:
+                message, content = queue.popleft()
+                await self._reveal(message, content)
+        finally:
+            self._outbox.pop(channel_id, None)
+            self._senders.pop(channel_id, None)
+
+    @staticmethod
+    async def _reveal(message: discord.Message, content: str):
+        try:
+            await message.edit(content=content)
+        except discord.NotFound:
+            # the placeholder was deleted; post the result instead
+            try:
+                await message.channel.send(content)
+            except discord.HTTPException:
+                pass
+        except discord.HTTPException:
+            pass
+
+    async def close(self):
+        """Reveal everything still pending right away; call from ``cog_unload``."""
+        if self._task is not None:
+            self._task.cancel()
+        pending, self._heap = sorted(self._heap), []
+        for _, _, message, content in pending:
+            self._post(message, content)
+        if self._senders:
+            await asyncio.gather(*self._senders.values(), return_exceptions=True)
@@ -0,0 +1,92 @@
+"""
+Rod profiles: everything a user's rod level and equipped gear do to a
+cast, folded into one object.
+
+A profile is identified by its key, ``"<level>|<reel>|<line>|<lure>"``.
+The key is stored on the user (``rod_profile``) and cleared whenever the
+rod level or equipment changes; the cog keeps one ``RodProfile`` per key,
+so a cast finds its whole setup with a single dict lookup.
+"""
+from typing import Dict, Mapping, Optional, Tuple
+
+from .registry import FishingData
+
+# events made likelier by a better rod
+REWARD_EVENTS = ("fish", "double", "treasure", "pearl", "merchant")
+SLOTS = (("rod_reel", "reels"), ("rod_line", "lines"), ("rod_lure", "lures"))
+
+
+def profile_key(rod_level: int, equipment: Mapping[str, Optional[str]]) -> str:
+    return "|".join([str(rod_level), *(equipment.get(slot) or "" for slot, _ in SLOTS)])
+
+
+class RodProfile:
+    __slots__ = ("key", "fish_multiplier", "break_reduction", "double", "hook_speed", "rarity", "events")
+
+    def __init__(self, key: str, fish_multiplier: float, break_reduction: float, double: float,
+                 hook_speed: float, rarity: Dict[str, float]):
+        self.key = key
+        self.fish_multiplier = fish_multiplier
+        self.break_reduction = break_reduction
+        self.double = double
+        # fraction taken off the wait before a cast is revealed
+        self.hook_speed = hook_speed
+        # rarity -> fish weight multiplier; empty when the gear has no bias
+        self.rarity = rarity
+        # event key -> weight multiplier, registered as the profile's event modifier
+        events = {k: fish_multiplier for k in REWARD_EVENTS}
+        events["double"] = fish_multiplier * double
+        events["break"] = events["hook_snag"] = break_reduction
+        self.events = events
+
+    @classmethod
+    def build(cls, data: FishingData, rod_level: int, equipment: Mapping[str, Optional[str]]) -> "RodProfile":
+        """The profile for a rod level and equipment. Gear missing from ``data`` is ignored."""
+        gear = [data.gear.get(category, {}).get(equipment.get(slot) or "") for slot, category in SLOTS]
+        gear = [g for g in gear if g is not None]
+
+        break_reduction = data.rod_break_reduction.get(rod_level, 1.0)
+        double = 1.0
+        hook_speed = 0.0
+        rare_boost = mythic_boost = 1.0
+        for g in gear:
+            break_reduction *= 1.0 - (g.durability_boost or 0)
+            double += g.double_catch_boost or 0
+            hook_speed += g.hook_speed or 0
+            rare_boost *= 1.0 + (g.rare_fish_boost or 0)
+            mythic_boost *= 1.0 + (g.mythic_boost or 0)
+
+        rarity: Dict[str, float] = {}
+        if rare_boost != 1.0:
+            # "Rare+" is Rare and everything ranked above it
+            first = data.rarity_rank.get("Rare", len(data.rarities))
+            rarity.update({r: rare_boost for r in data.rarities[first:]})
+        if mythic_boost != 1.0 and "Mythic" in data.rarity_rank:
+            rarity["Mythic"] = rarity.get("Mythic", 1.0) * mythic_boost
+
+        return cls(
+            profile_key(rod_level, equipment),
+            fish_multiplier=data.rod_fish_multiplier.get(rod_level, 1.0),
+            break_reduction=break_reduction,
+            double=double,
+            hook_speed=min(hook_speed, 0.9),
+            rarity=rarity,
+        )
+
+    def describe(self) -> Tuple[str, ...]:
+        """Short phrases for what differs from a bare level 0 rod."""
+        parts = []
+        if self.fish_multiplier != 1.0:
+            parts.append(f"catches ×{self.fish_multiplier:g}")
+        if self.break_reduction != 1.0:
+            parts.append(f"breaks ×{self.break_reduction:.2f}")
+        if self.double != 1.0:
+            parts.append(f"double catch ×{self.double:g}")
+        rare, mythic = self.rarity.get("Rare"), self.rarity.get("Mythic")
+        if rare:
+            parts.append(f"Rare+ ×{rare:g}")
+        if mythic and mythic != rare:
+            parts.append(f"Mythic ×{mythic:.3g}")
+        if self.hook_speed:
+            parts.append(f"reels in {self.hook_speed:.0%} faster")
+        return tuple(parts)
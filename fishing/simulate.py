@@ -0,0 +1,236 @@
+"""
+Headless cast simulator and economy benchmark for the Fishing cog.
+
+    python -m fishing.simulate --casts 5000 --seed 42
+
+Every cast goes through ``Fishing._resolve_cast`` inside a normal state
+session: event selection from the cached weight tables, the ``_event_*``
+handler, achievements and the single commit. Config and the bank
+(``Fishing._bank``) are in-memory stand-ins, so the run needs no bot and
+is reproducible for a given seed. The report shows throughput, Config
+reads/writes per cast and the payout per cast (coins deposited plus sale
+value of fish landed) for each rod level / vessel profile.
+"""
+import argparse
+import asyncio
+import copy
+import json
+import random
+import time
+from collections import Counter
+from typing import Any, Dict, Iterable, List, Optional
+
+from .fishing import Fishing
+
+
+# ---------- in-memory stand-ins ----------
+class MemoryValue:
+    def __init__(self, config: "MemoryConfig", doc: Dict[str, Any], key: str):
+        self._config, self._doc, self._key = config, doc, key
+
+    async def __call__(self):
+        self._config.reads += 1
+        return copy.deepcopy(self._doc[self._key])
+
+    async def set(self, value):
+        self._config.writes += 1
+        self._doc[self._key] = copy.deepcopy(value)
+
+
+class MemoryGroup:
+    def __init__(self, config: "MemoryConfig", user_id: int):
+        self._config, self._user_id = config, user_id
+
+    def _doc(self) -> Dict[str, Any]:
+        docs = self._config.docs
+        if self._user_id not in docs:
+            docs[self._user_id] = copy.deepcopy(self._config.defaults)
+        return docs[self._user_id]
+
+    async def all(self) -> Dict[str, Any]:
+        self._config.reads += 1
+        return copy.deepcopy(self._doc())
+
+    async def set(self, value: Dict[str, Any]):
+        self._config.writes += 1
+        self._config.docs[self._user_id] = copy.deepcopy(value)
+
+    def __getattr__(self, key: str) -> MemoryValue:
+        return MemoryValue(self._config, self._doc(), key)
+
+
+class MemoryConfig:
+    """The slice of Red's Config the cog uses, backed by a dict, counting traffic."""
+
+    def __init__(self):
+        self.defaults: Dict[str, Any] = {}
+        self.docs: Dict[int, Dict[str, Any]] = {}
+        self.reads = 0
+        self.writes = 0
+
+    def register_user(self, **defaults):
+        self.defaults.update(defaults)
+
+    def user(self, user) -> MemoryGroup:
+        return MemoryGroup(self, user.id)
+
+    def user_from_id(self, user_id: int) -> MemoryGroup:
+        return MemoryGroup(self, user_id)
+
+    async def all_users(self) -> Dict[int, Dict[str, Any]]:
+        self.reads += 1
+        return copy.deepcopy(self.docs)
+
+
+class FakeBank:
+    """Stand-in for ``redbot.core.bank`` keeping balances in memory."""
+
+    def __init__(self):
+        self.balances: Dict[int, int] = {}
+
+    async def deposit_credits(self, member, amount: int) -> int:
+        self.balances[member.id] = self.balances.get(member.id, 0) + amount
+        return self.balances[member.id]
+
+    async def withdraw_credits(self, member, amount: int) -> int:
+        self.balances[member.id] = self.balances.get(member.id, 0) - amount
+        return self.balances[member.id]
+
+    async def get_balance(self, member) -> int:
+        return self.balances.get(member.id, 0)
+
+    async def can_spend(self, member, amount: int) -> bool:
+        return self.balances.get(member.id, 0) >= amount
+
+    async def get_currency_name(self, guild=None) -> str:
+        return "coins"
+
+
+class SimUser:
+    bot = False
+
+    def __init__(self, user_id: int):
+        self.id = user_id
+        self.display_name = f"angler{user_id}"
+        self.mention = f"<@{user_id}>"
+
+
+class SimContext:
+    guild = None
+
+    def __init__(self, author: SimUser):
+        self.author = author
+        self.sent = 0
+
+    async def send(self, *args, **kwargs):
+        self.sent += 1
+
+
+# ---------- simulation ----------
+def _percentile(ordered: List[int], q: float) -> int:
+    if not ordered:
+        return 0
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def simulate_profile(
+    cog: Fishing, bank: FakeBank, user: SimUser, casts: int, rod_level: int, vessel: Optional[str]
+) -> Dict[str, Any]:
+    config = cog.config
+    prices = {name: info["price"] for name, info in cog.fish_definitions.items()}
+    ctx = SimContext(user)
+
+    async with cog._states.session(user) as state:
+        state.rod_level = rod_level
+        state.vessel = vessel
+
+    payouts: List[int] = []
+    events: Counter = Counter()
+    repairs = 0
+    reads, writes = config.reads, config.writes
+    started = time.perf_counter()
+    for _ in range(casts):
+        async with cog._states.session(user) as state:
+            if state.rod_broken:
+                state.rod_broken = False
+                repairs += 1
+            coins = bank.balances.get(user.id, 0)
+            value = sum(prices.get(name, 0) * n for name, n in state.caught.items())
+            chosen, _ = await cog._resolve_cast(ctx, state)
+            value = sum(prices.get(name, 0) * n for name, n in state.caught.items()) - value
+        payouts.append(bank.balances.get(user.id, 0) - coins + max(0, value))
+        events[chosen] += 1
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(payouts)
+    return {
+        "rod_level": rod_level,
+        "vessel": vessel or "on foot",
+        "casts": casts,
+        "casts_per_sec": casts / elapsed if elapsed else float("inf"),
+        "reads_per_cast": (config.reads - reads) / casts,
+        "writes_per_cast": (config.writes - writes) / casts,
+        "payout_mean": sum(payouts) / casts,
+        "payout_p50": _percentile(ordered, 0.5),
+        "payout_p90": _percentile(ordered, 0.9),
+        "payout_max": ordered[-1] if ordered else 0,
+        "rod_repairs": repairs,
+        "events": dict(events.most_common()),
+    }
+
+
+async def run(
+    casts: int = 2000,
+    seed: int = 0,
+    rod_levels: Optional[Iterable[int]] = None,
+    vessels: Optional[Iterable[Optional[str]]] = None,
+) -> List[Dict[str, Any]]:
+    """Simulate ``casts`` casts for every rod level x vessel profile, each with a fresh angler."""
+    config, bank = MemoryConfig(), FakeBank()
+    cog = Fishing(bot=None, config=config)
+    cog._bank = bank
+    if rod_levels is None:
+        rod_levels = sorted(cog.rod_level_fish_multiplier)
+    if vessels is None:
+        vessels = [None, *cog.vessel_definitions]
+
+    results = []
+    for user_id, (level, vessel) in enumerate(
+        ((lvl, v) for lvl in rod_levels for v in vessels), start=1
+    ):
+        # reseed per profile so each row is reproducible on its own
+        random.seed(f"{seed}:{level}:{vessel}")
+        results.append(await simulate_profile(cog, bank, SimUser(user_id), casts, level, vessel))
+    return results
+
+
+def format_report(results: List[Dict[str, Any]]) -> str:
+    header = f"{'rod':>3}  {'vessel':<20} {'casts/s':>9} {'rd/cast':>7} {'wr/cast':>7} {'mean':>8} {'p50':>6} {'p90':>6} {'max':>6} {'repairs':>7}"
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r['rod_level']:>3}  {r['vessel'][:20]:<20} {r['casts_per_sec']:>9.0f} "
+            f"{r['reads_per_cast']:>7.2f} {r['writes_per_cast']:>7.2f} {r['payout_mean']:>8.1f} "
+            f"{r['payout_p50']:>6} {r['payout_p90']:>6} {r['payout_max']:>6} {r['rod_repairs']:>7}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--casts", type=int, default=2000, help="casts per profile")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--rod-level", type=int, action="append", dest="rod_levels", help="limit to these rod levels")
+    parser.add_argument("--vessel", action="append", dest="vessels", help='limit to these vessels ("none" = on foot)')
+    parser.add_argument("--json", action="store_true", help="print raw results as JSON")
+    args = parser.parse_args(argv)
+
+    vessels = None
+    if args.vessels:
+        vessels = [None if v.lower() == "none" else v for v in args.vessels]
+    results = asyncio.run(run(args.casts, args.seed, args.rod_levels, vessels))
+    print(json.dumps(results, indent=2) if args.json else format_report(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,527 @@
+import asyncio
+import random
+import time
+import weakref
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple
+
+
+class UserState:
+    """
+    In-memory copy of one user's fishing document.
+
+    Commands load it once with ``UserState.load``, let event handlers,
+    quest and achievement helpers mutate it, then call ``commit`` once so
+    the whole command costs one Config read and at most one write.
+    """
+
+    __slots__ = (
+        "user", "_group", "data", "dirty", "granted", "changed", "new_species", "_species", "on_commit", "classify",
+        "cast_buffs", "cast_origin", "landed",
+    )
+
+    def __init__(self, user, group, data: Dict[str, Any], on_commit: Optional[Callable] = None):
+        self.user = user
+        self._group = group
+        self.data = data
+        self.dirty = False
+        # achievements queued by handlers, announced once per command
+        self.granted: List[str] = []
+        # achievement metrics touched since the last evaluation
+        self.changed: Set[str] = set()
+        # species added to species_seen since the last evaluation
+        self.new_species: List[str] = []
+        self._species: Optional[Set[str]] = None
+        # called with the state after every successful write
+        self.on_commit = on_commit
+        # fish name -> tally keys ("rarity:Epic", "biome:Reef"); set by the
+        # cog on load, see use_tallies. Without it tallies aren't kept.
+        self.classify: Optional[Callable[[str], Tuple[str, ...]]] = None
+        # buffs in force for the cast being resolved, see active_buffs
+        self.cast_buffs: Tuple[str, ...] = ()
+        # (guild id, event key) of the cast being resolved, and the catches
+        # made since the last commit as (unix time, guild id, event key,
+        # fish name); the cog hands them to its catch log once committed
+        self.cast_origin: Optional[Tuple[Optional[int], str]] = None
+        self.landed: List[Tuple[int, Optional[int], str, str]] = []
+
+    @classmethod
+    async def load(cls, config, user, on_commit: Optional[Callable] = None) -> "UserState":
+        group = config.user(user)
+        state = cls(user, group, await group.all(), on_commit)
+        state._migrate()
+        return state
+
+    def _migrate(self):
+        # caught/items used to be flat lists with one entry per fish
+        for key in ("caught", "items"):
+            value = self.data.get(key)
+            if not isinstance(value, dict):
+                self.data[key] = counted(value)
+                self.dirty = True
+        # luck used to be its own counter; it is now the "luck" buff
+        luck = self.data.pop("luck", 0)
+        if luck:
+            self.add_buff("luck", casts=luck)
+
+    async def commit(self) -> bool:
+        """Write the document back if anything changed. Returns True if it wrote."""
+        if not self.dirty:
+            return False
+        await self._group.set(self.data)
+        self.dirty = False
+        if self.on_commit is not None:
+            self.on_commit(self)
+        return True
+
+    def touch(self):
+        """Mark the document as changed after mutating one of its containers directly."""
+        self.dirty = True
+
+    # ---------- scalar fields ----------
+    def _set(self, key: str, value):
+        if self.data.get(key) != value:
+            self.data[key] = value
+            self.dirty = True
+
+    @property
+    def bait(self) -> int:
+        return self.data.get("bait", 0)
+
+    @bait.setter
+    def bait(self, value: int):
+        self._set("bait", max(0, int(value)))
+
+    @property
+    def luck(self) -> int:
+        """Casts of luck left; a view of the "luck" buff."""
+        return self.buff_casts("luck")
+
+    @luck.setter
+    def luck(self, value: int):
+        value = max(0, int(value))
+        if value == self.luck:
+            return
+        if value:
+            self.buffs.setdefault("luck", {})["casts"] = value
+        else:
+            self.buffs.pop("luck", None)
+        self.dirty = True
+
+    @property
+    def rod_broken(self) -> bool:
+        return bool(self.data.get("rod_broken", False))
+
+    @rod_broken.setter
+    def rod_broken(self, value: bool):
+        self._set("rod_broken", bool(value))
+
+    @property
+    def rod_level(self) -> int:
+        return self.data.get("rod_level", 0)
+
+    @rod_level.setter
+    def rod_level(self, value: int):
+        self._set("rod_level", int(value))
+        self.changed.add("rod_level")
+        self.rod_profile = None
+
+    @property
+    def rod_profile(self) -> Optional[str]:
+        """Key of the cog's RodProfile for this rod; None after the rod or gear changed."""
+        return self.data.get("rod_profile")
+
+    @rod_profile.setter
+    def rod_profile(self, value: Optional[str]):
+        if self.data.get("rod_profile") != value:
+            self._set("rod_profile", value)
+
+    @property
+    def vessel(self):
+        return self.data.get("vessel")
+
+    @vessel.setter
+    def vessel(self, value):
+        self._set("vessel", value)
+
+    # ---------- containers ----------
+    @property
+    def caught(self) -> Dict[str, int]:
+        return self.data.setdefault("caught", {})
+
+    @property
+    def items(self) -> Dict[str, int]:
+        return self.data.setdefault("items", {})
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return self.data.setdefault("stats", {})
+
+    @property
+    def achievements(self) -> List[str]:
+        return self.data.setdefault("achievements", [])
+
+    @property
+    def quests(self) -> Dict[str, Any]:
+        return self.data.setdefault("quests", {})
+
+    @quests.setter
+    def quests(self, value: Dict[str, Any]):
+        self.data["quests"] = value
+        self.dirty = True
+
+    @property
+    def equipment(self) -> Dict[str, Any]:
+        return self.data.setdefault("equipment", {})
+
+    def equip(self, slot: str, name: Optional[str]) -> Optional[str]:
+        """Put ``name`` in an equipment slot; returns what was there."""
+        previous = self.equipment.get(slot)
+        self.equipment[slot] = name
+        self.dirty = True
+        self.rod_profile = None
+        return previous
+
+    @property
+    def species_seen(self) -> List[str]:
+        return self.data.setdefault("species_seen", [])
+
+    @property
+    def biomes_seen(self) -> List[str]:
+        return self.data.setdefault("biomes_seen", [])
+
+    @property
+    def favourites(self) -> List[str]:
+        return self.data.setdefault("favourites", [])
+
+    @property
+    def tallies(self) -> Dict[str, int]:
+        return self.data.setdefault("tallies", {})
+
+    # ---------- stats ----------
+    def inc_stat(self, key: str, amount: int = 1) -> int:
+        stats = self.stats
+        stats[key] = stats.get(key, 0) + amount
+        self.dirty = True
+        self.changed.add(key)
+        return stats[key]
+
+    def set_stat(self, key: str, value: int):
+        stats = self.stats
+        if stats.get(key) != value:
+            stats[key] = value
+            self.dirty = True
+            self.changed.add(key)
+
+    # ---------- achievements ----------
+    def has_achievement(self, ach_id: str) -> bool:
+        return ach_id in self.achievements
+
+    def grant(self, ach_id: str):
+        """Queue an event-driven achievement for the end-of-command evaluation."""
+        if ach_id not in self.granted and ach_id not in self.achievements:
+            self.granted.append(ach_id)
+
+    def add_achievement(self, ach_id: str) -> bool:
+        if ach_id in self.achievements:
+            return False
+        self.achievements.append(ach_id)
+        self.dirty = True
+        return True
+
+    # ---------- collection ----------
+    def see_species(self, name: str) -> bool:
+        """Record a species as caught at least once. Returns True the first time."""
+        if not name or name.lower().startswith("treasure"):
+            return False
+        if self._species is None:
+            self._species = set(self.species_seen)
+        if name in self._species:
+            return False
+        self._species.add(name)
+        self.species_seen.append(name)
+        self.new_species.append(name)
+        self.set_stat("unique_fish", len(self._species))
+        return True
+
+    def see_biome(self, biome: str) -> bool:
+        biomes = self.biomes_seen
+        if not biome or biome in biomes:
+            return False
+        biomes.append(biome)
+        self.set_stat("biomes_caught", len(biomes))
+        return True
+
+    # ---------- buffs ----------
+    # ``buffs`` is {buff id: {"casts": n, "until": epoch seconds}}; either
+    # limit may be missing and a buff ends at whichever runs out first.
+    # Nothing is written while a timed buff runs: it is dropped lazily the
+    # next time active_buffs looks at it.
+    @property
+    def buffs(self) -> Dict[str, Dict[str, Any]]:
+        return self.data.setdefault("buffs", {})
+
+    def add_buff(self, buff_id: str, casts: Optional[int] = None, seconds: Optional[float] = None):
+        """Start a buff, or stack onto a running one: casts add up, time extends."""
+        buff = self.buffs.setdefault(buff_id, {})
+        if casts:
+            buff["casts"] = buff.get("casts", 0) + int(casts)
+        if seconds:
+            now = time.time()
+            buff["until"] = max(buff.get("until", now), now) + seconds
+        if not buff:
+            del self.buffs[buff_id]
+            return
+        self.dirty = True
+
+    def buff_casts(self, buff_id: str) -> int:
+        buff = self.buffs.get(buff_id)
+        return buff.get("casts", 0) if buff else 0
+
+    def active_buffs(self) -> Tuple[str, ...]:
+        """Ids of the buffs in force now, sorted. Drops any that have run out."""
+        buffs = self.buffs
+        now = time.time()
+        expired = [b for b, v in buffs.items() if v.get("until", now + 1) <= now or v.get("casts", 1) <= 0]
+        for buff_id in expired:
+            del buffs[buff_id]
+        if expired:
+            self.dirty = True
+        return tuple(sorted(buffs))
+
+    def tick_buffs(self):
+        """One cast made: count it off every cast-limited buff."""
+        buffs = self.buffs
+        for buff_id in [b for b, v in buffs.items() if "casts" in v]:
+            left = buffs[buff_id]["casts"] - 1
+            if left > 0:
+                buffs[buff_id]["casts"] = left
+            else:
+                del buffs[buff_id]
+            self.dirty = True
+
+    # ---------- held-fish tallies ----------
+    # ``tallies`` counts the fish currently in ``caught`` per rarity and per
+    # biome ({"rarity:Epic": 3, "biome:Reef": 5}), kept in step by add_fish
+    # and remove_fish so quest and crafting checks don't walk the haul.
+    def use_tallies(self, classify: Callable[[str], Tuple[str, ...]], version: str):
+        """
+        Start keeping tallies with ``classify``. ``version`` identifies the
+        fish definitions they were counted against; stored tallies from
+        another version (or none at all) are recounted once from the haul.
+        """
+        self.classify = classify
+        if self.data.get("tally_version") == version:
+            return
+        tallies: Dict[str, int] = {}
+        for name, count in self.caught.items():
+            for key in classify(name):
+                tallies[key] = tallies.get(key, 0) + count
+        self.data["tallies"] = tallies
+        self.data["tally_version"] = version
+        self.dirty = True
+
+    def tally(self, key: str) -> int:
+        """Held fish under a tally key, e.g. ``tally("rarity:Epic")``."""
+        return self.tallies.get(key, 0)
+
+    def _retally(self, name: str, delta: int):
+        if self.classify is None or not delta:
+            return
+        tallies = self.tallies
+        for key in self.classify(name):
+            left = tallies.get(key, 0) + delta
+            if left > 0:
+                tallies[key] = left
+            else:
+                tallies.pop(key, None)
+
+    # ---------- inventory ----------
+    # ``caught`` and ``items`` are {name: count}; insertion order follows
+    # the most recent addition, so the last key is the latest catch.
+    def add_fish(self, *names: str, count: int = 1):
+        caught = self.caught
+        for name in names:
+            _add(caught, name, count)
+            self._retally(name, count)
+            self.see_species(name)
+        if names and count > 0:
+            self.dirty = True
+
+    def fish_count(self, name: str) -> int:
+        return self.caught.get(name, 0)
+
+    def total_fish(self) -> int:
+        return sum(self.caught.values())
+
+    def remove_fish(self, name: str, count: int = 1) -> int:
+        """Remove up to ``count`` copies of a fish. Returns how many were removed."""
+        removed = _take(self.caught, name, count)
+        if removed:
+            self._retally(name, -removed)
+            self.dirty = True
+        return removed
+
+    def random_fish(self) -> Optional[str]:
+        """A random fish from the haul, weighted by how many of each are held."""
+        return _pick(self.caught)
+
+    def pop_last_fish(self) -> Optional[str]:
+        if not self.caught:
+            return None
+        name = next(reversed(self.caught))
+        self.remove_fish(name)
+        return name
+
+    def pop_random_fish(self, count: int = 1) -> List[str]:
+        lost = []
+        for _ in range(count):
+            name = _pick(self.caught)
+            if name is None:
+                break
+            self.remove_fish(name)
+            lost.append(name)
+        return lost
+
+    def add_item(self, name: str, count: int = 1):
+        if count > 0:
+            _add(self.items, name, count)
+            self.dirty = True
+            self.changed.add("item:" + name)
+
+    def item_count(self, name: str) -> int:
+        return self.items.get(name, 0)
+
+    def remove_item(self, name: str, count: int = 1) -> int:
+        removed = _take(self.items, name, count)
+        if removed:
+            self.dirty = True
+        return removed
+
+    def pop_random_item(self) -> Optional[str]:
+        name = _pick(self.items)
+        if name is not None:
+            self.remove_item(name)
+        return name
+
+
+class StateManager:
+    """
+    Serialises access to each user's document.
+
+    ``session`` holds that user's lock while the block runs, loads the
+    document once and commits it once on a clean exit, so two commands
+    from the same user can no longer interleave their read-modify-write
+    and overwrite each other. An exception discards the changes.
+    """
+
+    def __init__(
+        self,
+        config,
+        on_load: Optional[Callable[[UserState], None]] = None,
+        on_commit: Optional[Callable[[UserState], None]] = None,
+    ):
+        self.config = config
+        self.on_load = on_load
+        self.on_commit = on_commit
+        # a lock lives only while some session holds or waits on it
+        self._locks: "weakref.WeakValueDictionary[int, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+    def lock(self, user) -> asyncio.Lock:
+        lock = self._locks.get(user.id)
+        if lock is None:
+            lock = self._locks[user.id] = asyncio.Lock()
+        return lock
+
+    async def load(self, user) -> UserState:
+        """Unlocked snapshot, for commands that only read."""
+        state = await UserState.load(self.config, user, on_commit=self.on_commit)
+        if self.on_load is not None:
+            self.on_load(state)
+        return state
+
+    @asynccontextmanager
+    async def session(self, user) -> AsyncIterator[UserState]:
+        async with self.lock(user):
+            state = await self.load(user)
+            yield state
+            await state.commit()
+
+    @asynccontextmanager
+    async def session_many(self, *users) -> AsyncIterator[Tuple[UserState, ...]]:
+        """
+        Sessions for several users at once, yielded in the order given.
+        Locks are taken in user-id order so two overlapping multi-user
+        sessions (A->B and B->A) can't deadlock; all documents are written
+        together on a clean exit.
+        """
+        ordered = sorted({u.id: u for u in users}.values(), key=lambda u: u.id)
+        async with AsyncExitStack() as stack:
+            for user in ordered:
+                await stack.enter_async_context(self.lock(user))
+            loaded = await asyncio.gather(*(self.load(u) for u in ordered))
+            states = {state.user.id: state for state in loaded}
+            yield tuple(states[u.id] for u in users)
+            await asyncio.gather(*(state.commit() for state in loaded))
+
+
+def transfer(
+    source: UserState,
+    target: UserState,
+    fish: Optional[Dict[str, int]] = None,
+    items: Optional[Dict[str, int]] = None,
+) -> Dict[str, int]:
+    """
+    Move counted fish and items from ``source`` to ``target``.
+
+    Everything is checked before anything moves: if ``source`` is short of
+    anything, nothing changes and the shortfall is returned as
+    {name: missing}. Returns an empty dict on success.
+    """
+    fish, items = fish or {}, items or {}
+    missing = {
+        name: count - have
+        for wanted, held in ((fish, source.fish_count), (items, source.item_count))
+        for name, count in wanted.items()
+        if (have := held(name)) < count
+    }
+    if missing:
+        return missing
+    for name, count in fish.items():
+        source.remove_fish(name, count)
+        target.add_fish(name, count=count)
+    for name, count in items.items():
+        source.remove_item(name, count)
+        target.add_item(name, count)
+    return {}
+
+
+def counted(value) -> Dict[str, int]:
+    """Normalise an inventory to {name: count}, accepting the old flat list format."""
+    if isinstance(value, dict):
+        return value
+    counts: Dict[str, int] = {}
+    for name in value or ():
+        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def _add(counts: Dict[str, int], name: str, amount: int):
+    # re-insert so the newest addition is always the last key
+    counts[name] = counts.pop(name, 0) + amount
+
+
+def _take(counts: Dict[str, int], name: str, amount: int) -> int:
+    have = counts.get(name, 0)
+    taken = min(have, max(0, amount))
+    if taken == have and taken:
+        del counts[name]
+    elif taken:
+        counts[name] = have - taken
+    return taken
+
+
+def _pick(counts: Dict[str, int]) -> Optional[str]:
+    if not counts:
+        return None
+    return random.choices(list(counts), weights=list(counts.values()), k=1)[0]
@@ -1,18 +1,21 @@
 import aiohttp
-import asyncio
 import discord
 import random
 from urllib.parse import quote_plus
 from redbot.core import commands
 
+from .menus import MenuService
+
 class UrbanDictionary(commands.Cog):
     """Look up slang definitions, examples, and user ratings from Urban Dictionary."""
 
     def __init__(self, bot):
         self.bot = bot
         self.session = aiohttp.ClientSession()
+        self.menus = MenuService(bot)
 
     async def cog_unload(self):
+        self.menus.close()
         await self.session.close()
 
     @commands.command()
@@ -70,42 +73,4 @@ class UrbanDictionary(commands.Cog):
             embed.set_footer(text=f"👍 {ups}   👎 {downs}   •   Author: {author}")
             pages.append(embed)
 
-        msg = await ctx.send(embed=pages[0])
-        if len(pages) == 1:
-            return
-
-        await msg.add_reaction("◀️")
-        await msg.add_reaction("▶️")
-
-        index = 0
-
-        def check(reaction, user):
-            return (
-                user == ctx.author
-                and reaction.message.id == msg.id
-                and str(reaction.emoji) in ("◀️", "▶️")
-            )
-
-        while True:
-            try:
-                reaction, user = await self.bot.wait_for(
-                    "reaction_add", timeout=120.0, check=check
-                )
-            except (asyncio.TimeoutError, asyncio.CancelledError):
-                # Optionally clear reactions when pagination ends
-                try:
-                    await msg.clear_reactions()
-                except discord.HTTPException:
-                    pass
-                break
-            else:
-                try:
-                    await msg.remove_reaction(reaction, user)
-                except discord.HTTPException:
-                    pass
-
-                if str(reaction.emoji) == "◀️":
-                    index = (index - 1) % len(pages)
-                else:
-                    index = (index + 1) % len(pages)
-                await msg.edit(embed=pages[index])
+        await self.menus.send(ctx, pages, timeout=120.0)
@@ -1,4 +1,3 @@
-import asyncio
 import random
 import io
 import aiosqlite
@@ -17,6 +16,8 @@ from redbot.core import commands, checks
 from discord.ext import tasks
 from redbot.core.bot import Red
 
+from .menus import MenuService
+
 # Basic stopwords
 STOPWORDS = {
     "the", "and", "for", "that", "with", "you", "this", "have", "are",
@@ -49,6 +50,9 @@ class WordCloudCog(commands.Cog):
         self._emoji_cache: OrderedDict[str, Image.Image] = OrderedDict()
         self._cache_max = 200
 
+        # button paginator for `stats`
+        self.menus = MenuService(bot)
+
         # Where to store our SQLite DB
         data_folder = Path(cog_data_path(self))
         data_folder.mkdir(parents=True, exist_ok=True)
@@ -62,7 +66,8 @@ class WordCloudCog(commands.Cog):
         self.autogen_loop.start()
 
     async def cog_unload(self):
-        # Stop the loop and close session
+        # Stop the loop, open menus and close session
+        self.menus.close()
         if self.autogen_loop.is_running():
             self.autogen_loop.cancel()
         await self._session.close()
@@ -564,27 +569,8 @@ class WordCloudCog(commands.Cog):
             title="📊 Top Words",
             description="\n".join(f"{t}: {c}" for t, c in words[:limit]) or "None",
         )
-        pages = [e_emb, w_emb]
-        msg = await ctx.send(embed=pages[0])
-        await msg.add_reaction("◀️")
-        await msg.add_reaction("▶️")
-
-        def check(r, u):
-            return u == ctx.author and r.message.id == msg.id and str(r.emoji) in ("◀️","▶️")
-
-        idx = 0
-        try:
-            while True:
-                r, u = await self.bot.wait_for("reaction_add", timeout=60, check=check)
-                idx = (idx + (1 if r.emoji == "▶️" else -1)) % len(pages)
-                await msg.edit(embed=pages[idx])
-                await msg.remove_reaction(r.emoji, u)
-        except asyncio.TimeoutError:
-            try:
-                await msg.clear_reactions()
-            except:
-                pass
-                
+        await self.menus.send(ctx, [e_emb, w_emb], timeout=60.0)
+
     @wordcloud.command()
     @checks.admin()
     async def reset(self, ctx: commands.Context):